@@ -0,0 +1,70 @@
+import os
+import re
+import shutil
+import sys
+import zipfile
+
+import openpyxl
+
+# The modules are flat scripts at the repository root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+_INLINE = re.compile(rb'<c r="([A-Z]+[0-9]+)"([^>]*) t="inlineStr"([^>]*)><is><t[^>]*>(.*?)</t></is></c>')
+_MAIN = b"http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+
+
+def _share_strings(path):
+    """Move the inline strings openpyxl writes into xl/sharedStrings.xml, as Excel saves them."""
+    table: dict[bytes, int] = {}
+
+    def shared(m):
+        index = table.setdefault(m.group(4), len(table))
+        return b'<c r="%s"%s t="s"%s><v>%d</v></c>' % (m.group(1), m.group(2), m.group(3), index)
+
+    tmp = str(path) + ".tmp"
+    with zipfile.ZipFile(path) as zin:
+        members = [(item, zin.read(item.filename)) for item in zin.infolist()]
+    members = [(i, _INLINE.sub(shared, d) if i.filename.startswith("xl/worksheets/") else d) for i, d in members]
+    sst = b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<sst xmlns="%s" count="%d" uniqueCount="%d">%s</sst>' % (
+        _MAIN, len(table), len(table), b"".join(b"<si><t>%s</t></si>" % t for t in table))
+    with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as zout:
+        for item, data in members:
+            if item.filename == "[Content_Types].xml":
+                data = data.replace(b"</Types>", b'<Override PartName="/xl/sharedStrings.xml" ContentType="application/'
+                                    b'vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/></Types>')
+            elif item.filename == "xl/_rels/workbook.xml.rels":
+                data = data.replace(b"</Relationships>", b'<Relationship Id="rIdSst" Type="http://schemas.openxmlformats.org/'
+                                    b'officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/></Relationships>')
+            zout.writestr(item, data)
+        zout.writestr("xl/sharedStrings.xml", sst)
+    shutil.move(tmp, path)
+
+
+def write_xlsx(path, rows, title="Sheet1", extra_sheets=()):
+    """Save `rows` (header first) as an .xlsx with shared strings; extra_sheets are (title, rows) pairs."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = title
+    for row in rows:
+        ws.append(row)
+    for name, more in extra_sheets:
+        other = wb.create_sheet(name)
+        for row in more:
+            other.append(row)
+    wb.save(path)
+    _share_strings(path)
+    return str(path)
+
+
+def rewrite_member(path, member, edit):
+    """Replace zip member `member` of `path` by edit(old_bytes), keeping the other members byte for byte."""
+    tmp = str(path) + ".tmp"
+    with zipfile.ZipFile(path) as zin, zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as zout:
+        for item in zin.infolist():
+            data = zin.read(item.filename)
+            if item.filename == member:
+                data = edit(data)
+            zout.writestr(item, data)
+    shutil.move(tmp, path)
+
@@ -0,0 +1,128 @@
+import os
+
+import pandas as pd
+import pytest
+from conftest import rewrite_member, write_xlsx
+
+import xlsx_data
+from xlsx_cache import DiskCache
+from xlsx_meta import read_sheet_info
+
+
+PEOPLE = [["Name", "Site", "Score"]] + [[f"name {i}", f"https://example.com/{i}", i] for i in range(20)]
+OTHER = [["A"], [1], [2]]
+
+
+@pytest.fixture
+def people(tmp_path):
+    return write_xlsx(tmp_path / "people.xlsx", PEOPLE, extra_sheets=[("Other", OTHER)])
+
+
+def _load(path, cache, sheet=0):
+    with xlsx_data.WorkbookHandle(path, disk_cache=cache) as book:
+        return xlsx_data.load_sheet(book, sheet)
+
+
+def _bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_round_trip(tmp_path, people):
+    cache = DiskCache(str(tmp_path / "cache"), 1 << 30)
+    parsed = _load(people, cache)
+    info = read_sheet_info(people)[0]
+    cached = cache.get(people, info, cache.stamp(people, info))
+    assert cached is not None
+    pd.testing.assert_frame_equal(cached, parsed)
+    pd.testing.assert_frame_equal(cached, pd.read_excel(people, sheet_name=0))
+
+
+def test_stored_tail_matches_the_sheet(tmp_path, people):
+    cache = DiskCache(str(tmp_path / "cache"), 1 << 30)
+    _load(people, cache)
+    info = read_sheet_info(people)[0]
+    tail = cache.tail(people, info, cache.stamp(people, info))
+    assert tail is not None and tail.crc == cache.stamp(people, info).crc
+
+
+def test_changed_sheet_part_is_a_miss(tmp_path, people):
+    cache = DiskCache(str(tmp_path / "cache"), 1 << 30)
+    _load(people, cache)
+    info = read_sheet_info(people)[0]
+    rewrite_member(people, info.part, lambda x: x.replace(b'<c r="C9" t="n"><v>7</v>', b'<c r="C9" t="n"><v>70</v>'))
+    assert cache.get(people, info, cache.stamp(people, info)) is None
+    assert _load(people, cache)["Score"].tolist()[7] == 70
+
+
+def test_unchanged_sheet_of_a_saved_file_is_reused(tmp_path, people):
+    cache = DiskCache(str(tmp_path / "cache"), 1 << 30)
+    _load(people, cache)
+    other = read_sheet_info(people)[1]
+    rewrite_member(people, other.part, lambda x: x.replace(b'<c r="A3" t="n"><v>2</v>', b'<c r="A3" t="n"><v>3</v>'))
+    _bump_mtime(people)
+    info = read_sheet_info(people)[0]
+    assert cache.get(people, info, cache.stamp(people, info)) is not None
+
+
+def test_text_added_to_another_sheet_keeps_the_entry(tmp_path, people):
+    # New text anywhere appends shared strings, which changes their CRC.
+    cache = DiskCache(str(tmp_path / "cache"), 1 << 30)
+    _load(people, cache)
+    info = read_sheet_info(people)[0]
+    before = cache.stamp(people, info)
+    write_xlsx(people, PEOPLE, extra_sheets=[("Other", OTHER + [["some new text"]])])
+    _bump_mtime(people)
+    stamp = cache.stamp(people, info)
+    assert stamp.crc == before.crc and stamp.strings_crc != before.strings_crc
+    cached = cache.get(people, info, stamp)
+    assert cached is not None
+    pd.testing.assert_frame_equal(cached, pd.read_excel(people, sheet_name=0))
+    assert cache.tail(people, info, stamp) is not None
+
+
+def test_changed_shared_string_is_a_miss(tmp_path, people):
+    # The sheet part stays byte for byte the same; only the text its
+    # string indexes point at changes.
+    cache = DiskCache(str(tmp_path / "cache"), 1 << 30)
+    _load(people, cache)
+    rewrite_member(people, "xl/sharedStrings.xml", lambda x: x.replace(b"name 3<", b"someone else<"))
+    _bump_mtime(people)
+    assert _load(people, cache)["Name"].tolist()[3] == "someone else"
+
+
+def test_changed_styles_are_a_miss(tmp_path, people):
+    cache = DiskCache(str(tmp_path / "cache"), 1 << 30)
+    _load(people, cache)
+    info = read_sheet_info(people)[0]
+    rewrite_member(people, "xl/styles.xml", lambda x: x + b" ")
+    _bump_mtime(people)
+    assert cache.get(people, info, cache.stamp(people, info)) is None
+
+
+def test_eviction_keeps_the_newest_entry(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache"), 1 << 30)
+    paths = []
+    for i in range(3):
+        rows = [["Text"]] + [[f"row {i} {j} " * 20] for j in range(200)]
+        paths.append(write_xlsx(tmp_path / f"book{i}.xlsx", rows))
+    _load(paths[0], cache)
+    entry_bytes = sum(
+        os.path.getsize(os.path.join(d, f)) for d, _s, files in os.walk(tmp_path / "cache") for f in files
+    )
+    cache.cap_bytes = int(entry_bytes * 2.5)
+    for path in paths[1:]:
+        _load(path, cache)
+
+    def hit(path):
+        info = read_sheet_info(path)[0]
+        return cache.get(path, info, cache.stamp(path, info)) is not None
+
+    assert [hit(p) for p in paths] == [False, True, True]
+
+
+def test_disabled_for_oversized_sheets(tmp_path, people):
+    cache = DiskCache(str(tmp_path / "cache"), 10)
+    _load(people, cache)
+    info = read_sheet_info(people)[0]
+    assert cache.get(people, info, cache.stamp(people, info)) is None
@@ -0,0 +1,394 @@
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import rewrite_member, write_xlsx
+
+import xlsx_data
+
+SHEETS = {
+    "blank rows": [["A"], [1], [], [2], [], [], [3]],
+    "blank first data row": [["A", "B"], [], ["x", 1], [None, None], ["y", 2.5]],
+    "mixed": [
+        ["Name", "When", "Score", None],
+        ["a", datetime.datetime(2024, 1, 2), 1, None],
+        [None, None, None, "stray"],
+        ["b", datetime.datetime(2024, 3, 4, 5, 6), 2.5],
+        [],
+    ],
+    "header only": [["A", "B"]],
+}
+
+
+@pytest.mark.parametrize("rows", SHEETS.values(), ids=SHEETS.keys())
+def test_stream_sheet_matches_read_excel(tmp_path, rows):
+    path = write_xlsx(tmp_path / "book.xlsx", rows)
+    pd.testing.assert_frame_equal(xlsx_data.load_sheet(path, 0), pd.read_excel(path, sheet_name=0))
+
+
+def test_streamed_chunks_line_up_with_sheet_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(xlsx_data, "FIRST_CHUNK_ROWS", 2)
+    monkeypatch.setattr(xlsx_data, "STREAM_CHUNK_ROWS", 3)
+    rows = [["A"]] + [[f"t{i}"] if i % 3 else [] for i in range(1, 20)]
+    path = write_xlsx(tmp_path / "book.xlsx", rows)
+    chunks = []
+    df = xlsx_data.stream_sheet(path, 0, on_rows=chunks.append)
+    expected = pd.read_excel(path, sheet_name=0)
+    pd.testing.assert_frame_equal(df, expected)
+    streamed = pd.concat(chunks, ignore_index=True)
+    assert len(chunks) > 1
+    assert streamed["A"].tolist() == expected["A"].tolist()
+
+
+URL_CELLS = pd.DataFrame({
+    "Site": ["https://a.com/x", "  www.b.com ", "HTTP://C.com", "see https://d.com/p?q=1 here", None, "ftp://e.com"],
+    "Score": [1, 2, 3, 4, 5, 6],
+    "Notes": ["www.", "x www.f.com/y", None, "https://g.com", "", "plain"],
+})
+
+
+def _prefix_rule(x):
+    # The GUI's per-cell rule before the index existed.
+    if pd.isna(x):
+        return None
+    s = str(x).strip()
+    if s.startswith("www."):
+        return "https://" + s
+    return s if s.lower().startswith(("http://", "https://")) else None
+
+
+def _search_rule(x):
+    # The curses viewer's per-cell rule before the index existed.
+    if pd.isna(x):
+        return None
+    m = xlsx_data.URL_RE.search(str(x).strip())
+    if m is None:
+        return None
+    url = m.group(0)
+    return "https://" + url if url.lower().startswith("www.") else url
+
+
+@pytest.mark.parametrize("mode, rule", [("prefix", _prefix_rule), ("search", _search_rule)])
+def test_url_index_matches_the_per_cell_rules(mode, rule):
+    index = xlsx_data.UrlIndex.build(URL_CELLS, mode)
+    for i in range(len(URL_CELLS)):
+        for j in range(URL_CELLS.shape[1]):
+            assert index.url(i, j) == rule(URL_CELLS.iat[i, j]), (mode, i, j)
+    assert 1 not in index.masks  # numeric columns are skipped
+
+
+def test_url_index_collect_goes_row_by_row():
+    index = xlsx_data.UrlIndex.build(URL_CELLS, "search")
+    assert index.row_urls(3) == [(0, "https://d.com/p?q=1"), (2, "https://g.com")]
+    assert index.collect([3, 1]) == ["https://www.b.com", "https://www.f.com/y", "https://d.com/p?q=1", "https://g.com"]
+    assert index.collect([1, 3], cols=[2]) == ["https://www.f.com/y", "https://g.com"]
+    assert xlsx_data.UrlIndex.build(URL_CELLS[["Score"]]).collect([0, 1]) == []
+
+
+def test_search_index():
+    df = pd.DataFrame({
+        "Name": ["Alice Smith", "Bob Jones", None, "alice jones"],
+        "Score": [1, 22, 3, None],
+    })
+    index = xlsx_data.SearchIndex.build(xlsx_data.RowStore.build(df))
+    assert index.rows("alice").tolist() == [0, 3]
+    assert index.rows("ALI jon").tolist() == [3]
+    assert index.rows("jones").tolist() == [1, 3]
+    assert index.rows("2").tolist() == [1]
+    assert index.rows("carol").tolist() == []
+    assert index.rows("   ").tolist() == []
+
+
+def test_search_index_of_an_empty_sheet():
+    index = xlsx_data.SearchIndex.build(xlsx_data.RowStore.build(pd.DataFrame({"A": [None, None]})))
+    assert index.rows("a").tolist() == []
+
+
+def test_search_index_matches_a_scan():
+    words = ["a", "ab", "abc", "abd", "b", "ba", "bab", "c", "x9", "é", "éa", "_a"]
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        c: [" ".join(rng.choice(words, size=rng.integers(0, 4))) for _ in range(300)] for c in "ABC"
+    })
+    index = xlsx_data.SearchIndex.build(xlsx_data.RowStore.build(df))
+    cells = [[w for cell in row for w in cell.split()] for row in df.itertuples(index=False)]
+    for query in ["a", "ab", "abc", "b a", "é", "éa", "_", "x", "x9 ba", "ab ab", "zz", "a zz"]:
+        expected = [i for i, row in enumerate(cells) if all(any(w.startswith(t) for w in row) for t in query.split())]
+        assert index.rows(query).tolist() == expected, query
+
+
+def test_filter_rows():
+    df = pd.DataFrame({"Title": ["CTO", " cto office", "CEO", None], "Email": ["a@x", None, "", "d@x"]})
+    sheet = xlsx_data.LoadedSheet.prepare(df)
+    ColumnFilter = xlsx_data.ColumnFilter
+    assert sheet.filter_rows([ColumnFilter("Title", "contains", "cto")]).tolist() == [0, 1]
+    assert sheet.filter_rows([ColumnFilter("Title", "equals", "Cto Office")]).tolist() == [1]
+    assert sheet.filter_rows([ColumnFilter("Title", "starts with", "c")]).tolist() == [0, 1, 2]
+    assert sheet.filter_rows([ColumnFilter("Title", "empty")]).tolist() == [3]
+    both = [ColumnFilter("Title", "contains", "c"), ColumnFilter("Email", "not empty")]
+    assert sheet.filter_rows(both).tolist() == [0]
+    with pytest.raises(ValueError, match="No column named"):
+        sheet.filter_rows([ColumnFilter("Phone", "empty")])
+
+
+def test_step_row_over_all_rows():
+    assert xlsx_data.step_row(None, 5, 0, 1) == 1
+    assert xlsx_data.step_row(None, 5, 4, 1) is None
+    assert xlsx_data.step_row(None, 5, 0, -1) is None
+    assert xlsx_data.step_row(None, 5, 4, -4) == 0
+
+
+def test_step_row_over_a_view():
+    view = np.array([2, 5, 9])
+    assert xlsx_data.step_row(view, 10, 2, 1) == 5
+    assert xlsx_data.step_row(view, 10, 2, 2) == 9
+    assert xlsx_data.step_row(view, 10, 5, -1) == 2
+    assert xlsx_data.step_row(view, 10, 9, 1) is None
+    assert xlsx_data.step_row(view, 10, 2, -1) is None
+    # From a row outside the view, to its neighbours in the view.
+    assert xlsx_data.step_row(view, 10, 6, 1) == 9
+    assert xlsx_data.step_row(view, 10, 6, -1) == 5
+    assert xlsx_data.view_position(view, 5) == 1
+    assert xlsx_data.view_position(view, 6) is None
+
+
+COLUMNS = {
+    "float": pd.Series([1.0, 2.5, np.nan, -0.0, 1e20, 2.0**53, np.inf, -3.0, 1e-7]),
+    "int": pd.Series([1, -2, 30000000000]),
+    "nullable int": pd.Series([1, None, 3], dtype="Int64"),
+    "bool": pd.Series([True, False]),
+    "datetime": pd.Series([pd.Timestamp(2024, 1, 2), pd.NaT, pd.Timestamp(2024, 1, 2, 3, 4, 5)]),
+    "text": pd.Series(["a", None, " b ", ""]),
+    "string": pd.Series(["a", None, "c"], dtype="string"),
+    "mixed": pd.Series(["a", 1, 2.0, 2.5, None, pd.Timestamp(2024, 1, 1), True], dtype=object),
+}
+
+
+@pytest.mark.parametrize("col", COLUMNS.values(), ids=COLUMNS.keys())
+def test_display_strings_match_format_value(col):
+    values, missing = xlsx_data.display_strings(col)
+    assert list(values) == [xlsx_data.format_value(x) for x in col.tolist()]
+    assert missing.tolist() == col.isna().tolist()
+
+
+def test_row_store_rows_match_the_frame():
+    df = pd.DataFrame({name: col.iloc[:3].reset_index(drop=True) for name, col in COLUMNS.items()})
+    store = xlsx_data.RowStore.build(df)
+    for i in range(len(df)):
+        assert store.row(i) == xlsx_data.frame_row(df, i)
+
+
+def _prefetched(prefetcher):
+    built = []
+    while prefetcher.prefetch_one():
+        built.append(next(reversed(prefetcher._models)))
+    return built
+
+
+def test_prefetch_follows_the_direction_of_travel():
+    calls = []
+    prefetcher = xlsx_data.RowPrefetcher(lambda row: calls.append(row) or f"model {row}", 100)
+    assert prefetcher.get(50) == "model 50"
+    # The next row ahead first, then the one behind, then the rest ahead.
+    assert _prefetched(prefetcher) == [51, 49, 52]
+
+    for depth, row in [(4, 51), (8, 52), (16, 53), (16, 54)]:
+        prefetcher.get(row)
+        assert prefetcher.depth == depth
+    assert set(range(55, 55 + 15)) <= set(_prefetched(prefetcher)) | set(prefetcher._models)
+
+    calls.clear()
+    prefetcher.get(53)  # prefetched on the way down: no build on the UI's path
+    assert calls == []
+    assert (prefetcher.direction, prefetcher.depth) == (-1, xlsx_data.PREFETCH_MIN_DEPTH)
+    assert _prefetched(prefetcher) == []  # 52, 54 and 51 were built already
+
+
+def test_prefetch_stays_on_the_view_and_in_bounds():
+    view = np.array([3, 10, 11, 40, 41])
+    prefetcher = xlsx_data.RowPrefetcher(str, 50, view)
+    prefetcher.get(10)
+    assert _prefetched(prefetcher) == [11, 3, 40]
+    prefetcher.get(41)
+    assert prefetcher._pending == []
+    assert len(prefetcher._models) <= 2 * xlsx_data.PREFETCH_MAX_DEPTH + 2
+
+
+def _wait_done(job):
+    while True:
+        msg = job.messages.get(timeout=10)
+        assert msg[0] != "error", msg[1]
+        if msg[0] == "done":
+            return msg[1]
+
+
+def _wait_closed(book):
+    deadline = time.monotonic() + 5
+    while book._book is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return book._book is None
+
+
+def test_workbook_is_closed_between_loads(tmp_path, monkeypatch):
+    path = write_xlsx(tmp_path / "book.xlsx", [["A"], [1]], extra_sheets=[("Other", [["B"], [2]])])
+    opened = []
+    load_workbook = xlsx_data.openpyxl.load_workbook
+    monkeypatch.setattr(xlsx_data.openpyxl, "load_workbook", lambda *a, **k: opened.append(1) or load_workbook(*a, **k))
+    with xlsx_data.WorkbookHandle(path) as book, ThreadPoolExecutor(1) as pool:
+        # Queued together: one workbook for both.
+        jobs = [xlsx_data.SheetLoadJob(book, sheet) for sheet in (0, "Other")]
+        for job in jobs:
+            job.start(pool)
+        assert [_wait_done(job).df.iat[0, 0] for job in jobs] == [1, 2]
+        assert _wait_closed(book) and len(opened) == 1
+
+        job = xlsx_data.SheetLoadJob(book, 0)
+        job.start(pool)
+        assert _wait_done(job).df.iat[0, 0] == 1
+        assert _wait_closed(book) and len(opened) == 2
+
+
+def _reload(path, previous=None):
+    # Leaving the pool waits for the whole job, including the tail it
+    # takes after posting "done".
+    with xlsx_data.WorkbookHandle(path) as book, ThreadPoolExecutor(1) as pool:
+        job = xlsx_data.SheetLoadJob(book, 0, previous=previous)
+        job.start(pool)
+        sheet = _wait_done(job)
+    return sheet
+
+
+def _no_full_parse(monkeypatch):
+    def full_parse(*args, **kwargs):
+        raise AssertionError("the whole sheet was parsed again")
+
+    monkeypatch.setattr(xlsx_data, "stream_sheet", full_parse)
+
+
+RELOAD_ROWS = [["When", "Name", "Score"]] + [[pd.Timestamp(2024, 1, d), f"name {d}", d + 0.5] for d in range(1, 6)]
+
+
+def test_reload_of_an_unchanged_sheet_keeps_it(tmp_path, monkeypatch):
+    path = write_xlsx(tmp_path / "book.xlsx", RELOAD_ROWS, extra_sheets=[("Other", [["A"], [1]])])
+    first = _reload(path)
+    write_xlsx(path, RELOAD_ROWS, extra_sheets=[("Other", [["A"], [2], ["new text"]])])
+    _no_full_parse(monkeypatch)
+    assert _reload(path, first) is first
+
+
+@pytest.mark.parametrize("added", [
+    [[pd.Timestamp(2024, 2, 1), "new", 6.5]],
+    [[], [pd.Timestamp(2024, 2, 3), "name 1", None], []],
+    [[None, None, 7]],
+], ids=["one row", "blank rows and a known string", "int into float"])
+def test_reload_parses_only_appended_rows(tmp_path, monkeypatch, added):
+    path = write_xlsx(tmp_path / "book.xlsx", RELOAD_ROWS)
+    first = _reload(path)
+    write_xlsx(path, RELOAD_ROWS + added)
+    _no_full_parse(monkeypatch)
+    second = _reload(path, first)
+    expected = pd.read_excel(path)
+    assert second.source_rows == len(expected)
+    pd.testing.assert_frame_equal(second.df, expected)
+
+
+@pytest.mark.parametrize("rows, added", [
+    (RELOAD_ROWS, [["not a date", "x", 6.5]]),
+    ([["A", "B"], ["x", 1]], [["y", 2.5]]),
+    ([["A", "B"], ["x", 1]], [[], ["y", 2]]),
+], ids=["text into dates", "float into int", "blank row into int"])
+def test_reload_of_a_new_dtype_parses_the_sheet(tmp_path, rows, added):
+    # A full parse gives the whole column another dtype.
+    path = write_xlsx(tmp_path / "book.xlsx", rows)
+    first = _reload(path)
+    write_xlsx(path, rows + added)
+    pd.testing.assert_frame_equal(_reload(path, first).df, pd.read_excel(path))
+
+
+def test_reload_sees_changed_shared_strings(tmp_path):
+    path = write_xlsx(tmp_path / "book.xlsx", [["Name"], ["name 1"], ["name 2"]])
+    first = _reload(path)
+    rewrite_member(path, "xl/sharedStrings.xml", lambda x: x.replace(b"name 2<", b"someone else<"))
+    second = _reload(path, first)
+    assert second is not first
+    assert second.df["Name"].tolist() == ["name 1", "someone else"]
+
+
+def test_reload_of_an_edited_row_parses_the_sheet(tmp_path):
+    path = write_xlsx(tmp_path / "book.xlsx", RELOAD_ROWS)
+    first = _reload(path)
+    rows = [list(r) for r in RELOAD_ROWS]
+    rows[2][2] = 20.5
+    write_xlsx(path, rows + [[pd.Timestamp(2024, 2, 1), "new", 6.5]])
+    pd.testing.assert_frame_equal(_reload(path, first).df, pd.read_excel(path))
+
+
+def test_parse_row_spec():
+    assert xlsx_data.parse_row_spec("2-4, 7, 9-", 10).tolist() == [1, 2, 3, 6, 8, 9]
+    assert xlsx_data.parse_row_spec("-2", 10).tolist() == [0, 1]
+    assert xlsx_data.parse_row_spec("  ", 3).tolist() == [0, 1, 2]
+    assert xlsx_data.parse_row_spec("3, 3, 2-3,", 10).tolist() == [1, 2]
+    assert xlsx_data.parse_row_spec("8-20", 10).tolist() == [7, 8, 9]
+
+
+@pytest.mark.parametrize("spec", ["x", "0", "5-3", "1-2-3"])
+def test_parse_row_spec_rejects(spec):
+    with pytest.raises(ValueError, match="Not a row or row range"):
+        xlsx_data.parse_row_spec(spec, 10)
+
+
+def test_url_key():
+    assert xlsx_data.url_key(" HTTPS://Example.COM/Path/#top ") == "https://example.com/Path"
+    assert xlsx_data.url_key("example.com/a/") == "https://example.com/a"
+    assert xlsx_data.url_key("http://a.com") != xlsx_data.url_key("https://a.com")
+    assert xlsx_data.url_key("https://a.com/?q=1") != xlsx_data.url_key("https://a.com/?q=2")
+
+
+def test_unique_urls_keeps_the_first_spelling():
+    urls = ["https://a.com/x", "https://A.com/x/", "https://b.com", "https://a.com/x#y", "https://a.com/X"]
+    assert xlsx_data.unique_urls(urls) == ["https://a.com/x", "https://b.com", "https://a.com/X"]
+
+
+def test_url_launcher_opens_batches_in_order():
+    opened = []
+    launcher = xlsx_data.UrlLauncher(interval=0, open_url=lambda url: opened.append(url) or url != "https://bad")
+    first = launcher.open(["https://a.com", "https://A.com/", "https://bad"])
+    second = launcher.open(["https://c.com"])
+    deadline = time.monotonic() + 5
+    while not second.finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert opened == ["https://a.com", "https://bad", "https://c.com"]
+    assert (first.opened, first.failed, first.finished) == (2, 1, True)
+
+
+def test_url_launcher_cancel_stops_a_batch():
+    opened = []
+    launcher = xlsx_data.UrlLauncher(interval=0.2, open_url=opened.append)
+    batch = launcher.open([f"https://{i}.com" for i in range(20)])
+    time.sleep(0.3)
+    batch.cancel()
+    deadline = time.monotonic() + 5
+    while not batch.finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert batch.finished and batch.cancelled
+    assert 1 <= batch.opened == len(opened) < 5
+    # The next batch still runs.
+    after = launcher.open(["https://next.com"])
+    while not after.finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert opened[-1] == "https://next.com"
+
+
+def test_url_launcher_open_one_does_not_wait_for_a_batch():
+    opened = []
+    launcher = xlsx_data.UrlLauncher(interval=30, open_url=opened.append)
+    batch = launcher.open(["https://a.com", "https://b.com"])
+    launcher.open_one("https://clicked.com")
+    deadline = time.monotonic() + 5
+    while "https://clicked.com" not in opened and time.monotonic() < deadline:
+        time.sleep(0.01)
+    batch.cancel()
+    assert "https://clicked.com" in opened and "https://b.com" not in opened
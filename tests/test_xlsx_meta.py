@@ -0,0 +1,59 @@
+import pytest
+from conftest import rewrite_member, write_xlsx
+
+from xlsx_meta import appended_rows, cells_intact, read_sheet_info, sheet_tail
+
+HEADER = ["Name", "Score"]
+ROWS = [[f"name {i}", i] for i in range(10)]
+
+
+@pytest.fixture
+def book(tmp_path):
+    path = write_xlsx(tmp_path / "book.xlsx", [HEADER] + ROWS)
+    return path, read_sheet_info(path)[0].part
+
+
+def test_sheet_tail(book):
+    path, part = book
+    tail = sheet_tail(path, part)
+    assert tail is not None
+    assert tail.rows_len > 0 and tail.strings_len > 0 and tail.styles_crc is not None
+    assert appended_rows(path, part, tail) == b""
+    assert cells_intact(path, tail)
+
+
+def test_sheet_tail_of_a_missing_part(book):
+    path, _part = book
+    assert sheet_tail(path, "xl/worksheets/sheet9.xml") is None
+
+
+def test_appended_rows(tmp_path, book):
+    path, part = book
+    tail = sheet_tail(path, part)
+    write_xlsx(path, [HEADER] + ROWS + [["new name", 10], ["name 1", 11]])
+    rows = appended_rows(path, part, tail)
+    assert rows is not None
+    assert rows.count(b"<row ") == 2 and rows.startswith(b'<row r="12"')
+
+
+def test_edited_row_is_not_an_append(book):
+    path, part = book
+    tail = sheet_tail(path, part)
+    rewrite_member(path, part, lambda x: x.replace(b'<c r="B5" t="n"><v>3</v>', b'<c r="B5" t="n"><v>33</v>'))
+    assert appended_rows(path, part, tail) is None
+
+
+def test_renumbered_strings_are_not_an_append(book):
+    path, part = book
+    tail = sheet_tail(path, part)
+    rewrite_member(path, "xl/sharedStrings.xml", lambda x: x.replace(b"name 3<", b"someone else<"))
+    assert not cells_intact(path, tail)
+    assert appended_rows(path, part, tail) is None
+
+
+def test_changed_styles_are_not_an_append(book):
+    path, part = book
+    tail = sheet_tail(path, part)
+    rewrite_member(path, "xl/styles.xml", lambda x: x + b" ")
+    assert not cells_intact(path, tail)
+    assert appended_rows(path, part, tail) is None
@@ -0,0 +1,26 @@
+import pytest
+
+from xlsx_data import ColumnFilter
+from xlsx_row_viewer import parse_filters
+
+COLUMNS = ["Job Title", "Email", "Name"]
+
+
+def test_parse_filters():
+    assert parse_filters("Job Title ~ cto & Email ?", COLUMNS) == [
+        ColumnFilter("Job Title", "contains", "cto"),
+        ColumnFilter("Email", "not empty", ""),
+    ]
+    assert parse_filters("name=Bob Smith &  & email!", COLUMNS) == [
+        ColumnFilter("Name", "equals", "Bob Smith"),
+        ColumnFilter("Email", "empty", ""),
+    ]
+    assert parse_filters("Email ^ info@", COLUMNS) == [ColumnFilter("Email", "starts with", "info@")]
+    assert parse_filters("  ", COLUMNS) == []
+
+
+def test_parse_filters_rejects():
+    with pytest.raises(ValueError, match="Cannot parse filter"):
+        parse_filters("Email", COLUMNS)
+    with pytest.raises(ValueError, match="No column named 'Phone'"):
+        parse_filters("Phone ~ 555", COLUMNS)
@@ -0,0 +1,270 @@
+"""
+Per-user disk cache of parsed sheets, shared by the GUI and the curses viewer.
+
+Each sheet is stored as a directory of column files:
+- numeric, bool and datetime columns as .npy, memory-mapped when read back
+- text columns as one UTF-8 blob (cells joined by NUL, which cannot occur in
+  sheet XML) plus a missing-value mask
+- anything else (mixed-type columns) pickled
+
+An entry belongs to one (file path, sheet name). It is used as-is while the
+file's size and mtime match; after the file was saved again it is still used
+if the CRC32s of that sheet's XML part and the styles are unchanged and the
+shared strings still begin with those the sheet was read with (string cells
+are indexes into the shared strings, and number formats decide which
+numbers are dates), so editing one sheet does not invalidate the others.
+The meta also keeps the sheet's xlsx_meta.SheetTail, which records that
+shared strings prefix and lets a sheet read from the cache be reloaded
+incrementally without re-reading its XML. Least recently used entries are
+evicted once the cache grows past its size cap.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from xlsx_meta import PartCrcs, SheetInfo, SheetTail, cells_intact, part_crcs
+
+CACHE_VERSION = 3
+DEFAULT_DISK_CACHE_MB = 1024
+META_FILE = "meta.json"
+LABELS_FILE = "columns.pkl"
+
+# Leftovers of interrupted writes are removed after this long.
+STALE_TMP_SECONDS = 24 * 3600
+
+
+def default_cache_dir() -> str:
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(r"~\AppData\Local")
+        return os.path.join(base, "XlsxRowViewer", "Cache")
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Caches/XlsxRowViewer")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "xlsx_row_viewer")
+
+
+def open_disk_cache(cap_mb: int | None = None) -> "DiskCache | None":
+    """The per-user cache with a cap of cap_mb (default DEFAULT_DISK_CACHE_MB); None when cap_mb is 0."""
+    if cap_mb is None:
+        cap_mb = DEFAULT_DISK_CACHE_MB
+    if cap_mb <= 0:
+        return None
+    return DiskCache(default_cache_dir(), cap_mb * 1024 * 1024)
+
+
+class FileStamp(NamedTuple):
+    size: int
+    mtime_ns: int
+    crc: int | None  # CRC32 of the sheet's XML part
+    strings_crc: int | None  # of the shared strings part
+    styles_crc: int | None  # of the styles part
+
+
+def _write_column(base: str, col: pd.Series) -> str:
+    """Write one column next to `base`; returns its storage kind."""
+    if col.dtype.kind in "biufcmM":
+        np.save(base + ".npy", col.to_numpy(), allow_pickle=False)
+        return "npy"
+
+    if isinstance(col.dtype, pd.StringDtype) or col.dtype == object:
+        missing = col.isna().to_numpy()
+        values = col.to_numpy(dtype=object, copy=True)
+        present = values[~missing]
+        if all(type(v) is str for v in present):
+            values[missing] = ""
+            blob = "\0".join(values)
+            if blob.count("\0") == max(len(values) - 1, 0):
+                with open(base + ".txt", "wb") as f:
+                    f.write(blob.encode("utf-8"))
+                np.save(base + ".na.npy", missing, allow_pickle=False)
+                return "text"
+
+    with open(base + ".pkl", "wb") as f:
+        pickle.dump(col, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return "pickle"
+
+
+def _read_column(base: str, kind: str, dtype: str, n_rows: int) -> pd.Series:
+    if kind == "npy":
+        # A plain ndarray view: still backed by the mapping, no copy.
+        return pd.Series(np.load(base + ".npy", mmap_mode="r").view(np.ndarray), copy=False)
+
+    if kind == "text":
+        with open(base + ".txt", "rb") as f:
+            text = f.read().decode("utf-8")
+        values = np.array(text.split("\0") if n_rows else [], dtype=object)
+        values[np.load(base + ".na.npy")] = None
+        if dtype == "object":
+            return pd.Series(values, dtype=object, copy=False)
+        return pd.Series(pd.array(values, dtype=pd.api.types.pandas_dtype(dtype)), copy=False)
+
+    with open(base + ".pkl", "rb") as f:
+        return pickle.load(f).reset_index(drop=True)
+
+
+class DiskCache:
+    """Parsed sheets on disk under `root`, at most cap_bytes in total."""
+
+    def __init__(self, root: str, cap_bytes: int):
+        self.root = root
+        self.cap_bytes = cap_bytes
+
+    def _entry(self, path: str, sheet_name: str) -> str:
+        key = f"{os.path.normcase(os.path.abspath(path))}\0{sheet_name}"
+        return os.path.join(self.root, hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+    def stamp(self, path: str, sheet: SheetInfo) -> FileStamp:
+        st = os.stat(path)
+        crcs = part_crcs(path, sheet.part) if sheet.part else PartCrcs(None, None, None)
+        return FileStamp(st.st_size, st.st_mtime_ns, *crcs)
+
+    def _meta(self, path: str, entry: str, stamp: FileStamp) -> tuple[dict, bool] | None:
+        """The entry's meta and whether it is from the very same file, or None unless it is valid for `stamp`."""
+        try:
+            with open(os.path.join(entry, META_FILE), encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get("version") != CACHE_VERSION:
+            return None
+
+        same_file = meta["size"] == stamp.size and meta["mtime_ns"] == stamp.mtime_ns
+        if same_file:
+            return meta, True
+        if stamp.crc is None or meta["crc"] != stamp.crc or meta["styles_crc"] != stamp.styles_crc:
+            return None
+        if meta["strings_crc"] != stamp.strings_crc:
+            # Text added on another sheet appends shared strings; the ones
+            # this sheet was read with must still come first, unchanged.
+            tail = meta.get("tail")
+            if not tail or not cells_intact(path, SheetTail(*tail)):
+                return None
+        return meta, False
+
+    def get(self, path: str, sheet: SheetInfo, stamp: FileStamp) -> pd.DataFrame | None:
+        entry = self._entry(path, sheet.name)
+        meta_path = os.path.join(entry, META_FILE)
+        found = self._meta(path, entry, stamp)
+        if found is None:
+            return None
+        meta, same_file = found
+
+        try:
+            with open(os.path.join(entry, LABELS_FILE), "rb") as f:
+                labels = pickle.load(f)
+            n_rows = meta["rows"]
+            columns = {
+                j: _read_column(os.path.join(entry, f"c{j}"), kind, dtype, n_rows)
+                for j, (kind, dtype) in enumerate(meta["columns"])
+            }
+        except Exception:
+            return None  # a damaged entry is just a miss
+        df = pd.DataFrame(columns, copy=False) if columns else pd.DataFrame(index=pd.RangeIndex(n_rows))
+        df.columns = labels
+
+        try:
+            if not same_file:
+                # Same sheet part in a newer file: adopt the new stamp.
+                meta.update(size=stamp.size, mtime_ns=stamp.mtime_ns, strings_crc=stamp.strings_crc)
+                self._write_meta(entry, meta)
+            os.utime(meta_path)  # recency for LRU eviction
+        except OSError:
+            pass
+        return df
+
+    def tail(self, path: str, sheet: SheetInfo, stamp: FileStamp) -> SheetTail | None:
+        """The SheetTail stored with the sheet's entry, if the entry is valid for `stamp`."""
+        found = self._meta(path, self._entry(path, sheet.name), stamp)
+        if found is None or not found[0].get("tail"):
+            return None
+        return SheetTail(*found[0]["tail"])
+
+    def put(self, path: str, sheet: SheetInfo, stamp: FileStamp, df: pd.DataFrame, tail: SheetTail | None = None):
+        """Store `df`, plus the sheet's SheetTail so a later reload can skip taking it again."""
+        entry = self._entry(path, sheet.name)
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            tmp = tempfile.mkdtemp(prefix=".tmp-", dir=self.root)
+        except OSError:
+            return
+        try:
+            with open(os.path.join(tmp, LABELS_FILE), "wb") as f:
+                pickle.dump(df.columns, f, protocol=pickle.HIGHEST_PROTOCOL)
+            columns = []
+            for j in range(df.shape[1]):
+                col = df.iloc[:, j]
+                columns.append((_write_column(os.path.join(tmp, f"c{j}"), col), str(col.dtype)))
+            nbytes = sum(os.path.getsize(os.path.join(tmp, name)) for name in os.listdir(tmp))
+            meta = {
+                "version": CACHE_VERSION,
+                "path": os.path.abspath(path),
+                "sheet": sheet.name,
+                "size": stamp.size,
+                "mtime_ns": stamp.mtime_ns,
+                "crc": stamp.crc,
+                "strings_crc": stamp.strings_crc,
+                "styles_crc": stamp.styles_crc,
+                "rows": len(df),
+                "tail": list(tail) if tail is not None else None,
+                "columns": columns,
+                "nbytes": nbytes,
+            }
+            if nbytes > self.cap_bytes:
+                shutil.rmtree(tmp, ignore_errors=True)
+                return
+            self._write_meta(tmp, meta)
+            # Fails if the old entry is still mapped (Windows) or another
+            # process just wrote it; either way the write is dropped.
+            shutil.rmtree(entry, ignore_errors=True)
+            os.rename(tmp, entry)
+        except (OSError, pickle.PicklingError, TypeError, ValueError):
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+        self._evict(keep=entry)
+
+    @staticmethod
+    def _write_meta(entry: str, meta: dict):
+        tmp = os.path.join(entry, META_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(entry, META_FILE))
+
+    def _evict(self, keep: str):
+        entries = []
+        now = time.time()
+        for name in os.listdir(self.root):
+            entry = os.path.join(self.root, name)
+            if name.startswith(".tmp-"):
+                try:
+                    if now - os.path.getmtime(entry) > STALE_TMP_SECONDS:
+                        shutil.rmtree(entry, ignore_errors=True)
+                except OSError:
+                    pass
+                continue
+            meta_path = os.path.join(entry, META_FILE)
+            try:
+                with open(meta_path, encoding="utf-8") as f:
+                    nbytes = json.load(f)["nbytes"]
+                entries.append((os.path.getmtime(meta_path), nbytes, entry))
+            except (OSError, ValueError, KeyError):
+                continue
+
+        total = sum(nbytes for _t, nbytes, _e in entries)
+        for _t, nbytes, entry in sorted(entries):
+            if total <= self.cap_bytes:
+                break
+            if entry == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            if not os.path.exists(entry):
+                total -= nbytes
@@ -0,0 +1,1110 @@
+"""
+Sheet loading shared by the Tk GUI and the curses viewer.
+
+- Reads sheets with openpyxl read-only iter_rows, producing the same
+  DataFrame as pd.read_excel(engine="openpyxl")
+- Streams rows to the caller while parsing, so the first rows can be shown
+  before the whole sheet is in memory
+- WorkbookHandle keeps one workbook open (zip, workbook.xml, shared strings,
+  styles parsed once) for every sheet read from that file
+- SheetLoadJob runs a load on a worker thread and reports through a queue
+- SheetCache keeps recently parsed sheets in memory under a byte budget;
+  a WorkbookHandle's DiskCache (xlsx_cache) keeps them across runs
+- LoadedSheet bundles a parsed sheet with indexes built once per sheet
+  (UrlIndex: vectorized URL detection per column; SearchIndex: inverted
+  token index, built on a background thread)
+- Column filters evaluated over whole columns into a row-position array
+- UrlLauncher opens batches of URLs on a worker thread, de-duplicated and
+  spaced out, with progress and cancel
+- A reload after the file changed reuses an unchanged sheet and parses
+  only the appended rows of a sheet that just grew (SheetLoadJob previous=)
+"""
+
+import bisect
+import io
+import os
+import queue
+import re
+import threading
+import time
+import zipfile
+import webbrowser
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import NamedTuple
+
+import numpy as np
+import openpyxl
+import pandas as pd
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from pandas.io.parsers import TextParser
+
+from xlsx_cache import DiskCache
+from xlsx_meta import SheetInfo, SheetTail, appended_rows, cells_intact, part_crc32, read_sheet_info, sheet_tail
+
+URL_PATTERN = r"\bhttps?://[^\s<>\"]+|www\.[^\s<>\"]+"
+URL_RE = re.compile(URL_PATTERN, re.IGNORECASE)
+
+TOKEN_PATTERN = r"\w+"
+TOKEN_RE = re.compile(TOKEN_PATTERN)
+
+# Search prefixes up to this long match so many tokens that their rows are
+# de-duplicated once when the index is built rather than on every query.
+SHORT_PREFIX_LEN = 2
+
+# Loads report progress (and check for cancel) this often, in rows.
+PROGRESS_EVERY = 500
+
+# Pause between two URLs of a batch, so a browser is not handed dozens of
+# tabs (and xdg-open processes) at once.
+URL_OPEN_INTERVAL = 0.3
+
+# Rows handed to on_rows at a time while streaming. The first chunk is small
+# so the first rows show up quickly.
+FIRST_CHUNK_ROWS = 50
+STREAM_CHUNK_ROWS = 2000
+
+
+class LoadCancelled(Exception):
+    pass
+
+
+def _convert_cell(cell):
+    return _convert_value(cell.value, cell.data_type)
+
+
+def _convert_value(value, data_type):
+    # Same conversions as pandas' openpyxl reader.
+    if value is None:
+        return ""
+    if data_type == TYPE_ERROR:
+        return float("nan")
+    if data_type == TYPE_NUMERIC:
+        val = int(value)
+        if val == value:
+            return val
+        return float(value)
+    return value
+
+
+def _pad(rows: list[list], width: int) -> list[list]:
+    return [r[:width] + [""] * (width - len(r)) for r in rows]
+
+
+class WorkbookHandle:
+    """
+    One .xlsx file. Sheet names and sizes come from xlsx_meta right away; the
+    openpyxl workbook (zip, workbook.xml, shared strings, styles) is opened on
+    first use - typically on a loader thread - and reused by every sheet read
+    until close(). Sheets found in `disk_cache` are not parsed at all.
+
+    Load jobs hold() the handle while queued or running, and the workbook is
+    closed when the last of them release()s it, so the file is not kept open
+    (and locked against replacing on Windows) between loads; the next read
+    opens it again.
+    """
+
+    def __init__(self, path: str, sheets: list[SheetInfo] | None = None, disk_cache: DiskCache | None = None):
+        self.path = path
+        self.sheets = sheets if sheets is not None else read_sheet_info(path)
+        self.sheet_names: list[str] = [s.name for s in self.sheets]
+        self.disk_cache = disk_cache
+        self._book = None
+        # _lock guards _book and is only held briefly, so close() on the UI
+        # thread never waits for a load; _open_lock makes loader threads
+        # share one load_workbook() call.
+        self._lock = threading.Lock()
+        self._open_lock = threading.Lock()
+        self._closes = 0  # close() calls so far; a load overtaken by one is dropped
+        self._holds = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def book(self):
+        """The openpyxl workbook, opened on first use. Raises LoadCancelled if close() is called meanwhile."""
+        with self._open_lock:
+            with self._lock:
+                if self._book is not None:
+                    return self._book
+                closes = self._closes
+            book = openpyxl.load_workbook(self.path, read_only=True, data_only=True, keep_links=False)
+            # <dimension> is only an estimate (pandas ignores it too), so
+            # read every sheet unbounded.
+            for ws in book.worksheets:
+                ws.reset_dimensions()
+            with self._lock:
+                if self._closes == closes:
+                    self._book = book
+                    return book
+            book.close()
+            raise LoadCancelled()
+
+    def worksheet(self, sheet):
+        if isinstance(sheet, int):
+            return self.book.worksheets[sheet]
+        return self.book[sheet]
+
+    def sheet_info(self, sheet) -> SheetInfo | None:
+        if isinstance(sheet, int):
+            return self.sheets[sheet] if 0 <= sheet < len(self.sheets) else None
+        return next((s for s in self.sheets if s.name == sheet), None)
+
+    def estimated_rows(self, sheet) -> int | None:
+        info = self.sheet_info(sheet)
+        return info.rows if info is not None else None
+
+    def hold(self):
+        """Keep the workbook open for reads to come, until a matching release()."""
+        with self._lock:
+            self._holds += 1
+
+    def release(self):
+        with self._lock:
+            self._holds -= 1
+            if self._holds > 0:
+                return
+            book, self._book = self._book, None
+        if book is not None:
+            book.close()
+
+    def close(self):
+        with self._lock:
+            self._closes += 1
+            book, self._book = self._book, None
+        if book is not None:
+            book.close()
+
+
+def stream_sheet(book, sheet, cancel: threading.Event | None = None, progress=None, on_rows=None) -> pd.DataFrame:
+    """
+    Equivalent of pd.read_excel(path, sheet, engine="openpyxl"), read row by
+    row. `book` is a WorkbookHandle (reused) or a path (opened and closed
+    here); `sheet` is a sheet name or a 0-based index.
+
+    progress(rows_read, estimated_total) is called every PROGRESS_EVERY rows;
+    estimated_total comes from the sheet's <dimension> and may be None.
+
+    on_rows(chunk_df) receives the data rows as they are parsed, in chunks of
+    STREAM_CHUNK_ROWS, already shaped like the header. The returned frame is
+    parsed again from all rows at the end, so its dtypes match read_excel.
+
+    A sheet found in the handle's disk cache is returned without parsing
+    (no progress or on_rows calls); a parsed sheet is added to it.
+
+    Raises LoadCancelled once `cancel` is set.
+    """
+    owned = not isinstance(book, WorkbookHandle)
+    if owned:
+        book = WorkbookHandle(book)
+
+    cache = book.disk_cache
+    info = book.sheet_info(sheet) if cache is not None else None
+    stamp = None
+    if info is not None:
+        try:
+            stamp = cache.stamp(book.path, info)
+        except OSError:
+            pass
+        else:
+            cached = cache.get(book.path, info, stamp)
+            if cached is not None:
+                return cached
+
+    try:
+        total = book.estimated_rows(sheet)
+        ws = book.worksheet(sheet)
+
+        data = []
+        last_row_with_data = -1
+        columns = None
+        streamed = 0
+        chunk_rows = FIRST_CHUNK_ROWS
+        for n, row in enumerate(ws.iter_rows(), start=1):
+            converted = [_convert_cell(c) for c in row]
+            while converted and converted[-1] == "":
+                converted.pop()
+            if converted:
+                last_row_with_data = n - 1
+            data.append(converted)
+
+            if on_rows is not None:
+                # Streaming needs the header up front, so it only starts
+                # when the first row is non-empty.
+                if n == 1 and converted:
+                    columns = TextParser([converted], header=0).read().columns
+                    streamed = 1
+                elif columns is not None and last_row_with_data + 1 - streamed >= chunk_rows:
+                    on_rows(_chunk_frame(data[streamed:last_row_with_data + 1], columns))
+                    streamed = last_row_with_data + 1
+                    chunk_rows = STREAM_CHUNK_ROWS
+
+            if n % PROGRESS_EVERY == 0:
+                if cancel is not None and cancel.is_set():
+                    raise LoadCancelled()
+                if progress is not None:
+                    progress(n, total)
+    finally:
+        if owned:
+            book.close()
+
+    data = data[: last_row_with_data + 1]
+    if on_rows is not None and columns is not None and streamed < len(data):
+        on_rows(_chunk_frame(data[streamed:], columns))
+    if not data:
+        df = pd.DataFrame()
+    else:
+        width = max(len(r) for r in data)
+        if progress is not None:
+            progress(len(data), len(data))
+        df = TextParser(_pad(data, width), header=0, skip_blank_lines=False).read()
+    if stamp is not None:
+        cache.put(book.path, info, stamp, df, tail=_tail_of(book.path, info.part, stamp.crc))
+    return df
+
+
+def _tail_of(path: str, part: str, crc: int | None) -> SheetTail | None:
+    # Only a tail of the version `crc` describes (the file may have been
+    # replaced since).
+    if not part or crc is None:
+        return None
+    tail = sheet_tail(path, part)
+    return tail if tail is not None and tail.crc == crc else None
+
+
+def _chunk_frame(rows: list[list], columns) -> pd.DataFrame:
+    if not rows:
+        return pd.DataFrame(columns=columns)
+    # Blank rows are kept, as read_excel keeps them: row i of the frame is
+    # always sheet row i + 2.
+    rows = _pad(rows, len(columns))
+    return TextParser(rows, names=list(columns), header=None, skip_blank_lines=False).read()
+
+
+def load_sheet(book, sheet, cancel: threading.Event | None = None, progress=None) -> pd.DataFrame:
+    return stream_sheet(book, sheet, cancel=cancel, progress=progress)
+
+
+def parse_appended_rows(
+    book: WorkbookHandle, sheet, columns, source_rows: int, rows_xml: bytes
+) -> pd.DataFrame | None:
+    """
+    Data rows from rows_xml - <row> elements a newer version of `sheet`
+    added after its first source_rows data rows - shaped like `columns`.
+    None when they do not continue the old rows (a row number at or before
+    them) or are wider than the header; the sheet then has to be parsed
+    in full.
+    """
+    try:
+        # Not public API; without it every change means a full parse.
+        from openpyxl.worksheet._reader import WorkSheetParser
+        from openpyxl.xml.constants import SHEET_MAIN_NS
+    except ImportError:
+        return None
+
+    ws = book.worksheet(sheet)
+    src = io.BytesIO(
+        f'<worksheet xmlns="{SHEET_MAIN_NS}"><sheetData>'.encode() + rows_xml + b"</sheetData></worksheet>"
+    )
+    # Sheet row 1 is the header, so data row i is sheet row i + 2.
+    first = source_rows + 2
+    data: list[list] = []
+    try:
+        wb = ws.parent
+        parser = WorkSheetParser(
+            src,
+            ws._shared_strings,
+            data_only=True,
+            epoch=wb.epoch,
+            date_formats=wb._date_formats,
+            timedelta_formats=wb._timedelta_formats,
+        )
+        for n, cells in parser.parse():
+            if n < first + len(data):
+                return None
+            data.extend([] for _ in range(n - first - len(data)))
+            row: list = []
+            for cell in cells:
+                row.extend([""] * (cell["column"] - 1 - len(row)))
+                row.append(_convert_value(cell["value"], cell["data_type"]))
+            while row and row[-1] == "":
+                row.pop()
+            if len(row) > len(columns):
+                return None
+            data.append(row)
+    except (AttributeError, TypeError, KeyError, IndexError):
+        # The private API changed shape (or a string index points past the
+        # strings this workbook read): leave it to the full parse.
+        return None
+
+    while data and not data[-1]:
+        data.pop()
+    return _chunk_frame(data, columns)
+
+
+def _text_columns(df: pd.DataFrame):
+    """(position, non-null values as str) for columns that can hold text."""
+    for j in range(df.shape[1]):
+        col = df.iloc[:, j]
+        if col.dtype.kind not in "OSU" and not isinstance(col.dtype, pd.StringDtype):
+            continue  # numeric, bool and datetime columns never hold URLs
+        present = col.notna().to_numpy()
+        if present.any():
+            yield j, present, col[present].astype(str)
+
+
+class UrlIndex:
+    """
+    URLs of a sheet, found once with vectorized string ops over whole columns.
+
+    For each column holding at least one URL there is a boolean mask over the
+    rows and an object array of normalized URLs (None where the cell has no
+    URL); rendering and "open all URLs" only do lookups.
+
+    mode="prefix": the stripped cell starts with http://, https:// or www.
+                   (the GUI's rule); mode="search": URL_RE found anywhere
+                   in the cell (the curses viewer's rule).
+    """
+
+    def __init__(self, n_rows: int, masks: dict[int, np.ndarray], urls: dict[int, np.ndarray]):
+        self.n_rows = n_rows
+        self.masks = masks
+        self.urls = urls
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, mode: str = "prefix") -> "UrlIndex":
+        masks = {}
+        urls = {}
+        for j, present, s in _text_columns(df):
+            if mode == "prefix":
+                s = s.str.strip()
+                is_www = s.str.startswith("www.")
+                found = s.where(is_www | s.str.lower().str.startswith(("http://", "https://")))
+            else:
+                found = s.str.extract(f"({URL_PATTERN})", flags=re.IGNORECASE, expand=False)
+                is_www = found.str.lower().str.startswith("www.").fillna(False).astype(bool)
+            found = found.where(~is_www, "https://" + found)
+
+            hit = found.notna().to_numpy()
+            if not hit.any():
+                continue
+            col_urls = np.full(len(df), None, dtype=object)
+            rows = np.flatnonzero(present)[hit]
+            col_urls[rows] = found.to_numpy(dtype=object)[hit]
+            mask = np.zeros(len(df), dtype=bool)
+            mask[rows] = True
+            masks[j] = mask
+            urls[j] = col_urls
+        return cls(len(df), masks, urls)
+
+    def url(self, row: int, col: int) -> str | None:
+        col_urls = self.urls.get(col)
+        return None if col_urls is None else col_urls[row]
+
+    def row_urls(self, row: int) -> list[tuple[int, str]]:
+        """(column position, url) for every URL in the row, in column order."""
+        return [(j, self.urls[j][row]) for j in sorted(self.masks) if self.masks[j][row]]
+
+    def collect(self, rows: np.ndarray, cols: list[int] | None = None) -> list[str]:
+        """URLs of the given rows (and columns, default all), row by row in column order."""
+        rows = np.asarray(rows, dtype=np.int64)
+        found_rows, found_cols, found = [], [], []
+        for j in sorted(self.masks):
+            if cols is not None and j not in cols:
+                continue
+            hit = rows[self.masks[j][rows]]
+            found_rows.append(hit)
+            found_cols.append(np.full(len(hit), j))
+            found.append(self.urls[j][hit])
+        if not found:
+            return []
+        order = np.lexsort((np.concatenate(found_cols), np.concatenate(found_rows)))
+        return list(np.concatenate(found)[order])
+
+
+def parse_row_spec(spec: str, n_rows: int) -> np.ndarray:
+    """
+    Sorted row positions for a 1-based row list like "100-150, 200, 300-".
+    An empty spec means every row.
+    """
+    if not spec.strip():
+        return np.arange(n_rows, dtype=np.int64)
+    keep = np.zeros(n_rows, dtype=bool)
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, dash, stop = part.partition("-")
+        try:
+            first = int(start) if start.strip() else 1
+            last = (int(stop) if stop.strip() else n_rows) if dash else first
+        except ValueError:
+            raise ValueError(f"Not a row or row range: {part!r}") from None
+        if first < 1 or last < first:
+            raise ValueError(f"Not a row or row range: {part!r}")
+        keep[first - 1:last] = True
+    return np.flatnonzero(keep)
+
+
+def url_key(url: str) -> str:
+    """What two URLs must share to count as the same link: case-insensitive
+    scheme and host, no fragment, no trailing slash."""
+    url = url.strip()
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        scheme, rest = "https", url
+    host, slash, path = rest.partition("/")
+    path = (slash + path).split("#", 1)[0].rstrip("/")
+    return f"{scheme.lower()}://{host.lower()}{path}"
+
+
+def unique_urls(urls) -> list[str]:
+    """`urls` in order, keeping the first of those with the same url_key()."""
+    seen = set()
+    out = []
+    for url in urls:
+        key = url_key(url)
+        if key not in seen:
+            seen.add(key)
+            out.append(url)
+    return out
+
+
+class UrlBatch:
+    """URLs queued on a UrlLauncher; `opened` counts up as they are opened."""
+
+    def __init__(self, urls: list[str]):
+        self.urls = urls
+        self.opened = 0
+        self.failed = 0
+        self.finished = False
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+
+class UrlLauncher:
+    """
+    Opens URLs in the browser on one worker thread, URL_OPEN_INTERVAL apart.
+
+    webbrowser.open can block for a while (on Linux it starts xdg-open), so
+    the caller only queues a batch and polls it for progress. Batches run
+    one after the other; a cancelled batch stops before its next URL.
+    open_one() is for a single click and does not wait for a batch.
+    """
+
+    def __init__(self, interval: float = URL_OPEN_INTERVAL, open_url=None):
+        self.interval = interval
+        self.open_url = open_url or (lambda url: webbrowser.open(url, new=2))
+        self._batches: queue.Queue[UrlBatch] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._last_open = 0.0
+
+    def open_one(self, url: str):
+        """Open a single URL now, ahead of any batch (still off the caller's thread)."""
+        threading.Thread(target=self.open_url, args=(url,), name="url-open", daemon=True).start()
+
+    def open(self, urls) -> UrlBatch:
+        """Queue `urls` (de-duplicated with unique_urls) and return their batch."""
+        batch = UrlBatch(unique_urls(urls))
+        self._batches.put(batch)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="url-launcher", daemon=True)
+            self._thread.start()
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._batches.get()
+            for url in batch.urls:
+                wait = self._last_open + self.interval - time.monotonic()
+                if batch.cancelled or (wait > 0 and batch._cancel.wait(wait)):
+                    break
+                try:
+                    if self.open_url(url) is False:  # no browser found
+                        batch.failed += 1
+                except Exception:
+                    batch.failed += 1
+                self._last_open = time.monotonic()
+                batch.opened += 1
+            batch.finished = True
+
+
+def format_value(x) -> str:
+    """Display string of a cell: "" for missing, integer-valued floats as ints."""
+    try:
+        if pd.isna(x):
+            return ""
+    except (TypeError, ValueError):
+        pass
+    if isinstance(x, float) and x.is_integer():
+        return str(int(x))
+    return str(x)
+
+
+def display_strings(col: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """format_value over a whole column: (object array of str, missing mask)."""
+    missing = col.isna().to_numpy()
+    if isinstance(col.dtype, pd.StringDtype):
+        values = col.to_numpy(dtype=object, na_value="")
+    elif col.dtype.kind in "iub":
+        values = col.astype(str).to_numpy(dtype=object)
+        values[missing] = ""  # nullable (Int64, boolean) columns
+    elif col.dtype.kind == "f":
+        x = col.to_numpy(dtype=np.float64)
+        values = np.full(len(x), "", dtype=object)
+        small_int = np.isfinite(x) & (x == np.trunc(x)) & (np.abs(x) < 2**53)
+        values[small_int] = x[small_int].astype(np.int64).astype(str)
+        other = ~small_int & ~missing
+        values[other] = [format_value(v) for v in x[other].tolist()]
+    else:
+        values = np.empty(len(col), dtype=object)
+        values[:] = [format_value(v) for v in col.tolist()]
+    return values, missing
+
+
+def frame_row(df: pd.DataFrame, i: int) -> list[str | None]:
+    """Row i formatted like RowStore.row(), straight from a frame (for sheets still streaming in)."""
+    row = df.iloc[i]
+    return [None if m else format_value(x) for x, m in zip(row.tolist(), row.isna().to_numpy())]
+
+
+class RowStore:
+    """
+    Display strings of a sheet, formatted once per load: for every column an
+    object array of format_value() strings plus a missing mask. Fetching a
+    row is one index per column; no pandas objects are created per row.
+    """
+
+    def __init__(self, labels: list[str], values: list[np.ndarray], missing: list[np.ndarray], n_rows: int):
+        self.labels = labels
+        self.values = values
+        self.missing = missing
+        self.n_rows = n_rows
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> "RowStore":
+        values = []
+        missing = []
+        for j in range(df.shape[1]):
+            v, m = display_strings(df.iloc[:, j])
+            values.append(v)
+            missing.append(m)
+        return cls([str(c) for c in df.columns], values, missing, len(df))
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def row(self, i: int) -> list[str | None]:
+        """Display strings of row i, None for missing cells."""
+        return [None if m[i] else v[i] for v, m in zip(self.values, self.missing)]
+
+    def block(self, rows: np.ndarray, cols: range) -> list[list[str]]:
+        """Display strings of the cells rows x cols, row by row; "" for missing cells."""
+        columns = []
+        for j in cols:
+            v = self.values[j][rows]
+            v[self.missing[j][rows]] = ""
+            columns.append(v)
+        if not columns:
+            return [[] for _ in rows]
+        return [list(r) for r in zip(*columns)]
+
+
+class SearchIndex:
+    """
+    Inverted index of the lower-cased word tokens in every cell of a sheet.
+
+    The vocabulary is sorted, and the row positions of each token are stored
+    contiguously in that order, so the rows of all tokens sharing a prefix
+    form one slice of `postings`. Queries are prefix matches on every query
+    token and return the rows containing all of them. The rows of prefixes
+    up to SHORT_PREFIX_LEN characters (the first keystrokes, matching the
+    most tokens) are de-duplicated once at build time.
+    """
+
+    def __init__(self, vocab: list[str], starts: np.ndarray, postings: np.ndarray):
+        self.vocab = vocab
+        self.starts = starts  # len(vocab) + 1 offsets into postings
+        self.postings = postings
+        self._short = self._short_prefix_rows()
+
+    def _short_prefix_rows(self) -> dict[str, np.ndarray]:
+        # Sorted rows of every prefix of up to SHORT_PREFIX_LEN characters.
+        # There are few of them, and the tokens sharing one are contiguous
+        # in the sorted vocabulary.
+        short = {}
+        for k in range(1, SHORT_PREFIX_LEN + 1):
+            lo = 0
+            while lo < len(self.vocab):
+                prefix = self.vocab[lo][:k]
+                if len(prefix) < k:
+                    lo += 1
+                    continue
+                hi = bisect.bisect_left(self.vocab, prefix + "\U0010ffff", lo)
+                rows = self.postings[self.starts[lo]:self.starts[hi]]
+                short[prefix] = rows if hi - lo == 1 else np.unique(rows)
+                lo = hi
+        return short
+
+    @classmethod
+    def build(cls, store: RowStore) -> "SearchIndex":
+        tokens = []
+        rows = []
+        for values, missing in zip(store.values, store.missing):
+            present = ~missing
+            if not present.any():
+                continue
+            col = pd.Series(values[present], index=np.flatnonzero(present), dtype=object)
+            words = col.str.lower().str.findall(TOKEN_PATTERN).explode().dropna()
+            tokens.append(words.to_numpy(dtype=object))
+            rows.append(words.index.to_numpy(dtype=np.int64))
+
+        if not tokens:
+            return cls([], np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32))
+
+        pairs = pd.DataFrame({"token": np.concatenate(tokens), "row": np.concatenate(rows)})
+        pairs = pairs.drop_duplicates().sort_values(["token", "row"], kind="stable")
+        token_arr = pairs["token"].to_numpy(dtype=object)
+        vocab, first = np.unique(token_arr, return_index=True)
+        starts = np.append(first, len(token_arr)).astype(np.int64)
+        return cls(list(vocab), starts, pairs["row"].to_numpy(dtype=np.int32))
+
+    def _prefix_rows(self, prefix: str) -> np.ndarray:
+        if len(prefix) <= SHORT_PREFIX_LEN:
+            return self._short.get(prefix, self.postings[:0])
+        lo = bisect.bisect_left(self.vocab, prefix)
+        hi = bisect.bisect_left(self.vocab, prefix + "\U0010ffff", lo)
+        if lo == hi:
+            return self.postings[:0]
+        rows = self.postings[self.starts[lo]:self.starts[hi]]
+        return rows if hi - lo == 1 else np.unique(rows)
+
+    def rows(self, query: str) -> np.ndarray:
+        """Sorted row positions whose cells contain every query token (as a prefix)."""
+        terms = TOKEN_RE.findall(query.lower())
+        if not terms:
+            return self.postings[:0]
+        # Longest terms first: their slices are usually the smallest.
+        terms.sort(key=len, reverse=True)
+        hits = self._prefix_rows(terms[0])
+        for term in terms[1:]:
+            if len(hits) == 0:
+                break
+            hits = _intersect_sorted(hits, self._prefix_rows(term))
+        return hits
+
+
+def _intersect_sorted(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Values of `a` also in `b`; both sorted and without duplicates."""
+    if len(a) == 0 or len(b) == 0:
+        return a[:0]
+    in_b = np.zeros(int(max(a[-1], b[-1])) + 1, dtype=bool)
+    in_b[b] = True
+    return a[in_b[a]]
+
+
+FILTER_OPS = ("contains", "equals", "starts with", "not empty", "empty")
+
+
+class ColumnFilter(NamedTuple):
+    column: str
+    op: str  # one of FILTER_OPS
+    value: str = ""
+
+    def describe(self) -> str:
+        if self.op in ("not empty", "empty"):
+            return f"{self.column} is {self.op}"
+        return f"{self.column} {self.op} '{self.value}'"
+
+
+def column_text(store: RowStore, j: int) -> pd.Series:
+    """Lower-cased, stripped display strings of column j ("" where missing)."""
+    return pd.Series(store.values[j], dtype=object).str.strip().str.lower()
+
+
+def filter_mask(text: pd.Series, flt: ColumnFilter) -> np.ndarray:
+    value = flt.value.strip().lower()
+    if flt.op == "contains":
+        mask = text.str.contains(value, regex=False)
+    elif flt.op == "equals":
+        mask = text == value
+    elif flt.op == "starts with":
+        mask = text.str.startswith(value)
+    elif flt.op == "not empty":
+        mask = text != ""
+    elif flt.op == "empty":
+        mask = text == ""
+    else:
+        raise ValueError(f"Unknown filter operator: {flt.op}")
+    return mask.to_numpy(dtype=bool)
+
+
+def step_row(view: np.ndarray | None, n_rows: int, row: int, delta: int) -> int | None:
+    """
+    The row `delta` steps away from `row`, moving over `view` (sorted row
+    positions) when set or over 0..n_rows-1 otherwise; None at either end.
+    """
+    if view is None:
+        target = row + delta
+        return target if 0 <= target < n_rows else None
+    i = int(np.searchsorted(view, row))
+    on_view = i < len(view) and view[i] == row
+    if delta > 0:
+        j = i + delta if on_view else i + delta - 1
+    else:
+        j = i + delta
+    return int(view[j]) if 0 <= j < len(view) else None
+
+
+def view_position(view: np.ndarray, row: int) -> int | None:
+    """Index of `row` in `view`, or None when the row is not part of it."""
+    i = int(np.searchsorted(view, row))
+    return i if i < len(view) and view[i] == row else None
+
+
+# Rows prepared ahead of the shown one: PREFETCH_MIN_DEPTH after a change of
+# direction, doubling with each further step the same way up to
+# PREFETCH_MAX_DEPTH.
+PREFETCH_MIN_DEPTH = 2
+PREFETCH_MAX_DEPTH = 16
+
+
+class RowPrefetcher:
+    """
+    Display models of the rows around the shown one, built while the UI idles.
+
+    build(row) is the front end's per-row work (display strings, URLs,
+    layout estimates). get() returns the shown row's model, building it
+    only if it was not prefetched; the UI calls prefetch_one() from idle
+    time until it returns False. Neighbours are the rows step_row() reaches
+    over `view`: `depth` rows in the direction the user is moving and one
+    row the other way.
+    """
+
+    def __init__(self, build, n_rows: int, view: np.ndarray | None = None):
+        self.build = build
+        self.n_rows = n_rows
+        self.view = view  # may be replaced when filters change; models stay valid
+        self.row: int | None = None
+        self.direction = 1
+        self.depth = PREFETCH_MIN_DEPTH
+        self._models: OrderedDict[int, object] = OrderedDict()
+        self._pending: list[int] = []
+
+    def get(self, row: int):
+        if self.row is not None and row != self.row:
+            direction = 1 if row > self.row else -1
+            if direction == self.direction:
+                self.depth = min(self.depth * 2, PREFETCH_MAX_DEPTH)
+            else:
+                self.direction = direction
+                self.depth = PREFETCH_MIN_DEPTH
+        self.row = row
+
+        model = self._models.get(row)
+        if model is None:
+            model = self._models[row] = self.build(row)
+        self._models.move_to_end(row)
+        self._trim()
+
+        ahead = self._walk(row, self.direction, self.depth)
+        behind = self._walk(row, -self.direction, 1)
+        self._pending = [r for r in (ahead[:1] + behind + ahead[1:]) if r not in self._models]
+        return model
+
+    def prefetch_one(self) -> bool:
+        """Build the next missing neighbour; False once there is none."""
+        while self._pending:
+            row = self._pending.pop(0)
+            if row not in self._models:
+                self._models[row] = self.build(row)
+                self._trim()
+                return True
+        return False
+
+    def _trim(self):
+        # Room for a full window either side of the shown row.
+        while len(self._models) > 2 * PREFETCH_MAX_DEPTH + 2:
+            self._models.popitem(last=False)
+
+    def _walk(self, row: int, delta: int, count: int) -> list[int]:
+        rows = []
+        for _ in range(count):
+            row = step_row(self.view, self.n_rows, row, delta)
+            if row is None:
+                break
+            rows.append(row)
+        return rows
+
+
+class LoadedSheet:
+    """A parsed sheet plus the data derived from it once per load."""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        urls: UrlIndex | None = None,
+        nbytes: int | None = None,
+        rows: RowStore | None = None,
+    ):
+        self.df = df
+        self.urls = urls
+        self.nbytes = nbytes
+        self.rows = rows if rows is not None else RowStore.build(df)
+        self.search: SearchIndex | None = None  # set by build_search_async()
+        # Set by SheetLoadJob: data rows as parsed (before prepare() dropped
+        # any), and where the sheet's XML ended, to recognise appended rows.
+        self.source_rows = len(df)
+        self.tail: SheetTail | None = None
+        self._search_thread: threading.Thread | None = None
+        self._column_text: dict[int, pd.Series] = {}
+
+    def filter_rows(self, filters: list[ColumnFilter]) -> np.ndarray:
+        """
+        Sorted row positions matching every filter. Each column's display
+        strings are computed once and reused by later filters on it; the
+        frame itself is never copied.
+        """
+        mask = np.ones(len(self.df), dtype=bool)
+        columns = self.rows.labels
+        for flt in filters:
+            try:
+                j = columns.index(flt.column)
+            except ValueError:
+                raise ValueError(f"No column named '{flt.column}'") from None
+            text = self._column_text.get(j)
+            if text is None:
+                text = self._column_text[j] = column_text(self.rows, j)
+            mask &= filter_mask(text, flt)
+        return np.flatnonzero(mask)
+
+    def build_search_async(self):
+        """Build the search index on a daemon thread (once per sheet)."""
+        if self._search_thread is not None:
+            return
+
+        def run():
+            self.search = SearchIndex.build(self.rows)
+
+        self._search_thread = threading.Thread(target=run, daemon=True)
+        self._search_thread.start()
+
+    @classmethod
+    def prepare(cls, df: pd.DataFrame, url_mode: str | None = None, measure: bool = False) -> "LoadedSheet":
+        df = df.reset_index(drop=True)
+        urls = UrlIndex.build(df, url_mode) if url_mode else None
+        rows = RowStore.build(df)
+        nbytes = None
+        if measure:
+            # Text cells are shared with the frame, so for text columns the
+            # row store only adds its pointer array and mask.
+            nbytes = int(df.memory_usage(deep=True).sum())
+            for dtype, v, m in zip(df.dtypes, rows.values, rows.missing):
+                deep = not isinstance(dtype, pd.StringDtype)
+                nbytes += int(pd.Series(v, copy=False).memory_usage(index=False, deep=deep)) + m.nbytes
+        return cls(df, urls, nbytes, rows)
+
+
+class SheetLoadJob:
+    """
+    Parses one sheet on a worker thread. Results are posted to `messages`
+    as ("progress", rows, total), ("rows", chunk_df), ("done", LoadedSheet)
+    or ("error", exc). "rows" messages are only sent when stream=True.
+
+    prepare(df) -> LoadedSheet runs on the worker once the sheet is parsed,
+    so per-sheet indexes are built off the UI thread.
+
+    start() runs the job on a thread of its own, or queues it on an
+    executor shared by several loads; a job cancelled while still queued
+    never starts parsing.
+
+    `previous` is the same sheet loaded from an older version of the file:
+    it is passed on as-is when the sheet's part, the shared strings it uses
+    and the styles are unchanged, and when rows were only appended, just
+    those are parsed and added to it.
+    """
+
+    def __init__(self, book, sheet_name, stream: bool = False, prepare=None, cache_key=None, previous=None):
+        self.book = book
+        self.sheet_name = sheet_name
+        self.stream = stream
+        self.prepare = prepare or LoadedSheet.prepare
+        self.cache_key = cache_key
+        self.previous: LoadedSheet | None = previous
+        self.messages: queue.Queue = queue.Queue()
+        self.cancelled = threading.Event()
+
+    def start(self, executor: Executor | None = None):
+        # Jobs queued back to back share one opened workbook.
+        if isinstance(self.book, WorkbookHandle):
+            self.book.hold()
+        if executor is not None:
+            executor.submit(self._run)
+        else:
+            threading.Thread(target=self._run, daemon=True).start()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def _run(self):
+        try:
+            self._load()
+        finally:
+            if isinstance(self.book, WorkbookHandle):
+                self.book.release()
+
+    def _load(self):
+        if self.cancelled.is_set():
+            return
+        info = self.book.sheet_info(self.sheet_name) if isinstance(self.book, WorkbookHandle) else None
+        part = info.part if info is not None else ""
+        try:
+            crc = part_crc32(self.book.path, part) if part else None
+            sheet = self._update(part, crc) if self.previous is not None else None
+            if sheet is None:
+                df = stream_sheet(
+                    self.book,
+                    self.sheet_name,
+                    cancel=self.cancelled,
+                    progress=lambda n, total: self.messages.put(("progress", n, total)),
+                    on_rows=(lambda chunk: self.messages.put(("rows", chunk))) if self.stream else None,
+                )
+                sheet = self.prepare(df)
+                sheet.source_rows = len(df)
+        except LoadCancelled:
+            return
+        except Exception as e:
+            self.messages.put(("error", e))
+            return
+        self.messages.put(("done", sheet))
+
+        # Needed only when the file changes later on. A sheet from the disk
+        # cache comes with the tail stored next to it; otherwise it is
+        # taken after the fact (the XML was just parsed anyway).
+        if crc is not None and (sheet.tail is None or sheet.tail.crc != crc):
+            sheet.tail = self._cached_tail(info, crc) or _tail_of(self.book.path, part, crc)
+
+    def _cached_tail(self, info: SheetInfo, crc: int) -> SheetTail | None:
+        cache = self.book.disk_cache
+        if cache is None:
+            return None
+        try:
+            tail = cache.tail(self.book.path, info, cache.stamp(self.book.path, info))
+        except (OSError, zipfile.BadZipFile):
+            return None
+        return tail if tail is not None and tail.crc == crc else None
+
+    def _update(self, part: str, crc: int | None) -> LoadedSheet | None:
+        previous = self.previous
+        tail = previous.tail
+        if tail is None or crc is None:
+            return None
+        if crc == tail.crc:
+            # The sheet part alone does not hold the text or number formats.
+            return previous if cells_intact(self.book.path, tail) else None
+        rows_xml = appended_rows(self.book.path, part, tail)
+        if rows_xml is None:
+            return None
+        chunk = parse_appended_rows(self.book, self.sheet_name, previous.df.columns, previous.source_rows, rows_xml)
+        if chunk is not None:
+            chunk = _cast_like(chunk, previous.df)
+        if chunk is None:
+            return None
+        # prepare() drops rows again if the caller cleans the frame; the
+        # rows it dropped before stay dropped.
+        df = pd.concat([previous.df, chunk], ignore_index=True) if len(chunk) else previous.df
+        sheet = self.prepare(df)
+        sheet.source_rows = previous.source_rows + len(chunk)
+
+        # The disk cache holds sheets as parsed, so only a frame nothing was
+        # dropped from goes back in.
+        cache = self.book.disk_cache
+        info = self.book.sheet_info(self.sheet_name)
+        if cache is not None and info is not None and len(previous.df) == previous.source_rows:
+            try:
+                stamp = cache.stamp(self.book.path, info)
+                sheet.tail = _tail_of(self.book.path, info.part, stamp.crc)
+                cache.put(self.book.path, info, stamp, df, tail=sheet.tail)
+            except (OSError, zipfile.BadZipFile):
+                pass
+        return sheet
+
+
+def _cast_like(chunk: pd.DataFrame, like: pd.DataFrame) -> pd.DataFrame | None:
+    """
+    `chunk` with the column dtypes of `like`, so appending it gives what a
+    full parse would; None when a column holds values `like`'s dtype cannot
+    (a full parse would then infer another dtype for the whole column).
+    """
+    columns = {}
+    for j in range(chunk.shape[1]):
+        col, dtype = chunk.iloc[:, j], like.dtypes.iloc[j]
+        if col.dtype != dtype:
+            # Empty cells alone do not decide a column's dtype; otherwise
+            # only lossless widening (int into float or object) is safe.
+            lossless = dtype == object or (col.dtype.kind in "biu" and dtype.kind == "f")
+            if not (col.isna().all() or lossless):
+                return None
+            try:
+                col = col.astype(dtype)
+            except (TypeError, ValueError):
+                return None
+        columns[j] = col
+    out = pd.DataFrame(columns, copy=False)
+    out.columns = chunk.columns
+    return out
+
+
+def sheet_key(path: str, sheet) -> tuple:
+    """Cache key for one sheet of one version of a file."""
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size, sheet)
+
+
+class SheetCache:
+    """
+    LRU cache of LoadedSheets keyed by sheet_key(). Entries are weighed by
+    the frame's deep memory usage; the least recently used ones are evicted
+    once the total exceeds budget_bytes.
+    """
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._items: OrderedDict[tuple, LoadedSheet] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: tuple) -> LoadedSheet | None:
+        sheet = self._items.get(key)
+        if sheet is not None:
+            self._items.move_to_end(key)
+        return sheet
+
+    def put(self, key: tuple, sheet: LoadedSheet):
+        if sheet.nbytes is None:
+            sheet.nbytes = int(sheet.df.memory_usage(deep=True).sum())
+        self.discard(key)
+        if sheet.nbytes > self.budget_bytes:
+            return
+        self._items[key] = sheet
+        self.used_bytes += sheet.nbytes
+        while self.used_bytes > self.budget_bytes:
+            _key, evicted = self._items.popitem(last=False)
+            self.used_bytes -= evicted.nbytes
+
+    def discard(self, key: tuple):
+        sheet = self._items.pop(key, None)
+        if sheet is not None:
+            self.used_bytes -= sheet.nbytes
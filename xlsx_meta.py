@@ -0,0 +1,329 @@
+"""
+Fast sheet metadata for .xlsx files (stdlib only).
+
+Opens the file as a zip and reads just the workbook part, its relationships
+and the <dimension> element at the top of each sheet part. No cell data is
+parsed and neither pandas nor openpyxl is imported, so this is cheap enough
+to run before the window is shown.
+
+Also here: FileWatcher, which notices a new version of an open file, and
+SheetTail / appended_rows(), which tell whether a sheet's new version only
+added rows at the end (comparing the XML byte for byte, but streamed and
+without keeping it in memory).
+"""
+
+import os
+import posixpath
+import re
+import zipfile
+import zlib
+from typing import NamedTuple, Optional
+from xml.etree import ElementTree as ET
+
+REL_NS_SUFFIX = "/relationships"
+DIMENSION_RE = re.compile(r"^\$?([A-Z]+)\$?(\d+)(?::\$?([A-Z]+)\$?(\d+))?$")
+READ_CHUNK = 1 << 20
+
+
+class SheetInfo(NamedTuple):
+    name: str
+    state: str  # "visible", "hidden" or "veryHidden"
+    part: str  # zip member of the sheet XML, e.g. "xl/worksheets/sheet1.xml"
+    rows: Optional[int]  # last row in <dimension>, None when unsized
+    cols: Optional[int]  # last column in <dimension>, None when unsized
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _rels(zf: zipfile.ZipFile, part: str) -> dict[str, tuple[str, str]]:
+    """Relationship id -> (type, resolved zip member) for one part."""
+    folder, name = posixpath.split(part)
+    rels_part = posixpath.join(folder, "_rels", name + ".rels")
+    try:
+        root = ET.fromstring(zf.read(rels_part))
+    except KeyError:
+        return {}
+
+    out = {}
+    for rel in root:
+        target = rel.get("Target", "")
+        if rel.get("TargetMode") == "External":
+            continue
+        if target.startswith("/"):
+            member = target.lstrip("/")
+        else:
+            member = posixpath.normpath(posixpath.join(folder, target))
+        out[rel.get("Id")] = (rel.get("Type", ""), member)
+    return out
+
+
+def _workbook_part(zf: zipfile.ZipFile) -> str:
+    for rel_type, member in _rels(zf, "").values():
+        if rel_type.endswith("/officeDocument"):
+            return member
+    return "xl/workbook.xml"
+
+
+def col_number(letters: str) -> int:
+    n = 0
+    for ch in letters:
+        n = n * 26 + (ord(ch) - 64)
+    return n
+
+
+def _dimension(zf: zipfile.ZipFile, part: str) -> tuple[Optional[int], Optional[int]]:
+    # <dimension> precedes <sheetData>, so only the head of the part is read.
+    try:
+        with zf.open(part) as f:
+            for _event, el in ET.iterparse(f, events=("start",)):
+                tag = _local(el.tag)
+                if tag == "dimension":
+                    m = DIMENSION_RE.match(el.get("ref", "").upper())
+                    if not m:
+                        return None, None
+                    col, row = (m.group(3), m.group(4)) if m.group(3) else (m.group(1), m.group(2))
+                    return int(row), col_number(col)
+                if tag == "sheetData":
+                    break
+    except (KeyError, ET.ParseError):
+        pass
+    return None, None
+
+
+def read_sheet_info(path: str) -> list[SheetInfo]:
+    """Sheets of an .xlsx in workbook order, with approximate sizes."""
+    with zipfile.ZipFile(path) as zf:
+        wb_part = _workbook_part(zf)
+        rels = _rels(zf, wb_part)
+        root = ET.fromstring(zf.read(wb_part))
+
+        sheets = []
+        for el in root.iter():
+            if _local(el.tag) != "sheet":
+                continue
+            rid = next((v for k, v in el.attrib.items() if _local(k) == "id" and k.startswith("{")), None)
+            part = rels.get(rid, ("", ""))[1]
+            rows, cols = _dimension(zf, part) if part else (None, None)
+            sheets.append(SheetInfo(el.get("name", ""), el.get("state", "visible"), part, rows, cols))
+        return sheets
+
+
+def part_crc32(path: str, part: str) -> Optional[int]:
+    """CRC32 of one zip member, from the central directory (nothing is decompressed)."""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            return zf.getinfo(part).CRC
+    except KeyError:
+        return None
+
+
+def _workbook_member(zf: zipfile.ZipFile, rel_suffix: str) -> Optional[str]:
+    for rel_type, member in _rels(zf, _workbook_part(zf)).values():
+        if rel_type.endswith(rel_suffix):
+            return member
+    return None
+
+
+def _shared_strings_part(zf: zipfile.ZipFile) -> Optional[str]:
+    return _workbook_member(zf, "/sharedStrings")
+
+
+def _crc(zf: zipfile.ZipFile, member: Optional[str]) -> Optional[int]:
+    if member is None:
+        return None
+    try:
+        return zf.getinfo(member).CRC
+    except KeyError:
+        return None
+
+
+class PartCrcs(NamedTuple):
+    sheet: Optional[int]  # None when the part is missing
+    strings: Optional[int]  # None when the workbook has no shared strings
+    styles: Optional[int]
+
+
+def part_crcs(path: str, part: str) -> PartCrcs:
+    """
+    CRC32s of a sheet part and of the workbook parts its cells depend on:
+    string cells only hold indexes into the shared strings, and number
+    formats in the styles decide which numbers are dates.
+    """
+    with zipfile.ZipFile(path) as zf:
+        return PartCrcs(
+            _crc(zf, part),
+            _crc(zf, _shared_strings_part(zf)),
+            _crc(zf, _workbook_member(zf, "/styles")),
+        )
+
+
+def _between(f, start: bytes, end: bytes):
+    """
+    Chunks of stream `f` from the first `start` (included) up to the next
+    `end` (excluded); nothing when `start` does not occur.
+    """
+    buf = b""
+    while True:
+        chunk = f.read(READ_CHUNK)
+        if not chunk:
+            return
+        buf += chunk
+        i = buf.find(start)
+        if i >= 0:
+            buf = buf[i:]
+            break
+        buf = buf[-(len(start) - 1):]
+
+    keep = len(end) - 1
+    while True:
+        j = buf.find(end)
+        if j >= 0:
+            yield buf[:j]
+            return
+        if len(buf) > keep:
+            yield buf[:-keep]
+            buf = buf[-keep:]
+        chunk = f.read(READ_CHUNK)
+        if not chunk:
+            return
+        buf += chunk
+
+
+def _fingerprint(chunks) -> tuple[int, int]:
+    length = crc = 0
+    for chunk in chunks:
+        length += len(chunk)
+        crc = zlib.crc32(chunk, crc)
+    return length, crc
+
+
+def _after_prefix(chunks, length: int, crc: int) -> Optional[bytes]:
+    """What follows the first `length` bytes of `chunks`, or None unless those match `crc`."""
+    seen = 0
+    got = 0
+    rest = []
+    for chunk in chunks:
+        if seen < length:
+            head = chunk[: length - seen]
+            got = zlib.crc32(head, got)
+            seen += len(head)
+            chunk = chunk[len(head):]
+        if chunk:
+            rest.append(chunk)
+    if seen < length or got != crc:
+        return None
+    return b"".join(rest)
+
+
+# A sheet's rows live in <sheetData>; shared strings are the <si> items of
+# the <sst> part. Both only ever grow at the end when rows are appended
+# (the attributes in front of them, like <dimension> or the string counts,
+# do change, so they are left out).
+ROWS_START, ROWS_END = b"<sheetData>", b"</sheetData>"
+STRINGS_START, STRINGS_END = b"<si>", b"</sst>"
+
+
+class SheetTail(NamedTuple):
+    crc: int  # CRC32 of the sheet part this was taken from
+    rows_len: int  # bytes of its <sheetData> content
+    rows_crc: int
+    strings_len: int  # bytes of the shared string items
+    strings_crc: int
+    styles_crc: Optional[int]  # CRC32 of the styles part
+
+
+def sheet_tail(path: str, part: str) -> Optional[SheetTail]:
+    """SheetTail of one sheet, or None when its rows cannot be located."""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            crc = zf.getinfo(part).CRC
+            with zf.open(part) as f:
+                rows = _fingerprint(_between(f, ROWS_START, ROWS_END))
+            strings = (0, 0)
+            sst = _shared_strings_part(zf)
+            if sst is not None:
+                with zf.open(sst) as f:
+                    strings = _fingerprint(_between(f, STRINGS_START, STRINGS_END))
+            styles = _crc(zf, _workbook_member(zf, "/styles"))
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return None
+    if rows[0] == 0:
+        return None
+    return SheetTail(crc, *rows, *strings, styles)
+
+
+def _cells_intact(zf: zipfile.ZipFile, tail: SheetTail) -> bool:
+    # Same styles, and the shared strings the old rows point at unchanged
+    # (strings added after them are fine).
+    if _crc(zf, _workbook_member(zf, "/styles")) != tail.styles_crc:
+        return False
+    sst = _shared_strings_part(zf)
+    if sst is None:
+        return not tail.strings_len
+    with zf.open(sst) as f:
+        return _after_prefix(_between(f, STRINGS_START, STRINGS_END), tail.strings_len, tail.strings_crc) is not None
+
+
+def cells_intact(path: str, tail: SheetTail) -> bool:
+    """Whether rows read when `tail` was taken still read the same from the file's current strings and styles."""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            return _cells_intact(zf, tail)
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return False
+
+
+def appended_rows(path: str, part: str, tail: SheetTail) -> Optional[bytes]:
+    """
+    The <row> elements the sheet now has after everything `tail` covered,
+    or None when it changed in any other way (rows edited or removed,
+    shared strings renumbered, styles changed).
+    """
+    try:
+        with zipfile.ZipFile(path) as zf:
+            if not _cells_intact(zf, tail):
+                return None
+            with zf.open(part) as f:
+                return _after_prefix(_between(f, ROWS_START, ROWS_END), tail.rows_len, tail.rows_crc)
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return None
+
+
+class FileWatcher:
+    """
+    Notices new versions of a file by polling its size and mtime.
+
+    poll() returns the new version's sheets once the file has stopped
+    changing between two polls and reads as a complete workbook (exporters
+    write in several steps); otherwise None.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.stamp = self._stat()
+        self._pending: Optional[tuple[int, int]] = None
+
+    def _stat(self) -> Optional[tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def poll(self) -> Optional[list[SheetInfo]]:
+        st = self._stat()
+        if st is None or st == self.stamp:
+            self._pending = None
+            return None
+        if st != self._pending:
+            self._pending = st
+            return None
+        try:
+            sheets = read_sheet_info(self.path)
+        except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError):
+            return None  # still being written; tried again on the next poll
+        self.stamp = st
+        self._pending = None
+        return sheets
@@ -3,19 +3,49 @@
 Xlsx Row Viewer (Windows-friendly)
 
 Features:
-- Interactive row browsing (LEFT/RIGHT)
+- Interactive row browsing (LEFT/RIGHT); a count first ("250" RIGHT) jumps
+- UP/DOWN, PgUp/PgDn and Home/End scroll through the fields of a wide row
 - TAB cycles URL fields, ENTER opens selected URL in default browser
+- "t" toggles a table of the rows and columns that fit the terminal;
+  ENTER on a row opens it in the row view
+- "/" searches all cells as you type; n/N jump to the next/previous match
+- "f" adds column filters (e.g. "Job Title ~ cto & Email ?"); F clears them
+- "o" opens the URLs of a row range (e.g. "100-150") among the filtered rows,
+  a few per second in the background; x stops it
+- Reloads by itself when the file is saved again, keeping the row shown
 - If no XLSX path is provided, opens a file picker
 """
 
 import argparse
+import bisect
+import queue
 import re
 import sys
-import webbrowser
+import time
 from typing import List, Tuple, Optional
 
+import numpy as np
 import pandas as pd
 
+from xlsx_cache import DEFAULT_DISK_CACHE_MB, open_disk_cache
+from xlsx_meta import FileWatcher, SheetInfo
+from xlsx_data import (
+    URL_RE,
+    ColumnFilter,
+    LoadedSheet,
+    RowPrefetcher,
+    RowStore,
+    SheetLoadJob,
+    UrlBatch,
+    UrlIndex,
+    UrlLauncher,
+    WorkbookHandle,
+    frame_row,
+    parse_row_spec,
+    step_row,
+    view_position,
+)
+
 # curses is stdlib on macOS/Linux; on Windows you need `windows-curses` at build time and runtime (but runtime is bundled into the exe).
 try:
     import curses
@@ -29,25 +59,21 @@ except Exception as e:
     raise
 
 
-URL_RE = re.compile(r"(?i)\bhttps?://[^\s<>\"]+|www\.[^\s<>\"]+")
+# Not every curses build defines KEY_TAB; a plain TAB arrives as 9.
+KEY_TAB = getattr(curses, "KEY_TAB", 9)
 
+# While a sheet is still streaming in, getch() waits at most this long so
+# newly parsed rows are picked up.
+LOAD_POLL_MS = 100
 
-def is_nan(x) -> bool:
-    try:
-        return pd.isna(x)
-    except Exception:
-        return False
+# How often the open file is checked for a newer version while idle.
+WATCH_MS = 1000
 
-
-def to_str(x) -> str:
-    if is_nan(x):
-        return ""
-    try:
-        if isinstance(x, float) and x.is_integer():
-            return str(int(x))
-        return str(x)
-    except Exception:
-        return repr(x)
+# Table mode: column widths come from the label and this many rows spread
+# over the sheet, between TABLE_MIN_WIDTH and TABLE_MAX_WIDTH characters.
+TABLE_SAMPLE_ROWS = 500
+TABLE_MIN_WIDTH = 4
+TABLE_MAX_WIDTH = 30
 
 
 def normalize_url(s: str) -> Optional[str]:
@@ -82,111 +108,778 @@ def pick_file_dialog() -> Optional[str]:
     return path or None
 
 
-def load_xlsx(path: str, sheet: str) -> pd.DataFrame:
-    sheet_name = int(sheet) if str(sheet).isdigit() else sheet
-    return pd.read_excel(path, sheet_name=sheet_name, engine="openpyxl")
-
-
-def row_lines(df: pd.DataFrame, row_idx: int) -> Tuple[List[Tuple[str, str, Optional[str]]], List[int]]:
-    row = df.iloc[row_idx]
+def sheet_arg(sheet: str):
+    return int(sheet) if str(sheet).isdigit() else sheet
+
+
+class StreamedSheet:
+    """
+    Rows of a sheet that a SheetLoadJob is still parsing (call start()).
+
+    Chunks are kept separately and only concatenated into `df` when a row
+    from them is needed; once the job finishes, `df` is its final frame.
+    """
+
+    def __init__(self, book: WorkbookHandle, sheet, dropna_rows: bool = False):
+        self.dropna_rows = dropna_rows
+        self.job = SheetLoadJob(book, sheet, stream=True, prepare=self.prepare)
+        self.df = pd.DataFrame()
+        self.urls: Optional[UrlIndex] = None
+        self.rows: Optional[RowStore] = None  # display strings, once loaded
+        self.loaded: Optional[LoadedSheet] = None
+        self.loading = True
+        self.rows_read = 0
+        self.reload_error = ""  # why the last reload kept the old rows
+        self._chunks: List[pd.DataFrame] = []
+        self._chunk_rows = 0
+
+    def _clean(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.dropna_rows:
+            df = df.dropna(how="all")
+        return df.reset_index(drop=True)
+
+    def prepare(self, df: pd.DataFrame) -> LoadedSheet:
+        # Runs on the loader thread once the whole sheet is parsed.
+        return LoadedSheet.prepare(self._clean(df), url_mode="search")
+
+    def start(self):
+        self.job.start()
+
+    def reload(self, sheets: List[SheetInfo]):
+        """
+        Load the sheet again from a newer version of its file. The rows
+        loaded so far stay until that is done; an unchanged sheet is reused
+        and one that only grew gets just its new rows parsed.
+        """
+        old = self.job
+        old.cancel()
+        book = WorkbookHandle(old.book.path, sheets=sheets, disk_cache=old.book.disk_cache)
+        streaming = self.loaded is None
+        self.job = SheetLoadJob(book, old.sheet_name, stream=streaming, prepare=self.prepare, previous=self.loaded)
+        if streaming:
+            self.df = pd.DataFrame()
+            self._chunks = []
+            self._chunk_rows = 0
+        self.loading = True
+        self.reload_error = ""
+        self.job.start()
+        old.book.close()
+
+    @property
+    def reloading(self) -> bool:
+        return self.loading and self.loaded is not None
+
+    def cancel(self):
+        self.job.cancel()
+
+    def poll(self):
+        while self.loading:
+            try:
+                msg = self.job.messages.get_nowait()
+            except queue.Empty:
+                return
+
+            if msg[0] == "progress":
+                self.rows_read = msg[1]
+            elif msg[0] == "rows":
+                chunk = self._clean(msg[1])
+                self._chunks.append(chunk)
+                self._chunk_rows += len(chunk)
+            elif msg[0] == "done":
+                self.loaded = msg[1]
+                self.df = msg[1].df
+                self.urls = msg[1].urls
+                self.rows = msg[1].rows
+                self.loaded.build_search_async()
+                self._chunks = []
+                self._chunk_rows = 0
+                self.loading = False
+            else:
+                self.loading = False
+                if self.loaded is None:
+                    raise msg[1]
+                self.reload_error = f"reload failed: {msg[1]}"
+
+    @property
+    def search(self):
+        return self.loaded.search if self.loaded is not None else None
+
+    def __len__(self) -> int:
+        return len(self.df) + self._chunk_rows
+
+    def frame_for(self, row_idx: int) -> pd.DataFrame:
+        if row_idx >= len(self.df) and self._chunks:
+            self.df = pd.concat([self.df, *self._chunks], ignore_index=True)
+            self._chunks = []
+            self._chunk_rows = 0
+        return self.df
+
+
+class SearchPrompt:
+    """The "/" search: the query being typed and the rows matching it."""
+
+    def __init__(self):
+        self.editing = False
+        self.query = ""
+        self.hits: Optional[np.ndarray] = None
+        self.origin = 0
+
+    def start(self, row_idx: int):
+        self.editing = True
+        self.query = ""
+        self.hits = None
+        self.origin = row_idx
+
+    def update(self, sheet: StreamedSheet, view: Optional[np.ndarray] = None):
+        # A lookup in the sheet's SearchIndex; None while it is being built.
+        index = sheet.search
+        if index is None or not self.query.strip():
+            self.hits = None
+        else:
+            self.hits = index.rows(self.query)
+            if view is not None:
+                self.hits = np.intersect1d(self.hits, view, assume_unique=True)
+
+    def waiting(self, sheet: StreamedSheet) -> bool:
+        return bool(self.query.strip()) and sheet.search is None
+
+    def step(self, row_idx: int, forward: bool = True, inclusive: bool = False) -> Optional[int]:
+        """Row of the next (or previous) hit from row_idx, wrapping around."""
+        hits = self.hits
+        if hits is None or len(hits) == 0:
+            return None
+        if forward:
+            i = int(np.searchsorted(hits, row_idx, side="left" if inclusive else "right"))
+        else:
+            i = int(np.searchsorted(hits, row_idx, side="left")) - 1
+        return int(hits[i % len(hits)])
+
+    def status(self, sheet: StreamedSheet, row_idx: int) -> str:
+        if self.editing:
+            if self.waiting(sheet):
+                found = "indexing…"
+            elif self.hits is None:
+                found = ""
+            else:
+                found = f"{len(self.hits):,} matching rows"
+            return f"/{self.query}  {found}  (ENTER keep, ESC cancel)"
+        if self.hits is None:
+            return ""
+        if len(self.hits) == 0:
+            return f"No matches for '{self.query}'"
+        i = int(np.searchsorted(self.hits, row_idx))
+        at = f"{i + 1}/{len(self.hits):,}" if i < len(self.hits) and self.hits[i] == row_idx else f"-/{len(self.hits):,}"
+        return f"Match {at} for '{self.query}' (n/N next/prev)"
+
+
+# Line breaks, tabs and other control characters in a cell; a screen line
+# shows them as one space.
+CONTROL_RE = re.compile(r"[\x00-\x1f\x7f]+")
+
+FILTER_RE = re.compile(r"^(?P<col>.+?)\s*(?P<op>[~=^])\s*(?P<val>.*)$|^(?P<col2>.+?)\s*(?P<op2>[?!])$")
+FILTER_SYMBOLS = {"~": "contains", "=": "equals", "^": "starts with", "?": "not empty", "!": "empty"}
+
+
+def parse_filters(text: str, columns: List[str]) -> List[ColumnFilter]:
+    """
+    Parse the "f" command: filters joined by "&", each one of
+    "Column ~ text" (contains), "Column = text" (equals), "Column ^ text"
+    (starts with), "Column ?" (not empty) or "Column !" (empty).
+    Column names are matched case-insensitively.
+    """
+    by_lower = {c.lower(): c for c in columns}
+    filters = []
+    for part in text.split("&"):
+        part = part.strip()
+        if not part:
+            continue
+        m = FILTER_RE.match(part)
+        if not m:
+            raise ValueError(f"Cannot parse filter: {part}")
+        col = (m.group("col") or m.group("col2")).strip()
+        op = FILTER_SYMBOLS[m.group("op") or m.group("op2")]
+        if col.lower() not in by_lower:
+            raise ValueError(f"No column named '{col}'")
+        filters.append(ColumnFilter(by_lower[col.lower()], op, (m.group("val") or "").strip()))
+    return filters
+
+
+class Screen:
+    """
+    The viewer's layout: header, body and footer windows over stdscr.
+
+    Each window keeps the lines it shows, so show() rewrites only the lines
+    that changed and sends the three windows out with one doupdate().
+    Keys are still read from stdscr, which is never drawn on.
+    """
+
+    def __init__(self, stdscr):
+        self.stdscr = stdscr
+        self.layout()
+
+    def layout(self):
+        """(Re)build the windows for the current terminal size."""
+        self.h, self.w = self.stdscr.getmaxyx()
+        body_h = max(1, self.h - 2)
+        self.header = curses.newwin(1, self.w, 0, 0)
+        self.body = curses.newwin(body_h, self.w, min(1, self.h - 1), 0)
+        self.footer = curses.newwin(1, self.w, max(0, self.h - 1), 0)
+        self._lines = {win: [] for win in (self.header, self.body, self.footer)}
+        # stdscr is touched on start and on resize; refreshed as it is (blank)
+        # so a later getch() does not repaint it over the windows.
+        self.stdscr.noutrefresh()
+
+    @property
+    def body_lines(self) -> int:
+        return self.body.getmaxyx()[0]
+
+    def _put(self, win, lines: List[Tuple[str, int]]):
+        height = win.getmaxyx()[0]
+        # One screen line each: a newline in a value would run into the next
+        # line, which then no longer matches what _lines says it shows.
+        lines = [(CONTROL_RE.sub(" ", text), attr) for text, attr in lines[:height]]
+        lines += [("", curses.A_NORMAL)] * (height - len(lines))
+        shown = self._lines[win]
+        for y, line in enumerate(lines):
+            if y < len(shown) and shown[y] == line:
+                continue
+            text, attr = line
+            win.move(y, 0)
+            win.clrtoeol()
+            if text:
+                try:
+                    win.addnstr(y, 0, text, self.w - 1, attr)
+                except curses.error:
+                    pass  # wide characters past the last column of the window
+        self._lines[win] = lines
+        win.noutrefresh()
+
+    def show(self, header: str, body: List[Tuple[str, int]], footer: str):
+        self._put(self.header, [(header, curses.A_BOLD)])
+        self._put(self.body, body)
+        self._put(self.footer, [(footer, curses.A_DIM)])
+        curses.doupdate()
+
+    def read_line(self, prompt: str, hint: str = "") -> str:
+        """
+        Read a line typed after `prompt` on the footer line. `hint` (the
+        syntax, say) goes on the line above it, so a short prompt leaves
+        most of the width for the input.
+        """
+        if hint:
+            y = self.body_lines - 1
+            self.body.move(y, 0)
+            self.body.clrtoeol()
+            self.body.addnstr(y, 0, hint, self.w - 1, curses.A_DIM)
+            self._lines[self.body][y:y + 1] = [("", -1)]  # repainted by the next show()
+            self.body.noutrefresh()
+        self.footer.erase()
+        self.footer.addnstr(0, 0, prompt, self.w - 1)
+        self._lines[self.footer] = []  # repainted by the next show()
+        curses.doupdate()
+        curses.echo()
+        curses.curs_set(1)
+        try:
+            raw = self.footer.getstr(0, min(len(prompt), self.w - 2), max(1, self.w - len(prompt) - 1))
+        finally:
+            curses.noecho()
+            curses.curs_set(0)
+        return raw.decode("utf-8", "replace")
+
+
+def row_lines(
+    df: pd.DataFrame, row_idx: int, urls: Optional[UrlIndex] = None, rows: Optional[RowStore] = None
+) -> Tuple[List[Tuple[str, str, Optional[str]]], List[int]]:
+    # `urls` and `rows` are the sheet's prebuilt index and display strings;
+    # without them (while the sheet is still streaming in) the row is
+    # formatted from the frame and every value is scanned with normalize_url.
+    if rows is not None:
+        labels, values = rows.labels, rows.row(row_idx)
+    else:
+        labels, values = [str(c) for c in df.columns], frame_row(df, row_idx)
     lines = []
     url_line_indices = []
-    for col in df.columns:
-        val_s = to_str(row[col])
-        url = normalize_url(val_s)
+    for j, (col, val_s) in enumerate(zip(labels, values)):
+        val_s = val_s or ""
+        url = urls.url(row_idx, j) if urls is not None else normalize_url(val_s)
         shown = val_s if val_s != "" else "(empty)"
-        lines.append((str(col), shown, url))
+        lines.append((col, shown, url))
         if url:
             url_line_indices.append(len(lines) - 1)
     return lines, url_line_indices
 
 
-def draw(stdscr, title: str, df: pd.DataFrame, row_idx: int, url_focus_i: int) -> int:
-    stdscr.erase()
-    h, w = stdscr.getmaxyx()
-
-    header = f"{title} | Row {row_idx+1}/{len(df)}  (LEFT/RIGHT rows, TAB URL, ENTER open, q quit)"
-    stdscr.addnstr(0, 0, header, w - 1, curses.A_BOLD)
-
-    if len(df) == 0:
-        stdscr.addnstr(2, 0, "DataFrame is empty.", w - 1)
-        stdscr.refresh()
-        return 0
-
-    lines, url_line_indices = row_lines(df, row_idx)
+def draw(
+    screen: Screen,
+    title: str,
+    df: pd.DataFrame,
+    row_idx: int,
+    url_focus_i: int,
+    loading: bool = False,
+    urls: Optional[UrlIndex] = None,
+    note: str = "",
+    view: Optional[np.ndarray] = None,
+    rows: Optional[RowStore] = None,
+    fields: Optional[Tuple[List[Tuple[str, str, Optional[str]]], List[int]]] = None,
+    top: int = 0,
+    follow_focus: bool = False,
+) -> Tuple[int, int]:
+    """
+    Show the fields from line `top` on, as many as fit. Returns the URL focus
+    and top line actually used: with `follow_focus` (after TAB) the fields
+    scroll to the focused URL, otherwise the focus moves to the first URL
+    on screen when it is scrolled off.
+    """
+    # `fields` is the row_lines() result when it was already prepared.
+    keys = "(LEFT/RIGHT rows, TAB URL, ENTER open, o open rows, / search, f filter, q quit)"
+    pos = view_position(view, row_idx) if view is not None else None
+    if view is None:
+        total = "?" if loading else len(df)
+        header = f"{title} | Row {row_idx+1}/{total}  {keys}"
+    elif pos is None:
+        header = f"{title} | No rows match the filters  {keys}"
+    else:
+        header = f"{title} | Row {pos+1}/{len(view)} (sheet row {row_idx+1}/{len(df)}, filtered)  {keys}"
+
+    if len(df) == 0 or (view is not None and pos is None):
+        if view is not None:
+            message = "No rows match the filters."
+        else:
+            message = "Loading…" if loading else "DataFrame is empty."
+        screen.show(header, [("", curses.A_NORMAL), (message, curses.A_NORMAL)], note)
+        return 0, top
+
+    lines, url_line_indices = fields if fields is not None else row_lines(df, row_idx, urls, rows)
+
+    # A blank line under the header, the fields, and a line over the footer
+    # saying which fields are shown when not all of them fit.
+    height = max(1, screen.body_lines - 2)
+    top = max(0, min(top, len(lines) - height))
 
     focused_line = -1
     if url_line_indices:
         url_focus_i = max(0, min(url_focus_i, len(url_line_indices) - 1))
         focused_line = url_line_indices[url_focus_i]
-
-    y = 2
-    for i, (col, shown, url) in enumerate(lines):
-        if y >= h - 2:
-            stdscr.addnstr(y, 0, "... (more columns not shown) ...", w - 1)
-            y += 1
-            break
-
+        if not top <= focused_line < top + height:
+            if follow_focus:
+                top = focused_line if focused_line < top else focused_line - height + 1
+            else:
+                first = bisect.bisect_left(url_line_indices, top)
+                if first < len(url_line_indices) and url_line_indices[first] < top + height:
+                    url_focus_i = first
+                    focused_line = url_line_indices[first]
+
+    # Only the visible slice is formatted, whatever the column count.
+    body = [("", curses.A_NORMAL)]
+    for i, (col, shown, url) in enumerate(lines[top:top + height], start=top):
         prefix = f"{col}: "
         suffix = "  [URL]" if url else ""
-        line = prefix + shown + suffix
-
         attr = curses.A_REVERSE if (i == focused_line and url is not None) else curses.A_NORMAL
-        stdscr.addnstr(y, 0, line, w - 1, attr)
-        y += 1
+        body.append((prefix + shown + suffix, attr))
+    if len(lines) > height:
+        last = min(top + height, len(lines))
+        body.append((f"fields {top + 1}-{last} of {len(lines)}  (UP/DOWN, PgUp/PgDn, Home/End scroll)", curses.A_DIM))
 
     footer = (
         "No URL in this row."
         if not url_line_indices
         else f"Selected URL field: {lines[url_line_indices[url_focus_i]][0]}  |  ENTER opens in your browser"
     )
-    stdscr.addnstr(h - 1, 0, footer, w - 1, curses.A_DIM)
-
-    stdscr.refresh()
-    return url_focus_i
-
-
-def interactive(stdscr, df: pd.DataFrame, title: str):
+    if note:
+        footer = f"{note}  |  {footer}"
+    screen.show(header, body, footer)
+    return url_focus_i, top
+
+
+def column_widths(rows: RowStore) -> List[int]:
+    """Table column widths of a loaded sheet, from a sample of its rows (computed once per load)."""
+    sample = np.unique(np.linspace(0, len(rows) - 1, min(TABLE_SAMPLE_ROWS, len(rows))).astype(np.int64))
+    widths = []
+    for label, values, missing in zip(rows.labels, rows.values, rows.missing):
+        cells = values[sample][~missing[sample]]
+        longest = max((len(s) for s in cells), default=0)
+        widths.append(max(TABLE_MIN_WIDTH, min(TABLE_MAX_WIDTH, max(len(label), longest))))
+    return widths
+
+
+def fit_cell(s: str, width: int) -> str:
+    # One line per cell: newlines and runs of spaces collapse.
+    s = " ".join(s.split())
+    return s[:width - 1] + "…" if len(s) > width else s.ljust(width)
+
+
+def draw_table(
+    screen: Screen,
+    title: str,
+    rows: RowStore,
+    widths: List[int],
+    row_idx: int,
+    top: int,
+    left: int,
+    view: Optional[np.ndarray] = None,
+    note: str = "",
+) -> Tuple[int, int]:
+    """
+    Show the table window starting at row position `top` (in `view` when
+    set) and column `left`, scrolled so `row_idx` is on screen. Only the
+    cells of that window are fetched, so a frame costs the same for any
+    sheet size. Returns the top and left actually used.
+    """
+    keys = "(UP/DOWN rows, LEFT/RIGHT columns, ENTER row view, t table off, / search, f filter, q quit)"
+    n = len(view) if view is not None else len(rows)
+    pos = view_position(view, row_idx) if view is not None else row_idx
+    if pos is None:
+        message = "No rows match the filters."
+        screen.show(f"{title} | {message}  {keys}", [("", curses.A_NORMAL), (message, curses.A_NORMAL)], note)
+        return top, left
+    filtered = " filtered" if view is not None else ""
+    header = f"{title} | Row {pos + 1}/{n}{filtered} (sheet row {row_idx + 1}), table  {keys}"
+
+    # Column labels, the rows, and a line saying which part is shown.
+    height = max(1, screen.body_lines - 2)
+    if pos < top:
+        top = pos
+    elif pos >= top + height:
+        top = pos - height + 1
+    top = max(0, min(top, n - height))
+
+    n_cols = len(rows.labels)
+    left = max(0, min(left, n_cols - 1))
+    gutter = len(str(len(rows)))
+    x = gutter + 1
+    right = left
+    while right < n_cols and (right == left or x + widths[right] < screen.w):
+        x += widths[right] + 2
+        right += 1
+    shown = range(left, right)
+
+    positions = np.arange(top, min(top + height, n), dtype=np.int64)
+    sheet_rows = view[positions] if view is not None else positions
+    body = [(" " * (gutter + 1) + "  ".join(fit_cell(rows.labels[j], widths[j]) for j in shown), curses.A_BOLD)]
+    for r, cells in zip(sheet_rows.tolist(), rows.block(sheet_rows, shown)):
+        line = f"{r + 1:>{gutter}} " + "  ".join(fit_cell(s, widths[j]) for j, s in zip(shown, cells))
+        body.append((line, curses.A_REVERSE if r == row_idx else curses.A_NORMAL))
+    body.append((
+        f"rows {top + 1}-{top + len(positions)} of {n}, columns {left + 1}-{right} of {n_cols}",
+        curses.A_DIM,
+    ))
+
+    footer = "ENTER opens the row in the row view"
+    if note:
+        footer = f"{note}  |  {footer}"
+    screen.show(header, body, footer)
+    return top, left
+
+
+def drain_keys(stdscr, moves: dict) -> int:
+    """
+    Sum of moves[key] over the keys already waiting, read without blocking
+    up to the first key not in `moves` (which is put back). Held keys on a
+    slow terminal arrive faster than frames are drawn; this lets one frame
+    cover all of them.
+    """
+    total = 0
+    stdscr.timeout(0)
+    while True:
+        ch = stdscr.getch()
+        if ch not in moves:
+            if ch != -1:
+                curses.ungetch(ch)
+            return total
+        total += moves[ch]
+
+
+def jump_row(view: Optional[np.ndarray], n_rows: int, row: int, delta: int) -> int:
+    """step_row(), but stopping at the first or last row instead of not moving."""
+    target = step_row(view, n_rows, row, delta)
+    if target is not None:
+        return target
+    if view is None:
+        return max(0, min(n_rows - 1, row + delta))
+    if not len(view):
+        return row
+    return int(view[-1] if delta > 0 else view[0])
+
+
+def interactive(stdscr, sheet: StreamedSheet, title: str, watcher: Optional[FileWatcher] = None):
     curses.curs_set(0)
     stdscr.keypad(True)
-
-    if len(df) == 0:
-        draw(stdscr, title, df, 0, 0)
-        stdscr.getch()
-        return
+    if hasattr(curses, "set_escdelay"):
+        curses.set_escdelay(25)
+    screen = Screen(stdscr)
 
     row_idx = 0
     url_focus_i = 0
+    field_top = 0  # first field line shown; kept across rows
+    follow_focus = False  # scroll the fields to the URL focus (after TAB)
+    table_mode = False
+    table_top = table_left = 0  # first row position and column of the table
+    widths: Optional[List[int]] = None  # table column widths of `shown`, once needed
+    search = SearchPrompt()
+    filters: List[ColumnFilter] = []
+    view: Optional[np.ndarray] = None  # sorted rows passing the filters
+    filter_note = ""
+    # Row models (row_lines results) by sheet row, shared by draw, TAB and
+    # ENTER; once the sheet is loaded the rows next to the shown one are
+    # also built while no key is waiting. Kept until the rows they were
+    # built from change.
+    prefetch: Optional[RowPrefetcher] = None
+    models_for = None  # (job, LoadedSheet) the models were built from
+    shown = None  # the LoadedSheet view and search belong to
+    launcher = UrlLauncher()
+    batch: Optional[UrlBatch] = None  # URLs being opened by "o"
+    next_watch = 0.0
+    count = 0  # digits typed before an arrow key
 
     while True:
-        url_focus_i = draw(stdscr, title, df, row_idx, url_focus_i)
-        ch = stdscr.getch()
+        if watcher is not None and time.monotonic() >= next_watch:
+            # At most once a WATCH_MS so "settled" means the same size and
+            # mtime a while apart, not just between two key presses.
+            next_watch = time.monotonic() + WATCH_MS / 1000
+            sheets = watcher.poll()
+            if sheets:
+                sheet.reload(sheets)
+        sheet.poll()
+        if sheet.loaded is not shown:
+            # Loaded, or reloaded after the file changed: the row stays put
+            # and the filters are evaluated again.
+            shown = sheet.loaded
+            widths = None
+            if shown is not None:
+                try:
+                    view = shown.filter_rows(filters) if filters else None
+                except ValueError as e:
+                    filters, view, filter_note = [], None, str(e)
+                search.update(sheet, view)
+        if (sheet.job, sheet.loaded) != models_for:
+            # While streaming, rows come from the frame (and chunks only
+            # ever append); a finished or restarted load replaces them.
+            models_for = (sheet.job, sheet.loaded)
+            prefetch = RowPrefetcher(
+                lambda i: row_lines(sheet.frame_for(i), i, sheet.urls, sheet.rows), len(sheet), view
+            )
+        prefetch.n_rows = len(sheet)
+        row_idx = min(row_idx, max(0, len(sheet) - 1))
+        if not sheet.loading and len(sheet) == 0:
+            draw(screen, title, sheet.df, 0, 0)
+            stdscr.timeout(-1)
+            stdscr.getch()
+            return
+
+        if search.waiting(sheet) and sheet.search is not None:
+            search.update(sheet, view)
+            hit = search.step(search.origin, inclusive=True)
+            if search.editing:
+                row_idx = hit if hit is not None else search.origin
+
+        df = sheet.frame_for(row_idx)
+        reload_note = "file changed, reloading…" if sheet.reloading else sheet.reload_error
+        url_note = ""
+        if batch is not None and not batch.finished:
+            url_note = f"opening URLs {batch.opened:,}/{len(batch.urls):,} (x stops)"
+        count_note = f"{count}→ (arrow jumps, ESC cancels)" if count else ""
+        notes = (count_note, search.status(sheet, row_idx), filter_note, reload_note, url_note)
+        note = "  |  ".join(n for n in notes if n)
+        if table_mode and sheet.rows is not None:
+            fields = None
+            if widths is None:
+                widths = column_widths(sheet.rows)
+            table_top, table_left = draw_table(
+                screen, title, sheet.rows, widths, row_idx, table_top, table_left, view=view, note=note
+            )
+        else:
+            fields = prefetch.get(row_idx) if len(df) else None
+            url_focus_i, field_top = draw(
+                screen, title, df, row_idx, url_focus_i, top=field_top, follow_focus=follow_focus,
+                loading=sheet.loading and not sheet.reloading, urls=sheet.urls, note=note, view=view, rows=sheet.rows, fields=fields,
+            )
+            follow_focus = False
+
+        ch = -1
+        if sheet.loaded is not None and not table_mode:
+            # One row at a time, checking for a key in between.
+            stdscr.timeout(0)
+            while ch == -1 and prefetch.prefetch_one():
+                ch = stdscr.getch()
+        if ch == -1:
+            polling = sheet.loading or search.waiting(sheet) or (batch is not None and not batch.finished)
+            stdscr.timeout(LOAD_POLL_MS if polling else WATCH_MS if watcher is not None else -1)
+            ch = stdscr.getch()
+
+        if ch == -1:
+            continue
+
+        if ch == curses.KEY_RESIZE:
+            # A window drag sends a burst of these: lay out once, for the last size.
+            stdscr.timeout(0)
+            ch = stdscr.getch()
+            while ch == curses.KEY_RESIZE:
+                ch = stdscr.getch()
+            if ch != -1:
+                curses.ungetch(ch)
+            screen.layout()
+            continue
+
+        if search.editing:
+            # Typing a "/" query: results update on every key.
+            if ch == 27:  # ESC
+                search.editing = False
+                search.hits = None
+                row_idx = search.origin
+                continue
+            if ch in (curses.KEY_ENTER, 10, 13):
+                search.editing = False
+                continue
+            if ch in (curses.KEY_BACKSPACE, 127, 8):
+                search.query = search.query[:-1]
+            elif 32 <= ch < 0x110000 and chr(ch).isprintable():
+                search.query += chr(ch)
+            else:
+                continue
+            search.update(sheet, view)
+            hit = search.step(search.origin, inclusive=True)
+            row_idx = hit if hit is not None else search.origin
+            url_focus_i = 0
+            continue
+
+        if ord("0") <= ch <= ord("9") and (count or ch != ord("0")):
+            count = min(count * 10 + ch - ord("0"), 10**9)
+            continue
+        steps, count = count or 1, 0
 
         if ch in (ord("q"), ord("Q")):
             break
 
-        if ch == curses.KEY_RIGHT:
-            if row_idx < len(df) - 1:
-                row_idx += 1
+        if ch == ord("/"):
+            search.start(row_idx)
+            continue
+
+        if ch == ord("f"):
+            if sheet.loaded is None:
+                filter_note = "Filters are available once the sheet has loaded."
+                continue
+            text = screen.read_line(
+                "filter: ", "Col ~ text contains, = equals, ^ starts with; Col ? not empty, ! empty; & joins"
+            )
+            if not text.strip():
+                continue
+            try:
+                new_filters = filters + parse_filters(text, [str(c) for c in sheet.df.columns])
+                # Narrow a row-position array; the frame itself is not copied.
+                view = sheet.loaded.filter_rows(new_filters)
+            except ValueError as e:
+                filter_note = str(e)
+                continue
+            filters = new_filters
+            prefetch.view = view
+            filter_note = "filter: " + " AND ".join(f.describe() for f in filters) + f" ({len(view):,} rows, F clears)"
+            if len(view) and view_position(view, row_idx) is None:
+                row_idx = int(view[min(int(np.searchsorted(view, row_idx)), len(view) - 1)])
                 url_focus_i = 0
-
-        elif ch == curses.KEY_LEFT:
-            if row_idx > 0:
-                row_idx -= 1
+            search.update(sheet, view)
+            continue
+
+        if ch == ord("o"):
+            if sheet.loaded is None:
+                filter_note = "URLs can be opened across rows once the sheet has loaded."
+                continue
+            shown_rows = "filtered rows" if view is not None else "rows"
+            text = screen.read_line("open URLs of rows: ", f"e.g. 100-150, 200, 300- (empty = all {shown_rows})")
+            try:
+                rows = parse_row_spec(text, len(sheet))
+            except ValueError as e:
+                filter_note = str(e)
+                continue
+            if view is not None:
+                rows = np.intersect1d(rows, view, assume_unique=True)
+            if batch is not None:
+                batch.cancel()
+            batch = launcher.open(sheet.urls.collect(rows))
+            if not batch.urls:
+                filter_note = "No URLs in those rows."
+            continue
+
+        if ch == ord("x") and batch is not None:
+            batch.cancel()
+            continue
+
+        if ch == ord("F"):
+            filters = []
+            view = None
+            prefetch.view = None
+            filter_note = ""
+            search.update(sheet, view)
+            continue
+
+        if ch in (ord("n"), ord("N")):
+            hit = search.step(row_idx, forward=(ch == ord("n")))
+            if hit is not None:
+                row_idx = hit
                 url_focus_i = 0
-
-        elif ch in (curses.KEY_TAB, 9):  # TAB
-            _, url_line_indices = row_lines(df, row_idx)
+            continue
+
+        if ch == ord("t"):
+            if sheet.rows is None:
+                filter_note = "The table is available once the sheet has loaded."
+            else:
+                table_mode = not table_mode
+            continue
+
+        if table_mode:
+            page = max(1, screen.body_lines - 2)
+            if ch in (curses.KEY_UP, curses.KEY_DOWN, curses.KEY_PPAGE, curses.KEY_NPAGE):
+                moves = {curses.KEY_UP: -1, curses.KEY_DOWN: 1, curses.KEY_PPAGE: -page, curses.KEY_NPAGE: page}
+                delta = moves[ch] * steps + drain_keys(stdscr, moves)
+                row_idx = jump_row(view, len(sheet), row_idx, delta)
+            elif ch in (curses.KEY_HOME, curses.KEY_END):
+                row_idx = jump_row(view, len(sheet), row_idx, len(sheet) if ch == curses.KEY_END else -len(sheet))
+            elif ch in (curses.KEY_RIGHT, curses.KEY_LEFT):
+                delta = steps if ch == curses.KEY_RIGHT else -steps
+                table_left = max(0, table_left + delta + drain_keys(stdscr, {curses.KEY_RIGHT: 1, curses.KEY_LEFT: -1}))
+            elif ch in (curses.KEY_ENTER, 10, 13):
+                table_mode = False
+            url_focus_i = 0
+            continue
+
+        if ch in (curses.KEY_RIGHT, curses.KEY_LEFT):
+            # Every arrow already waiting moves too; only the row they land
+            # on is drawn.
+            delta = steps if ch == curses.KEY_RIGHT else -steps
+            delta += drain_keys(stdscr, {curses.KEY_RIGHT: 1, curses.KEY_LEFT: -1})
+            if delta:
+                target = jump_row(view, len(sheet), row_idx, delta)
+                if target != row_idx:
+                    row_idx = target
+                    url_focus_i = 0
+
+        elif len(df) == 0:
+            continue
+
+        elif ch in (curses.KEY_UP, curses.KEY_DOWN, curses.KEY_PPAGE, curses.KEY_NPAGE):
+            # draw() clamps the top line to the row's field count.
+            page = max(1, screen.body_lines - 2)
+            moves = {curses.KEY_UP: -1, curses.KEY_DOWN: 1, curses.KEY_PPAGE: -page, curses.KEY_NPAGE: page}
+            field_top = max(0, field_top + moves[ch] * steps)
+
+        elif ch == curses.KEY_HOME:
+            field_top = 0
+
+        elif ch == curses.KEY_END:
+            field_top = len(fields[0]) if fields is not None else 0
+
+        elif ch in (KEY_TAB, 9):  # TAB
+            _, url_line_indices = fields
             if url_line_indices:
                 url_focus_i = (url_focus_i + 1) % len(url_line_indices)
+                follow_focus = True
 
         elif ch in (curses.KEY_ENTER, 10, 13):  # ENTER
-            lines, url_line_indices = row_lines(df, row_idx)
+            lines, url_line_indices = fields
             if url_line_indices:
                 focused_line = url_line_indices[url_focus_i]
                 _, _, url = lines[focused_line]
                 if url:
-                    webbrowser.open(url, new=2)
+                    launcher.open_one(url)
 
 
 def main():
@@ -194,6 +887,10 @@ def main():
     ap.add_argument("xlsx", nargs="?", default=None, help="Path to .xlsx file (optional; opens picker if omitted)")
     ap.add_argument("--sheet", default="0", help="Sheet name or 0-based sheet index (default: 0)")
     ap.add_argument("--dropna-rows", action="store_true", help="Drop rows that are entirely empty")
+    ap.add_argument(
+        "--disk-cache-mb", type=int, default=DEFAULT_DISK_CACHE_MB,
+        help=f"Size cap of the on-disk cache of parsed sheets, 0 disables it (default: {DEFAULT_DISK_CACHE_MB})",
+    )
     args = ap.parse_args()
 
     path = args.xlsx
@@ -203,12 +900,16 @@ def main():
             print("No file selected. Exiting.")
             return
 
-    df = load_xlsx(path, args.sheet)
-    if args.dropna_rows:
-        df = df.dropna(how="all").reset_index(drop=True)
+    # Rows are shown as soon as they are parsed; the rest keeps loading.
+    book = WorkbookHandle(path, disk_cache=open_disk_cache(args.disk_cache_mb))
+    sheet = StreamedSheet(book, sheet_arg(args.sheet), dropna_rows=args.dropna_rows)
+    sheet.start()
 
     title = f"{path} | sheet={args.sheet}"
-    curses.wrapper(lambda stdscr: interactive(stdscr, df, title))
+    try:
+        curses.wrapper(lambda stdscr: interactive(stdscr, sheet, title, FileWatcher(path)))
+    finally:
+        sheet.cancel()
 
 
 if __name__ == "__main__":
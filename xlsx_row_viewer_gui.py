@@ -5,18 +5,121 @@ Xlsx Row Viewer (Tkinter GUI)
 - Font: Palatino-ish (best-effort) + 1.5x larger
 - Window: 1920x1080
 - Values: larger, selectable, right-click -> Copy (clipboard), paste anywhere
-- Sheet selector + file picker
+- Sheet selector + file picker; each workbook opens in its own tab
 - URL values: Open URL button
+- Window and sheet list appear before pandas/openpyxl are imported (--timings)
 """
 
+from __future__ import annotations
+
+import time
+
+START_TIME = time.perf_counter()
+
 import argparse
+import bisect
+import os
 import platform
+import queue
 import sys
-import webbrowser
-import pandas as pd
+import threading
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, filedialog, messagebox, font as tkfont
 
+from xlsx_meta import FileWatcher, read_sheet_info
+
+# numpy, pandas and xlsx_data (which pulls in openpyxl) take seconds to import
+# in the onefile build, so they are imported on a background thread once the
+# window is up. import_data_modules() binds these names.
+np = None
+pd = None
+xlsx_cache = None
+xlsx_data = None
+
+# Rows with at least this many columns are rendered in ScrollFrame's virtual
+# mode: only fields near the viewport get widgets.
+VIRTUAL_MIN_COLUMNS = 200
+
+# Table view: width of a sheet column, and longest text shown in a cell.
+GRID_COLUMN_PX = 180
+GRID_CELL_CHARS = 120
+
+# Default memory budget for parsed sheets kept for instant sheet switching.
+DEFAULT_CACHE_MB = 512
+
+# While a sheet's search index is still being built, a pending query is
+# retried this often.
+SEARCH_RETRY_MS = 100
+
+# How often the Tk loop polls a background sheet load for messages.
+LOAD_POLL_MS = 50
+
+# Sheets parsed at the same time across all open workbooks.
+LOAD_WORKERS = 3
+
+# How often open workbooks are checked for a newer version on disk.
+WATCH_MS = 1000
+
+# "Open URLs…" asks before opening more URLs than this at once.
+URL_CONFIRM_OVER = 25
+
+# Matches xlsx_data.FILTER_OPS; the filter bar is built before xlsx_data is
+# imported.
+FILTER_OPS = ("contains", "equals", "starts with", "not empty", "empty")
+
+
+def import_data_modules():
+    """Import numpy, pandas, xlsx_cache and xlsx_data into this module. Safe to call from any thread, repeatedly."""
+    global np, pd, xlsx_cache, xlsx_data
+    import numpy as np
+    import pandas as pd
+    import xlsx_cache
+    import xlsx_data
+
+
+# Where --timings writes when there is no console (the --noconsole build has
+# no stderr); in the temp directory, rewritten on every run.
+TIMINGS_LOG = "xlsx_row_viewer_timings.log"
+
+
+class StartupTimer:
+    """
+    Startup phase times since the process started, when enabled (--timings).
+    Printed to stderr, or written to TIMINGS_LOG in the temp directory when
+    there is none.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._seen: set[str] = set()
+        self.log_path: str | None = None  # set once the first line went to the log
+
+    def mark(self, phase: str, started: float | None = None):
+        # Each phase is reported once; started gives the phase's own duration.
+        if not self.enabled or phase in self._seen:
+            return
+        self._seen.add(phase)
+        now = time.perf_counter()
+        took = f" (took {(now - started) * 1000:.0f} ms)" if started is not None else ""
+        self._write(f"startup: {phase:<12} at {(now - START_TIME) * 1000:6.0f} ms{took}")
+
+    def _write(self, line: str):
+        if sys.stderr is not None:
+            print(line, file=sys.stderr)
+            return
+        mode = "a"
+        if self.log_path is None:
+            import tempfile  # only with --timings and no console
+
+            self.log_path = os.path.join(tempfile.gettempdir(), TIMINGS_LOG)
+            mode = "w"
+        try:
+            with open(self.log_path, mode, encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError:
+            pass
+
 
 def enable_hidpi_awareness():
     if platform.system().lower() == "windows":
@@ -31,20 +134,25 @@ def enable_hidpi_awareness():
                 pass
 
 
-def pick_file() -> str | None:
-    return filedialog.askopenfilename(
-        title="Select an Excel file",
+def pick_files() -> list[str]:
+    return list(filedialog.askopenfilenames(
+        title="Select Excel files",
         filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
-    ) or None
+    ))
 
 
-def list_sheets(path: str) -> list[str]:
-    xls = pd.ExcelFile(path, engine="openpyxl")
-    return list(xls.sheet_names)
+def cell_url(s: str) -> str | None:
+    """URL rule for a stripped cell value; UrlIndex(mode="prefix") is the vectorized form."""
+    if s.startswith("www."):
+        return "https://" + s
+    if s.lower().startswith("http://") or s.lower().startswith("https://"):
+        return s
+    return None
 
 
-def load_sheet(path: str, sheet_name: str) -> pd.DataFrame:
-    return pd.read_excel(path, sheet_name=sheet_name, engine="openpyxl")
+def prepare_sheet(df: pd.DataFrame) -> xlsx_data.LoadedSheet:
+    # Runs on the loader thread once the whole sheet is parsed.
+    return xlsx_data.LoadedSheet.prepare(df, url_mode="prefix", measure=True)
 
 
 def choose_palatino_family() -> str:
@@ -66,12 +174,41 @@ def choose_palatino_family() -> str:
     return "Serif"
 
 
+def value_lines(content: str) -> int:
+    lines = max(1, content.count("\n") + 1)
+    if len(content) > 160:
+        lines = max(lines, 3)
+    return lines
+
+
+def wheel_units(event) -> int:
+    """Scroll units for a <MouseWheel> (Windows/macOS) or <Button-4/5> (X11) event."""
+    if hasattr(event, "delta") and event.delta:
+        return int(-1 * (event.delta / 120))
+    if getattr(event, "num", None) == 4:
+        return -3
+    if getattr(event, "num", None) == 5:
+        return 3
+    return 0
+
+
 class ScrollFrame(ttk.Frame):
+    """
+    Scrollable area with two modes:
+
+    - packed (default): children of self.inner are laid out by pack().
+    - virtual: only items in or near the viewport exist as canvas windows.
+      Item heights start as estimates and are replaced by measured heights
+      once an item has been realized; the scroll range is their sum.
+    """
+
+    OVERSCAN_PX = 400
+
     def __init__(self, master):
         super().__init__(master)
         self.canvas = tk.Canvas(self, highlightthickness=0)
         self.vbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
-        self.canvas.configure(yscrollcommand=self.vbar.set)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
 
         self.vbar.pack(side="right", fill="y")
         self.canvas.pack(side="left", fill="both", expand=True)
@@ -82,39 +219,1418 @@ class ScrollFrame(ttk.Frame):
         self.inner.bind("<Configure>", self._on_inner_configure)
         self.canvas.bind("<Configure>", self._on_canvas_configure)
 
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
+        self.virtual = False
+        self._create = None
+        self._fill = None
+        self._heights: list[int] = []
+        self._offsets: list[int] = [0]
+        self._realized: dict[int, tuple[tk.Widget, int]] = {}
+        self._measured: set[int] = set()
+        self._free: list[tk.Widget] = []
+        self._refresh_pending = False
+
+    def set_packed(self):
+        if not self.virtual:
+            return
+        self._release_all()
+        self.virtual = False
+        self._heights = []
+        self._offsets = [0]
+        self._measured = set()
+        self.canvas.itemconfigure(self.window_id, state="normal")
+        self.canvas.yview_moveto(0)
+        self._on_inner_configure(None)
+
+    def set_virtual(self, count: int, estimate, create, fill):
+        """
+        Show `count` items virtually.
+
+        estimate(i) -> int: guessed pixel height of item i
+        create() -> widget: new item widget (must be a child of self.canvas)
+        fill(i, widget): load item i into a (possibly recycled) widget
+        """
+        if not self.virtual:
+            self.canvas.itemconfigure(self.window_id, state="hidden")
+            self.canvas.yview_moveto(0)
+            self.virtual = True
+        self._create = create
+        self._fill = fill
+
+        for i in [i for i in self._realized if i >= count]:
+            self._release(i)
+        self._heights = [estimate(i) for i in range(count)]
+        self._measured = set()
+        self._recompute_offsets()
+        for i, (widget, _item) in self._realized.items():
+            fill(i, widget)
+        self._refresh_viewport()
+
+    def _recompute_offsets(self):
+        offsets = [0]
+        total = 0
+        for h in self._heights:
+            total += h
+            offsets.append(total)
+        self._offsets = offsets
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), total))
+        for i, (_widget, item) in self._realized.items():
+            self.canvas.coords(item, 0, offsets[i])
+
+    def _release(self, i: int):
+        widget, item = self._realized.pop(i)
+        self.canvas.delete(item)
+        self._free.append(widget)
+
+    def _release_all(self):
+        for i in list(self._realized):
+            self._release(i)
+
+    def _schedule_refresh(self):
+        if self.virtual and not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._refresh_viewport)
+
+    def _refresh_viewport(self):
+        self._refresh_pending = False
+        if not self.virtual:
+            return
+
+        count = len(self._heights)
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(0, bisect.bisect_right(self._offsets, top - self.OVERSCAN_PX) - 1)
+        last = min(count, bisect.bisect_left(self._offsets, bottom + self.OVERSCAN_PX))
+
+        for i in [i for i in self._realized if i < first or i >= last]:
+            self._release(i)
+
+        width = self.canvas.winfo_width()
+        for i in range(first, last):
+            if i in self._realized:
+                continue
+            widget = self._free.pop() if self._free else self._create()
+            self._fill(i, widget)
+            item = self.canvas.create_window(0, self._offsets[i], window=widget, anchor="nw", width=width)
+            self._realized[i] = (widget, item)
+
+        unmeasured = [i for i in self._realized if i not in self._measured]
+        if not unmeasured:
+            return
+
+        # Replace estimates with measured heights, keeping the first visible
+        # item anchored so the view does not jump.
+        self.canvas.update_idletasks()
+        anchor = max(0, bisect.bisect_right(self._offsets, top) - 1)
+        anchor_delta = top - self._offsets[anchor] if count else 0
+        changed = False
+        for i in unmeasured:
+            self._measured.add(i)
+            h = self._realized[i][0].winfo_reqheight()
+            if h != self._heights[i]:
+                self._heights[i] = h
+                changed = True
+        if changed:
+            self._recompute_offsets()
+            total = self._offsets[-1]
+            if total > 0 and anchor < count:
+                self.canvas.yview_moveto((self._offsets[anchor] + anchor_delta) / total)
+            self._schedule_refresh()
+
+    def _on_yscroll(self, first, last):
+        self.vbar.set(first, last)
+        self._schedule_refresh()
 
     def _on_inner_configure(self, _event):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        if not self.virtual:
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     def _on_canvas_configure(self, event):
         self.canvas.itemconfig(self.window_id, width=event.width)
+        if self.virtual:
+            for _widget, item in self._realized.values():
+                self.canvas.itemconfig(item, width=event.width)
+            self._recompute_offsets()
+            self._schedule_refresh()
+
+    def scroll_wheel(self, event):
+        # Bound once by App for the whole window and routed to the visible tab.
+        self.canvas.yview_scroll(wheel_units(event), "units")
+
+
+class FieldSlot:
+    """
+    Label + value Text (+ Open URL button) for one column.
+
+    Slots are created once and reused across rows; show() only touches the
+    widgets whose caption, content, height or URL actually changed.
+    """
+
+    def __init__(self, tab: "WorkbookTab", parent):
+        self.tab = tab
+        self.frame = ttk.Frame(parent)
+        self.label = ttk.Label(self.frame, font=tab.app.font_bold)
+        self.label.pack(anchor="w", pady=(14, 6))
+        self.text = tab.app._make_value_text(self.frame)
+        self.text.pack(anchor="w", fill="x", expand=True)
+
+        self.button = ttk.Button(self.frame, text="Open URL", command=self._open_url)
+        self.button.bind("<Enter>", lambda e: self._focus_url())
+        self.button.bind("<FocusIn>", lambda e: self._focus_url())
+
+        self.caption: str | None = None
+        self.content: str | None = None
+        self.lines = 1
+        self.url: str | None = None
+        self.visible = False
+
+    def _open_url(self):
+        if self.url:
+            self.tab.app.open_url(self.url)
+
+    def _focus_url(self):
+        if self.url:
+            self.tab.set_focus_url(self.url)
+
+    def fill(self, caption: str, content: str, url: str | None, lines: int):
+        # All four come precomputed from WorkbookTab._row_fields().
+        if caption != self.caption:
+            self.label.configure(text=caption)
+            self.caption = caption
+
+        if content != self.content:
+            self.text.configure(state="normal")
+            self.text.delete("1.0", "end")
+            self.text.insert("1.0", content)
+            self.text.configure(state="disabled")
+            self.content = content
+
+        if lines != self.lines:
+            self.text.configure(height=lines)
+            self.lines = lines
+
+        if url and not self.url:
+            self.button.pack(anchor="w", pady=(10, 0))
+        elif self.url and not url:
+            self.button.pack_forget()
+        self.url = url
+
+    def show(self, caption: str, content: str, url: str | None, lines: int):
+        self.fill(caption, content, url, lines)
+        if not self.visible:
+            self.frame.pack(fill="x", anchor="w")
+            self.visible = True
+
+    def hide(self):
+        if self.visible:
+            self.frame.pack_forget()
+            self.visible = False
+
+
+class RowDocument(ttk.Frame):
+    """
+    A whole row as one read-only Text (the single-text render mode).
+
+    Captions and values are tag ranges; a URL value carries the "url" tag
+    and is followed by an "Open URL" link. The widget count does not grow
+    with the columns: copying, the context menu and opening URLs find their
+    field from the tags at the pointer.
+    """
+
+    def __init__(self, tab: "WorkbookTab", parent):
+        super().__init__(parent)
+        self.tab = tab
+        app = tab.app
+        self.text = tk.Text(
+            self,
+            wrap="word",
+            borderwidth=0,
+            highlightthickness=0,
+            padx=4,
+            pady=4,
+            font=app.font_value,
+        )
+        vbar = ttk.Scrollbar(self, orient="vertical", command=self.text.yview)
+        self.text.configure(yscrollcommand=vbar.set, state="disabled")
+        vbar.pack(side="right", fill="y")
+        self.text.pack(side="left", fill="both", expand=True)
+
+        self.text.tag_configure("caption", font=app.font_bold, spacing1=14, spacing3=6)
+        self.text.tag_configure("value", lmargin1=10, lmargin2=10)
+        self.text.tag_configure("url", foreground="#1a0dab", underline=True)
+        self.text.tag_configure("open", foreground="#1a0dab", font=tkfont.nametofont("TkDefaultFont"))
+        self.text.tag_raise("sel")
+
+        self.text.tag_bind("url", "<Enter>", lambda e: self._focus_url())
+        self.text.tag_bind("open", "<Enter>", lambda e: (self.text.configure(cursor="hand2"), self._focus_url()))
+        self.text.tag_bind("open", "<Leave>", lambda e: self.text.configure(cursor="xterm"))
+        self.text.tag_bind("open", "<Button-1>", lambda e: self._open_url())
+
+        # A disabled Text does not take focus on click, which Ctrl+C needs.
+        self.text.bind("<Button-1>", lambda e: self.text.focus_set(), add="+")
+        for seq in ("<Control-c>", "<Control-C>", "<Command-c>", "<Command-C>"):
+            self.text.bind(seq, self._copy)
+        self.text.bind("<Button-3>", self._show_menu)
+        self.text.bind("<Button-2>", self._show_menu)
+
+    def show(self, fields: list[tuple[str, str, str | None, int]]):
+        # One insert call for the whole row: (chars, tags) pairs.
+        args = []
+        for caption, content, url, _lines in fields:
+            args += [caption + "\n", "caption"]
+            if url:
+                # The gap and link are outside "value", so Copy takes just the URL.
+                args += [content, ("value", "url"), "   ", "gap", "Open URL", "open", "\n", "value"]
+            else:
+                args += [content + "\n", "value"]
+
+        self.text.configure(state="normal")
+        self.text.delete("1.0", "end")
+        if args:
+            self.text.insert("end", *args)
+        self.text.configure(state="disabled")
+        self.text.yview_moveto(0)
+
+    def _range_at(self, tag: str, index: str) -> tuple[str, str] | None:
+        r = self.text.tag_prevrange(tag, f"{index}+1c")
+        if r and self.text.compare(index, "<", r[1]):
+            return r
+        return None
+
+    def _url_at(self, index: str) -> str | None:
+        # An "Open URL" link belongs to the URL value just before it.
+        r = self.text.tag_prevrange("url", index) if self._range_at("open", index) else self._range_at("url", index)
+        return self.text.get(*r) if r else None
+
+    def _focus_url(self):
+        url = self._url_at("current")
+        if url:
+            self.tab.set_focus_url(url)
+
+    def _open_url(self):
+        url = self._url_at("current")
+        if url:
+            self.tab.app.open_url(url)
+
+    def _value_at(self, index: str) -> str | None:
+        r = self._range_at("value", index)
+        if r is None:
+            return None
+        return self.text.get(*r).rstrip("\n")
+
+    def _copy(self, _e=None):
+        if self.text.tag_ranges("sel"):
+            self.tab.app.copy_text(self.text.get("sel.first", "sel.last"))
+        return "break"
+
+    def _show_menu(self, event):
+        # Copy takes the selection, or else the value under the pointer.
+        self.text.focus_set()
+        index = f"@{event.x},{event.y}"
+        if self.text.tag_ranges("sel"):
+            text = self.text.get("sel.first", "sel.last")
+        else:
+            text = self._value_at(index)
+        if text is not None:
+            self.tab.app.show_copy_menu(text, event)
 
-    def _on_mousewheel(self, event):
-        if hasattr(event, "delta") and event.delta:
-            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+class SheetGrid(ttk.Frame):
+    """
+    Table view of a loaded sheet on a ttk.Treeview that only ever holds the
+    rows and columns fitting the viewport.
+
+    There is one tree item per visible line and one tree column per visible
+    sheet column. Scrolling relabels the headings and refills the items from
+    the sheet's RowStore instead of adding items, so the number of live
+    items does not depend on the sheet size. The scrollbars are driven by
+    hand: they map to the first shown row (a position in `view` when the
+    sheet is filtered) and the first shown column.
+    """
+
+    def __init__(self, master, on_cursor, on_open):
+        super().__init__(master)
+        self.on_cursor = on_cursor  # on_cursor(row) when the selected row changes
+        self.on_open = on_open  # on_open(row) on double-click or Enter
+
+        self.rowheight = tkfont.nametofont("TkDefaultFont").metrics("linespace") + 8
+        ttk.Style(self).configure("Grid.Treeview", rowheight=self.rowheight)
+        self.tree = ttk.Treeview(self, show="headings", selectmode="browse", style="Grid.Treeview")
+        self.vbar = ttk.Scrollbar(self, orient="vertical", command=self._on_vbar)
+        self.hbar = ttk.Scrollbar(self, orient="horizontal", command=self._on_hbar)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.vbar.grid(row=0, column=1, sticky="ns")
+        self.hbar.grid(row=1, column=0, sticky="ew")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.rows: xlsx_data.RowStore | None = None
+        self.view: np.ndarray | None = None
+        self.top = 0  # position of the first shown row
+        self.left = 0  # first shown sheet column
+        self.cursor = 0  # position of the selected row
+        self._lines = 1
+        self._refresh_pending = False
+
+        self.tree.bind("<Configure>", lambda e: self._schedule_refresh())
+        self.tree.bind("<<TreeviewSelect>>", lambda e: self._on_select())
+        self.tree.bind("<Double-1>", self._on_double_click)
+        self.tree.bind("<Return>", lambda e: self._open_cursor())
+        keys = {
+            "<Up>": lambda: self.move_cursor(-1),
+            "<Down>": lambda: self.move_cursor(1),
+            "<Prior>": lambda: self.move_cursor(-self._lines),
+            "<Next>": lambda: self.move_cursor(self._lines),
+            "<Home>": lambda: self.move_cursor(-self._count()),
+            "<End>": lambda: self.move_cursor(self._count()),
+            "<Left>": lambda: self.scroll_columns(-1),
+            "<Right>": lambda: self.scroll_columns(1),
+        }
+        for seq, action in keys.items():
+            self.tree.bind(seq, lambda e, a=action: (a(), "break")[1])
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, lambda e: (self.scroll_lines(wheel_units(e)), "break")[1])
+
+    def show(self, rows: xlsx_data.RowStore | None, view: np.ndarray | None, row: int):
+        """Show `rows` (None clears the table) with sheet row `row` selected."""
+        if rows is not self.rows:
+            self.left = 0
+        self.rows = rows
+        self.view = view
+        if rows is not None:
+            if view is None:
+                pos = row
+            else:
+                pos = min(int(np.searchsorted(view, row)), max(0, len(view) - 1))
+            self.cursor = max(0, min(pos, self._count() - 1))
+            self._keep_cursor_visible()
+        self._refresh()
+
+    def _count(self) -> int:
+        if self.rows is None:
+            return 0
+        return len(self.view) if self.view is not None else len(self.rows)
+
+    def _sheet_row(self, pos: int) -> int:
+        return int(self.view[pos]) if self.view is not None else pos
+
+    def _keep_cursor_visible(self):
+        if self.cursor < self.top:
+            self.top = self.cursor
+        elif self.cursor >= self.top + self._lines:
+            self.top = self.cursor - self._lines + 1
+        self.top = max(0, min(self.top, self._count() - self._lines))
+
+    def move_cursor(self, delta: int):
+        n = self._count()
+        if n == 0:
+            return
+        cursor = max(0, min(self.cursor + delta, n - 1))
+        if cursor != self.cursor:
+            self.cursor = cursor
+            self._keep_cursor_visible()
+            self._schedule_refresh()
+            self.on_cursor(self._sheet_row(cursor))
+
+    def scroll_lines(self, delta: int):
+        top = max(0, min(self.top + delta, self._count() - self._lines))
+        if top != self.top:
+            self.top = top
+            self._schedule_refresh()
+
+    def scroll_columns(self, delta: int):
+        if self.rows is None:
+            return
+        left = max(0, min(self.left + delta, len(self.rows.labels) - 1))
+        if left != self.left:
+            self.left = left
+            self._schedule_refresh()
+
+    def _on_vbar(self, *args):
+        n = self._count()
+        if args[0] == "moveto":
+            self.scroll_lines(int(float(args[1]) * n) - self.top)
+        elif args[0] == "scroll":
+            step = self._lines if args[2] == "pages" else 1
+            self.scroll_lines(int(args[1]) * step)
+
+    def _on_hbar(self, *args):
+        if self.rows is None:
+            return
+        if args[0] == "moveto":
+            self.scroll_columns(int(float(args[1]) * len(self.rows.labels)) - self.left)
+        elif args[0] == "scroll":
+            self.scroll_columns(int(args[1]))
+
+    def _on_select(self):
+        # Also runs after _refresh() selects the cursor's item; that maps
+        # back to the same position.
+        sel = self.tree.selection()
+        if not sel:
+            return
+        cursor = self.top + self.tree.index(sel[0])
+        if cursor != self.cursor and cursor < self._count():
+            self.cursor = cursor
+            self.on_cursor(self._sheet_row(cursor))
+
+    def _on_double_click(self, event):
+        item = self.tree.identify_row(event.y)
+        if item:
+            self.cursor = self.top + self.tree.index(item)
+            self._open_cursor()
+        return "break"
+
+    def _open_cursor(self):
+        if self.cursor < self._count():
+            self.on_open(self._sheet_row(self.cursor))
+        return "break"
+
+    def _schedule_refresh(self):
+        # Scrollbar drags and held keys arrive faster than the tree refills.
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._refresh)
+
+    def _refresh(self):
+        self._refresh_pending = False
+        items = self.tree.get_children()
+        if self.rows is None:
+            self.tree.delete(*items)
+            self.tree["columns"] = ()
+            self.vbar.set(0, 1)
+            self.hbar.set(0, 1)
+            return
+
+        # The heading height is the y of the first item, once there is one.
+        bbox = self.tree.bbox(items[0]) if items else ""
+        heading_px = bbox[1] if bbox else self.rowheight
+        self._lines = max(1, (self.tree.winfo_height() - heading_px) // self.rowheight)
+        n = self._count()
+        self.top = max(0, min(self.top, n - self._lines))
+        n_cols = len(self.rows.labels)
+        shown_cols = range(self.left, min(n_cols, self.left + max(1, self.tree.winfo_width() // GRID_COLUMN_PX)))
+
+        columns = ("#",) + tuple(f"c{k}" for k in range(len(shown_cols)))
+        if tuple(self.tree["columns"]) != columns:
+            self.tree["columns"] = columns
+            self.tree.column("#", width=80, stretch=False, anchor="e")
+            for k in range(len(shown_cols)):
+                self.tree.column(f"c{k}", width=GRID_COLUMN_PX, stretch=False)
+        self.tree.heading("#", text="Row")
+        for k, j in enumerate(shown_cols):
+            self.tree.heading(f"c{k}", text=self.rows.labels[j])
+
+        positions = np.arange(self.top, min(n, self.top + self._lines))
+        sheet_rows = self.view[positions] if self.view is not None else positions
+        cells = self.rows.block(sheet_rows, shown_cols)
+
+        if len(items) > len(positions):
+            self.tree.delete(*items[len(positions):])
+            items = items[: len(positions)]
+        while len(items) < len(positions):
+            items += (self.tree.insert("", "end"),)
+        for item, r, values in zip(items, sheet_rows.tolist(), cells):
+            # One line per cell: newlines and runs of spaces collapse.
+            values = [" ".join(v[:GRID_CELL_CHARS].split()) for v in values]
+            self.tree.item(item, values=[r + 1, *values])
+        if self.top <= self.cursor < self.top + len(items):
+            self.tree.selection_set(items[self.cursor - self.top])
+        else:
+            self.tree.selection_set(())
+
+        if n:
+            self.vbar.set(self.top / n, (self.top + len(items)) / n)
         else:
-            if getattr(event, "num", None) == 4:
-                self.canvas.yview_scroll(-3, "units")
-            elif getattr(event, "num", None) == 5:
-                self.canvas.yview_scroll(3, "units")
+            self.vbar.set(0, 1)
+        if n_cols:
+            self.hbar.set(self.left / n_cols, shown_cols.stop / n_cols)
+        else:
+            self.hbar.set(0, 1)
+
+
+class OpenUrlsDialog(tk.Toplevel):
+    """Picks the rows (and URL column) whose URLs a WorkbookTab opens."""
+
+    ALL_COLUMNS = "All URL columns"
+
+    def __init__(self, tab: "WorkbookTab"):
+        super().__init__(tab)
+        self.tab = tab
+        self.title("Open URLs")
+        self.transient(tab.winfo_toplevel())
+        self.resizable(False, False)
+
+        frame = ttk.Frame(self, padding=16)
+        frame.pack(fill="both", expand=True)
+        ttk.Label(frame, text="Rows:").grid(row=0, column=0, sticky="w")
+        self.rows_var = tk.StringVar()
+        rows_entry = ttk.Entry(frame, textvariable=self.rows_var, width=30)
+        rows_entry.grid(row=0, column=1, sticky="we", padx=(10, 0))
+        shown = "rows passing the filters" if tab.view is not None else "rows"
+        ttk.Label(frame, text=f"e.g. 100-150, 200; empty for all {shown}").grid(
+            row=1, column=1, sticky="w", padx=(10, 0), pady=(2, 10)
+        )
+
+        # Taken now: the tab drops its UrlIndex while the file reloads.
+        self.urls = tab.urls
+        self.view = tab.view
+        # Only columns holding URLs are offered.
+        self.columns = sorted(self.urls.masks)
+        labels = tab.loaded.rows.labels
+        ttk.Label(frame, text="Column:").grid(row=2, column=0, sticky="w")
+        self.col_combo = ttk.Combobox(
+            frame, values=[self.ALL_COLUMNS, *(labels[j] for j in self.columns)], state="readonly", width=28
+        )
+        self.col_combo.current(0)
+        self.col_combo.grid(row=2, column=1, sticky="we", padx=(10, 0))
+
+        self.count_lbl = ttk.Label(frame, text="")
+        self.count_lbl.grid(row=3, column=0, columnspan=2, sticky="w", pady=(12, 12))
+        buttons = ttk.Frame(frame)
+        buttons.grid(row=4, column=0, columnspan=2, sticky="e")
+        self.open_btn = ttk.Button(buttons, text="Open", command=self.open)
+        self.open_btn.pack(side="left")
+        ttk.Button(buttons, text="Cancel", command=self.destroy).pack(side="left", padx=(8, 0))
+
+        self.rows_var.trace_add("write", lambda *_a: self._update_count())
+        self.col_combo.bind("<<ComboboxSelected>>", lambda e: self._update_count())
+        self.bind("<Return>", lambda e: self.open())
+        self.bind("<Escape>", lambda e: self.destroy())
+        self._urls: list[str] = []
+        self._update_count()
+        rows_entry.focus_set()
+
+    def _update_count(self):
+        i = self.col_combo.current()
+        cols = None if i <= 0 else [self.columns[i - 1]]
+        try:
+            rows = xlsx_data.parse_row_spec(self.rows_var.get(), self.urls.n_rows)
+            if self.view is not None:
+                rows = np.intersect1d(rows, self.view, assume_unique=True)
+            self._urls = self.urls.collect(rows, cols)
+        except ValueError as e:
+            self._urls = []
+            self.count_lbl.config(text=str(e))
+            self.open_btn.state(["disabled"])
+            return
+        unique = len(xlsx_data.unique_urls(self._urls))
+        dupes = f" ({len(self._urls) - unique:,} duplicates skipped)" if unique < len(self._urls) else ""
+        self.count_lbl.config(text=f"{unique:,} URLs to open{dupes}")
+        self.open_btn.state(["!disabled"] if unique else ["disabled"])
+
+    def open(self):
+        if not self._urls:
+            return
+        unique = len(xlsx_data.unique_urls(self._urls))
+        if unique > URL_CONFIRM_OVER and not messagebox.askyesno(
+            "Open URLs", f"Open {unique:,} URLs in the browser?", parent=self
+        ):
+            return
+        self.tab.open_urls(self._urls)
+        self.destroy()
+
+
+class WorkbookTab(ttk.Frame):
+    """
+    One workbook in the App's notebook: its sheet selector, search and filter
+    bars and the row view.
+
+    Loads run on the App's shared loader pool, so several workbooks parse at
+    once. A parsed sheet lives in the App's SheetCache; while the tab is not
+    shown it drops its own reference, so the cache's memory budget decides
+    what stays in memory, and showing the tab again takes the sheet back
+    from the cache (or reloads it) with the row and filters kept.
+    """
+
+    def __init__(self, app: "App", path: str, sheet_info: list):
+        super().__init__(app.notebook)
+        self.app = app
+        self.path = path
+        self.sheet_info = sheet_info
+        self.sheets = [s.name for s in sheet_info]
+        self.book: xlsx_data.WorkbookHandle | None = None  # set by start()
+
+        self.df: pd.DataFrame | None = None
+        self.urls: xlsx_data.UrlIndex | None = None  # built once the whole sheet is loaded
+        self.loaded: xlsx_data.LoadedSheet | None = None
+        self.search_hits: np.ndarray | None = None
+        self._search_retry: str | None = None
+        self.filters: list[xlsx_data.ColumnFilter] = []
+        self.view: np.ndarray | None = None  # sorted rows passing the filters
+        self.row = 0
+        self.focused_url: str | None = None
+        self._url_batch: xlsx_data.UrlBatch | None = None  # last batch from open_urls()
+        self._url_after: str | None = None
+        self.active = False
+        self._released = False  # loaded sheet handed back to the SheetCache
+        self._cache_key: tuple | None = None  # SheetCache key of `loaded`
+        self._watcher = FileWatcher(path)  # started by start()
+        self._watch_after: str | None = None
+        self.table_mode = False  # SheetGrid shown instead of the row view
+
+        self._slots: list[FieldSlot] = []
+        self._virtual_slots: dict[tk.Widget, FieldSlot] = {}
+        self._fields: list[tuple[str, str, str | None, int]] = []
+        # Builds the fields of rows next to the shown one while Tk is idle;
+        # set once the sheet is fully loaded.
+        self._prefetch: xlsx_data.RowPrefetcher | None = None
+        self._prefetch_after: str | None = None
+        self._load_job: xlsx_data.SheetLoadJob | None = None
+        self._poll_after: str | None = None
+        self._stream_chunks: list[pd.DataFrame] = []
+        self._stream_rows = 0
+        self._load_note = ""
+        self._render_after: str | None = None
+
+        self._build_topbar()
+        self._build_searchbar()
+        self._build_filterbar()
+        self._build_header()
+        self._build_load_status()
+        self._build_url_status()
+        self._build_scroll_area()
+        self._build_controls()
+        self.pack_row_view()
+        self._update_header()
+
+    def start(self):
+        """Open the workbook and load the selected sheet (once the data modules are imported)."""
+        # Shared by every sheet read of the tab; the workbook is opened while
+        # loads are queued or running and closed in between.
+        self.book = xlsx_data.WorkbookHandle(self.path, sheets=self.sheet_info, disk_cache=self.app.disk_cache)
+        self.load_current_sheet()
+        self._watch_after = self.after(WATCH_MS, self._watch)
+
+    def close(self):
+        self._abort_load()
+        self._cancel_prefetch()
+        pending_calls = (self._search_retry, self._render_after, self._watch_after, self._url_after, self._poll_after)
+        for pending in pending_calls:
+            if pending is not None:
+                self.after_cancel(pending)
+        if self._url_batch is not None:
+            self._url_batch.cancel()
+        if self.book is not None:
+            self.book.close()
+
+    def activate(self):
+        self.active = True
+        if self._released:
+            self._released = False
+            self.load_current_sheet(keep_position=True)
+
+    def deactivate(self):
+        self.active = False
+        self._release()
+
+    def _release(self):
+        # Only complete sheets are released; they can be taken back from the
+        # SheetCache or reloaded.
+        if self.loaded is None or self._load_job is not None:
+            return
+        self.loaded = None
+        self.df = None
+        self.urls = None
+        self.view = None
+        self.search_hits = None
+        self._cancel_prefetch()
+        self._prefetch = None
+        self.table.show(None, None, 0)
+        self._released = True
+
+    def _build_topbar(self):
+        top = ttk.Frame(self, padding=(16, 14))
+        top.pack(fill="x")
+
+        ttk.Label(top, text="File:", font=self.app.font_bold).pack(side="left")
+        self.file_lbl = ttk.Label(top, text=self.path)
+        self.file_lbl.pack(side="left", padx=(10, 14), fill="x", expand=True)
+
+        ttk.Label(top, text="Sheet:", font=self.app.font_bold).pack(side="left")
+        self.sheet_var = tk.StringVar(value=self.sheets[0])
+        self.sheet_combo = ttk.Combobox(
+            top, textvariable=self.sheet_var, values=self.sheets, state="readonly", width=34
+        )
+        self.sheet_combo.pack(side="left", padx=(10, 0))
+        self.sheet_combo.bind("<<ComboboxSelected>>", lambda e: self.on_sheet_change())
+
+    def _build_searchbar(self):
+        bar = ttk.Frame(self, padding=(16, 0, 16, 10))
+        bar.pack(fill="x")
+
+        ttk.Label(bar, text="Search:", font=self.app.font_bold).pack(side="left")
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(bar, textvariable=self.search_var, width=40)
+        self.search_entry.pack(side="left", padx=(10, 10))
+        ttk.Button(bar, text="▲", width=3, command=self.prev_hit).pack(side="left")
+        ttk.Button(bar, text="▼", width=3, command=self.next_hit).pack(side="left", padx=(6, 0))
+        self.search_lbl = ttk.Label(bar, text="")
+        self.search_lbl.pack(side="left", padx=(12, 0))
+
+        self.search_var.trace_add("write", lambda *_a: self._on_search_changed())
+        self.search_entry.bind("<Return>", lambda e: (self.next_hit(), "break")[1])
+        self.search_entry.bind("<Shift-Return>", lambda e: (self.prev_hit(), "break")[1])
+        self.search_entry.bind("<Escape>", lambda e: self._clear_search())
+
+    def _build_filterbar(self):
+        bar = ttk.Frame(self, padding=(16, 0, 16, 10))
+        bar.pack(fill="x")
+
+        ttk.Label(bar, text="Filter:", font=self.app.font_bold).pack(side="left")
+        self.filter_col_var = tk.StringVar()
+        self.filter_col_combo = ttk.Combobox(bar, textvariable=self.filter_col_var, state="readonly", width=26)
+        self.filter_col_combo.pack(side="left", padx=(10, 6))
+        self.filter_op_var = tk.StringVar(value=FILTER_OPS[0])
+        ttk.Combobox(
+            bar, textvariable=self.filter_op_var, values=FILTER_OPS, state="readonly", width=11
+        ).pack(side="left", padx=(0, 6))
+        self.filter_value_var = tk.StringVar()
+        value_entry = ttk.Entry(bar, textvariable=self.filter_value_var, width=24)
+        value_entry.pack(side="left", padx=(0, 6))
+        value_entry.bind("<Return>", lambda e: (self.add_filter(), "break")[1])
+        ttk.Button(bar, text="Add filter", command=self.add_filter).pack(side="left")
+        ttk.Button(bar, text="Clear", command=self.clear_filters).pack(side="left", padx=(6, 0))
+        self.filter_lbl = ttk.Label(bar, text="")
+        self.filter_lbl.pack(side="left", padx=(12, 0), fill="x", expand=True)
+
+    def _update_filter_bar(self):
+        columns = self.loaded.rows.labels if self.loaded is not None else []
+        self.filter_col_combo["values"] = columns
+        if self.filter_col_var.get() not in columns:
+            self.filter_col_var.set(columns[0] if columns else "")
+        if not self.filters:
+            self.filter_lbl.config(text="")
+        elif self.view is not None:
+            desc = " AND ".join(f.describe() for f in self.filters)
+            self.filter_lbl.config(text=f"{desc}  →  {len(self.view):,} rows")
+
+    def add_filter(self):
+        if self.loaded is None:
+            messagebox.showinfo("Filter", "Filters are available once the sheet has finished loading.")
+            return
+        column = self.filter_col_var.get()
+        if not column:
+            return
+        flt = xlsx_data.ColumnFilter(column, self.filter_op_var.get(), self.filter_value_var.get())
+        self._apply_filters(self.filters + [flt])
+
+    def clear_filters(self):
+        if self.filters:
+            self._apply_filters([])
+
+    def _apply_filters(self, filters: list[xlsx_data.ColumnFilter]):
+        # Filters only narrow the row-position array; self.df is untouched.
+        try:
+            view = self.loaded.filter_rows(filters) if filters else None
+        except ValueError as e:
+            messagebox.showerror("Filter", str(e))
+            return
+        self.filters = filters
+        self.view = view
+        if self._prefetch is not None:  # None after a failed load or while reloading
+            self._prefetch.view = view
+        self._update_filter_bar()
+
+        if view is not None and len(view) and xlsx_data.view_position(view, self.row) is None:
+            i = int(np.searchsorted(view, self.row))
+            self.row = int(view[min(i, len(view) - 1)])
+        self._on_search_changed(jump=False)
+        self.render_row()
+
+    def _build_header(self):
+        self.header = ttk.Label(self, text="", font=self.app.font_header)
+        self.header.pack(fill="x", padx=16, pady=(0, 10), anchor="w")
+
+    def _build_load_status(self):
+        # Packed under the header only while a sheet is loading.
+        self.load_status = ttk.Frame(self, padding=(16, 0, 16, 6))
+        self.load_bar = ttk.Progressbar(self.load_status, orient="horizontal", length=420)
+        self.load_bar.pack(side="left")
+        self.load_lbl = ttk.Label(self.load_status, text="")
+        self.load_lbl.pack(side="left", padx=(12, 12))
+        ttk.Button(self.load_status, text="Cancel", command=self.cancel_load).pack(side="left")
+
+    def _show_load_progress(self, rows: int, total: int | None):
+        if not self.load_status.winfo_ismapped():
+            self.load_status.pack(fill="x", after=self.header)
+        if total:
+            self.load_bar.stop()
+            self.load_bar.configure(mode="determinate", maximum=total, value=min(rows, total))
+            self.load_lbl.config(text=f"Parsed {rows:,} / ~{total:,} rows")
+        else:
+            if str(self.load_bar.cget("mode")) != "indeterminate":
+                self.load_bar.configure(mode="indeterminate")
+                self.load_bar.start(15)
+            self.load_lbl.config(text=f"Parsed {rows:,} rows")
+
+    def _hide_load_progress(self):
+        self.load_bar.stop()
+        self.load_status.pack_forget()
+
+    def _build_url_status(self):
+        # Packed under the header only while open_urls() is opening a batch.
+        self.url_status = ttk.Frame(self, padding=(16, 0, 16, 6))
+        self.url_bar = ttk.Progressbar(self.url_status, orient="horizontal", length=420)
+        self.url_bar.pack(side="left")
+        self.url_lbl = ttk.Label(self.url_status, text="")
+        self.url_lbl.pack(side="left", padx=(12, 12))
+        ttk.Button(self.url_status, text="Cancel", command=self.cancel_urls).pack(side="left")
+
+    def _build_scroll_area(self):
+        # Only one of these is packed, see pack_row_view().
+        self.scroll = ScrollFrame(self)
+        self.document = RowDocument(self, self)
+        self.table = SheetGrid(self, on_cursor=self._on_grid_cursor, on_open=self._open_from_grid)
+
+    def _build_controls(self):
+        self.controls = controls = ttk.Frame(self, padding=(16, 0, 16, 10))
+        controls.pack(fill="x")
+
+        ttk.Button(controls, text="◀ Prev", command=self.prev_row).pack(side="left")
+        ttk.Button(controls, text="Next ▶", command=self.next_row).pack(side="left", padx=(12, 0))
+        self.table_btn = ttk.Button(controls, text="Table view", command=self.toggle_table)
+        self.table_btn.pack(side="left", padx=(24, 0))
+        ttk.Button(controls, text="Open URLs…", command=self.open_urls_dialog).pack(side="right")
+        ttk.Button(controls, text="Open all URLs in row", command=self.open_all_urls).pack(side="right", padx=(0, 12))
+
+    def pack_row_view(self):
+        """Show the table, or the row in the widget-per-column or single-text view chosen in the App."""
+        if self.table_mode:
+            shown = self.table
+        else:
+            shown = self.document if self.app.single_text.get() else self.scroll
+        for view in (self.table, self.document, self.scroll):
+            if view is not shown:
+                view.pack_forget()
+        if not shown.winfo_manager():
+            shown.pack(fill="both", expand=True, padx=16, pady=12, before=self.controls)
+
+    def scroll_wheel(self, event):
+        if self.table_mode:
+            self.table.scroll_lines(wheel_units(event))
+        elif not self.app.single_text.get():
+            self.scroll.scroll_wheel(event)
+        elif event.widget is not self.document.text:  # the Text scrolls itself
+            self.document.text.yview_scroll(wheel_units(event), "units")
+
+    def toggle_table(self):
+        self.table_mode = not self.table_mode
+        self.table_btn.configure(text="Row view" if self.table_mode else "Table view")
+        self.pack_row_view()
+        self.render_row()
+        if self.table_mode:
+            self.table.tree.focus_set()
+
+    def _on_grid_cursor(self, row: int):
+        self.row = row
+        self._update_header()
+        self._update_search_label()
+
+    def _open_from_grid(self, row: int):
+        self.row = row
+        self.toggle_table()
+
+    def _focus_search(self):
+        self.search_entry.focus_set()
+        self.search_entry.select_range(0, "end")
+
+    def _clear_search(self):
+        self.search_var.set("")
+        self.focus_set()
+
+    def _on_search_changed(self, jump: bool = True):
+        # Runs on every keystroke in the search box; lookups hit the sheet's
+        # prebuilt SearchIndex, so there is no scan over the cells here.
+        if self._search_retry is not None:
+            self.after_cancel(self._search_retry)
+            self._search_retry = None
+
+        query = self.search_var.get().strip()
+        if not query:
+            self.search_hits = None
+            self._update_search_label()
+            return
+
+        index = self.loaded.search if self.loaded is not None else None
+        if index is None:
+            self.search_hits = None
+            if self.loaded is not None or self._load_job is not None or self.book is None:
+                self.search_lbl.config(text="Indexing…")
+                self._search_retry = self.after(SEARCH_RETRY_MS, self._on_search_changed)
+            else:
+                self.search_lbl.config(text="Nothing to search")
+            return
+
+        self.search_hits = index.rows(query)
+        if self.view is not None:
+            self.search_hits = np.intersect1d(self.search_hits, self.view, assume_unique=True)
+        if jump and len(self.search_hits) and not self._hit_window():
+            self.next_hit()
+        else:
+            self._update_search_label()
+
+    def _hit_window(self) -> range:
+        # Position of the current row among the hits (a 0/1-element range).
+        i = int(np.searchsorted(self.search_hits, self.row))
+        return range(i, i + 1) if i < len(self.search_hits) and self.search_hits[i] == self.row else range(0)
+
+    def _update_search_label(self):
+        hits = self.search_hits
+        if hits is None:
+            if self._search_retry is None:
+                self.search_lbl.config(text="")
+        elif len(hits) == 0:
+            self.search_lbl.config(text="No matches")
+        else:
+            at = self._hit_window()
+            where = f"{at.start + 1}/{len(hits):,}" if at else f"{len(hits):,} matches"
+            self.search_lbl.config(text=f"Match {where}" if at else where)
+
+    def next_hit(self):
+        hits = self.search_hits
+        if hits is None or len(hits) == 0:
+            return
+        i = int(np.searchsorted(hits, self.row, side="right"))
+        self._move_to(int(hits[i % len(hits)]))
+
+    def prev_hit(self):
+        hits = self.search_hits
+        if hits is None or len(hits) == 0:
+            return
+        i = int(np.searchsorted(hits, self.row, side="left")) - 1
+        self._move_to(int(hits[i % len(hits)]))
+
+    def set_focus_url(self, url: str):
+        self.focused_url = url
+
+    def open_focused_url(self):
+        if self.focused_url:
+            self.app.open_url(self.focused_url)
+
+    def on_sheet_change(self):
+        # Before the data modules are imported the selection is just kept;
+        # start() loads whichever sheet is selected then.
+        if self.book is not None:
+            self.load_current_sheet()
+
+    def load_current_sheet(self, keep_position: bool = False):
+        """Load the selected sheet; keep_position keeps the row and filters (a released tab coming back)."""
+        self._abort_load()
+        sheet = self.sheet_var.get()
+
+        self.df = pd.DataFrame()
+        self.urls = None
+        self.loaded = None
+        self.search_hits = None
+        self.view = None
+        if not keep_position:
+            self.filters = []
+            self.row = 0
+        self._update_filter_bar()
+        self._stream_chunks = []
+        self._stream_rows = 0
+        self._load_note = ""
+        self._released = False
+        self._cancel_prefetch()
+        self._prefetch = None
+        self.focused_url = None
+
+        try:
+            key = xlsx_data.sheet_key(self.path, sheet)
+        except OSError:
+            key = None
+        cached = self.app.sheet_cache.get(key) if key is not None else None
+        if cached is not None:
+            self.app.timer.mark("first parse")
+            self._cache_key = key
+            self._set_loaded(cached)
+            return
+
+        job = xlsx_data.SheetLoadJob(self.book, sheet, stream=True, prepare=prepare_sheet, cache_key=key)
+        self._load_job = job
+        job.start(self.app.loader_pool)
+        self._show_load_progress(0, None)
+        self.render_row()
+        self._schedule_poll(job)
+
+    def _watch(self):
+        self._watch_after = self.after(WATCH_MS, self._watch)
+        sheets = self._watcher.poll()
+        if sheets:
+            self._reload_file(sheets)
+
+    def _reload_file(self, sheets: list):
+        """Switch to a newer version of the file, keeping the sheet, row, filters and search."""
+        previous = self.loaded
+        self._abort_load()
+        self.book.close()
+        self.sheet_info = sheets
+        self.sheets = [s.name for s in sheets]
+        self.sheet_combo["values"] = self.sheets
+        self.book = xlsx_data.WorkbookHandle(self.path, sheets=sheets, disk_cache=self.app.disk_cache)
+
+        sheet = self.sheet_var.get()
+        if sheet not in self.sheets:
+            self.sheet_var.set(self.sheets[0])
+            self.load_current_sheet()
+            return
+        if previous is None:
+            # A released tab reloads when it is shown again.
+            if not self._released:
+                self.load_current_sheet(keep_position=True)
+            return
+
+        # The old sheet stays on screen until the job is done. It hands
+        # `previous` back if the sheet's part is unchanged and parses only
+        # the new rows if rows were appended.
+        if self._cache_key is not None:
+            self.app.sheet_cache.discard(self._cache_key)
+        try:
+            key = xlsx_data.sheet_key(self.path, sheet)
+        except OSError:
+            key = None
+        job = xlsx_data.SheetLoadJob(self.book, sheet, prepare=prepare_sheet, cache_key=key, previous=previous)
+        self._load_job = job
+        self._load_note = " (file changed, reloading…)"
+        job.start(self.app.loader_pool)
+        self._update_header()
+        self._schedule_poll(job)
+
+    def _set_loaded(self, loaded: xlsx_data.LoadedSheet):
+        self._load_note = ""
+        self.loaded = loaded
+        self.df = loaded.df
+        self.urls = loaded.urls
+        self._prefetch = xlsx_data.RowPrefetcher(self._row_fields, len(self.df), self.view)
+        loaded.build_search_async()
+        # Keep the row the user navigated to while the sheet streamed in.
+        self.row = min(self.row, max(0, len(self.df) - 1))
+        if self.filters:
+            self._apply_filters(self.filters)
+            return
+        self._update_filter_bar()
+        self.render_row()
+        self._on_search_changed(jump=False)
+
+    def _abort_load(self):
+        if self._load_job is not None:
+            self._load_job.cancel()
+            self._load_job = None
+        self._hide_load_progress()
+
+    def cancel_load(self):
+        if self._load_job is None:
+            return
+        self._abort_load()
+        self._load_note = " (loading cancelled, partial sheet)"
+        self._sync_stream()
+        self.render_row()
+
+    def _row_count(self) -> int:
+        if self.df is None:
+            return 0
+        return len(self.df) + self._stream_rows
+
+    def _sync_stream(self):
+        # Streamed chunks are only concatenated when a row from them is needed.
+        if self._stream_chunks:
+            self.df = pd.concat([self.df, *self._stream_chunks], ignore_index=True)
+            self._stream_chunks = []
+            self._stream_rows = 0
+
+    def _schedule_poll(self, job: xlsx_data.SheetLoadJob):
+        # One poll pending at a time, so close() can cancel it.
+        if self._poll_after is not None:
+            self.after_cancel(self._poll_after)
+        self._poll_after = self.after(LOAD_POLL_MS, self._poll_load, job)
+
+    def _poll_load(self, job: xlsx_data.SheetLoadJob):
+        self._poll_after = None
+        if job is not self._load_job:
+            return  # stale: a newer load replaced it or it was cancelled
+
+        while True:
+            try:
+                msg = job.messages.get_nowait()
+            except queue.Empty:
+                break
+
+            if msg[0] == "progress":
+                self._show_load_progress(msg[1], msg[2])
+                continue
+
+            if msg[0] == "rows":
+                self.app.timer.mark("first parse")
+                first = self._row_count() == 0
+                self._stream_chunks.append(msg[1])
+                self._stream_rows += len(msg[1])
+                if first and self._stream_rows:
+                    self.render_row()
+                continue
+
+            self._load_job = None
+            self._hide_load_progress()
+            self._stream_chunks = []
+            self._stream_rows = 0
+            if msg[0] == "done":
+                self.app.timer.mark("first parse")
+                if job.cache_key is not None:
+                    self.app.sheet_cache.put(job.cache_key, msg[1])
+                self._cache_key = job.cache_key
+                self._set_loaded(msg[1])
+                if not self.active:
+                    self._release()
+            elif job.previous is not None:
+                # A failed reload (often a file still being written) keeps
+                # the rows shown; the next change of the file tries again.
+                self._load_note = f" (reload failed: {msg[1]})"
+                self._update_header()
+            else:
+                messagebox.showerror("Error", f"Could not load sheet '{job.sheet_name}':\n{msg[1]}")
+                self.df = pd.DataFrame()
+                self.loaded = None
+                self.urls = None
+                self.view = None
+                self._prefetch = None
+                self.row = 0
+                self.render_row()
+            return
+
+        self._schedule_poll(job)
+
+    def prev_row(self):
+        target = xlsx_data.step_row(self.view, self._row_count(), self.row, -1)
+        if target is not None:
+            self._move_to(target)
+
+    def next_row(self):
+        target = xlsx_data.step_row(self.view, self._row_count(), self.row, 1)
+        if target is not None:
+            self._move_to(target)
+
+    def _move_to(self, row: int):
+        # Held arrow keys deliver events faster than a row renders: update the
+        # index and header now, and render only the latest row once Tk is idle.
+        self.row = row
+        self._update_header()
+        self._update_search_label()
+        if self._render_after is None:
+            self._render_after = self.after_idle(self.render_row)
+
+    def open_all_urls(self):
+        if self._row_count() == 0:
+            return
+        if self.urls is not None:
+            urls = [u for _j, u in self.urls.row_urls(self.row)]
+        else:
+            urls = [url for _caption, _text, url, _lines in self._row_fields(self.row) if url]
+        if not urls:
+            messagebox.showinfo("No URLs", "No URLs found in this row.")
+            return
+        self.open_urls(urls)
+
+    def open_urls_dialog(self):
+        if self.loaded is None or self.urls is None:
+            messagebox.showinfo("Open URLs", "URLs can be opened across rows once the sheet has finished loading.")
+            return
+        if not self.urls.masks:
+            messagebox.showinfo("No URLs", "No URLs found in this sheet.")
+            return
+        OpenUrlsDialog(self)
+
+    def open_urls(self, urls: list[str]):
+        """Open `urls` in the background, with progress under the header; replaces a batch still opening."""
+        if self._url_batch is not None:
+            self._url_batch.cancel()
+        self._url_batch = self.app.url_launcher.open(urls)
+        if len(self._url_batch.urls) > 1:
+            self.url_bar.configure(maximum=len(self._url_batch.urls), value=0)
+            if not self.url_status.winfo_ismapped():
+                self.url_status.pack(fill="x", after=self.header)
+            if self._url_after is None:
+                self._poll_urls()
+
+    def _poll_urls(self):
+        batch = self._url_batch
+        if batch.finished:
+            self._url_after = None
+            self.url_status.pack_forget()
+            if batch.failed:
+                messagebox.showwarning("Open URLs", f"{batch.failed:,} of the URLs could not be opened.")
+            return
+        self.url_bar.configure(value=batch.opened)
+        self.url_lbl.config(text=f"Opening URLs {batch.opened:,} / {len(batch.urls):,}")
+        self._url_after = self.after(LOAD_POLL_MS, self._poll_urls)
+
+    def cancel_urls(self):
+        if self._url_batch is not None:
+            self._url_batch.cancel()
+
+    def _slot(self, i: int) -> FieldSlot:
+        while len(self._slots) <= i:
+            self._slots.append(FieldSlot(self, self.scroll.inner))
+        return self._slots[i]
+
+    def _hide_slots_from(self, n: int):
+        for slot in self._slots[n:]:
+            slot.hide()
+
+    def _row_fields(self, row: int) -> list[tuple[str, str, str | None, int]]:
+        """(caption, shown text, URL, text lines) for every column of `row`."""
+        # Display strings come from the sheet's RowStore; only rows of a
+        # sheet still streaming in are formatted from the frame.
+        if self.loaded is not None:
+            labels = self.loaded.rows.labels
+            values = self.loaded.rows.row(row)
+        else:
+            labels = [str(c) for c in self.df.columns]
+            values = xlsx_data.frame_row(self.df, row)
+
+        fields = []
+        for j, (col, v) in enumerate(zip(labels, values)):
+            if v is None:
+                fields.append((f"{col}:", "(empty)", None, 1))
+                continue
+
+            s = v.strip()
+            url = self.urls.url(row, j) if self.urls is not None else cell_url(s)
+            content = url or s or "(empty)"
+            fields.append((f"{col}:", content, url, value_lines(content)))
+        return fields
+
+    def _cancel_prefetch(self):
+        if self._prefetch_after is not None:
+            self.after_cancel(self._prefetch_after)
+            self._prefetch_after = None
+
+    def _prefetch_step(self):
+        # One row per idle callback: pending key events are handled between
+        # them, so prefetching never delays the next row change.
+        self._prefetch_after = None
+        if self._prefetch is not None and self._prefetch.prefetch_one():
+            self._prefetch_after = self.after_idle(self._prefetch_step)
+
+    def _estimate_field_height(self, i: int) -> int:
+        app = self.app
+        _caption, _content, url, lines = self._fields[i]
+        h = app._label_px + lines * app._value_line_px + app._value_pad_px
+        if url:
+            h += app._button_px
+        return h
+
+    def _create_virtual_slot(self) -> tk.Widget:
+        slot = FieldSlot(self, self.scroll.canvas)
+        self._virtual_slots[slot.frame] = slot
+        return slot.frame
+
+    def _fill_virtual_slot(self, i: int, frame: tk.Widget):
+        self._virtual_slots[frame].fill(*self._fields[i])
+
+    def _update_header(self):
+        sheet = self.sheet_var.get()
+        if self._row_count() == 0:
+            if self._load_job is not None or self.book is None or self._released:
+                status = "Loading…"
+            elif self._load_note:
+                status = "Loading cancelled."
+            else:
+                status = "Empty or failed to load."
+            self.header.config(text=f"Sheet: {sheet} | {status}")
+            return
+
+        if self.view is not None:
+            pos = xlsx_data.view_position(self.view, self.row)
+            if pos is None:
+                self.header.config(text=f"Sheet: {sheet} | No rows match the filters.")
+                return
+            self.header.config(
+                text=(
+                    f"Sheet: {sheet} | Row {pos + 1}/{len(self.view)} "
+                    f"(sheet row {self.row + 1}/{len(self.df)}, filtered){self._load_note}"
+                )
+            )
+            return
+
+        total = "?" if self._load_job is not None and self.loaded is None else len(self.df)
+        self.header.config(text=f"Sheet: {sheet} | Row {self.row + 1}/{total}{self._load_note}")
+
+    def render_row(self):
+        if self._render_after is not None:
+            self.after_cancel(self._render_after)
+            self._render_after = None
+
+        if self.df is not None and self.row >= len(self.df):
+            self._sync_stream()
+        self._update_header()
+        if self.table_mode:
+            # The table reads the RowStore, so it fills once the sheet is loaded.
+            self.table.show(self.loaded.rows if self.loaded is not None else None, self.view, self.row)
+            return
+        if self._row_count() == 0 or (self.view is not None and len(self.view) == 0):
+            self._fields = []
+            self._hide_slots_from(0)
+            self.scroll.set_packed()
+            self.document.show([])
+            return
+
+        self.focused_url = None
+
+        if self._prefetch is not None:
+            self._fields = self._prefetch.get(self.row)
+            self._cancel_prefetch()
+            self._prefetch_after = self.after_idle(self._prefetch_step)
+        else:
+            self._fields = self._row_fields(self.row)
+
+        if self.app.single_text.get():
+            self._hide_slots_from(0)
+            self.scroll.set_packed()
+            self.document.show(self._fields)
+            self.app.mark_first_paint()
+            return
+
+        if len(self._fields) >= VIRTUAL_MIN_COLUMNS:
+            self._hide_slots_from(0)
+            self.scroll.set_virtual(
+                len(self._fields),
+                self._estimate_field_height,
+                self._create_virtual_slot,
+                self._fill_virtual_slot,
+            )
+            self.app.mark_first_paint()
+            return
+
+        self.scroll.set_packed()
+        for i, field in enumerate(self._fields):
+            self._slot(i).show(*field)
+        self._hide_slots_from(len(self._fields))
+        self.app.mark_first_paint()
 
 
 class App(tk.Tk):
-    def __init__(self, path: str):
+    def __init__(
+        self,
+        paths: list[str],
+        cache_mb: int = DEFAULT_CACHE_MB,
+        disk_cache_mb: int | None = None,
+        timer: StartupTimer | None = None,
+        single_text: bool = False,
+    ):
         enable_hidpi_awareness()
         super().__init__()
 
-        self.path = path
-        self.sheets = list_sheets(path)
-        if not self.sheets:
-            raise RuntimeError("No sheets found in this file.")
+        self.cache_mb = cache_mb
+        self.disk_cache_mb = disk_cache_mb
+        self.timer = timer or StartupTimer()
 
-        self.df = pd.DataFrame()
-        self.row = 0
-        self.focused_url: str | None = None
+        # Set up by _poll_imports() once the background import is done.
+        self.sheet_cache: xlsx_data.SheetCache | None = None
+        self.disk_cache: xlsx_cache.DiskCache | None = None
+        self.loader_pool: ThreadPoolExecutor | None = None
+        self.url_launcher: xlsx_data.UrlLauncher | None = None
+        self._import_error: BaseException | None = None
+
+        self.tabs: list[WorkbookTab] = []
+        self._active_tab: WorkbookTab | None = None
 
         self.title("Xlsx Row Viewer")
         self.geometry("1920x1080")
@@ -132,14 +1648,73 @@ class App(tk.Tk):
         self.value_menu = tk.Menu(self, tearoff=0)
         self.value_menu.add_command(label="Copy", command=self._copy_from_active_value)
         self._active_value_widget: tk.Text | None = None
+        # Copy menu of the single-text mode, which passes the text itself.
+        self.text_menu = tk.Menu(self, tearoff=0)
+        self.text_menu.add_command(label="Copy", command=lambda: self.copy_text(self._menu_text))
+        self._menu_text = ""
+        self.single_text = tk.BooleanVar(value=single_text)
 
         self._build_topbar()
-        self._build_header()
-        self._build_scroll_area()
-        self._build_controls()
+        self._build_notebook()
+        self._build_hint()
         self._bind_keys()
 
-        self.load_current_sheet()
+        # Sheet names come straight from the zip (stdlib only), so the tabs
+        # and sheet lists are shown before pandas and openpyxl are imported.
+        started = time.perf_counter()
+        for path in paths:
+            self.open_workbook(path)
+        self.timer.mark("sheet list", started)
+        if not self.tabs:
+            raise RuntimeError("No sheets found in the selected files.")
+
+        self.after_idle(self._window_shown)
+
+    def _window_shown(self):
+        self.timer.mark("window")
+        started = time.perf_counter()
+        done = threading.Event()
+
+        def worker():
+            try:
+                import_data_modules()
+            except BaseException as e:
+                self._import_error = e
+            finally:
+                done.set()
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.after(LOAD_POLL_MS, self._poll_imports, done, started)
+
+    def _poll_imports(self, done: threading.Event, started: float):
+        if not done.is_set():
+            self.after(LOAD_POLL_MS, self._poll_imports, done, started)
+            return
+        self.timer.mark("imports", started)
+        if self._import_error is not None:
+            messagebox.showerror("Error", f"Could not start:\n{self._import_error}")
+            self.destroy()
+            return
+
+        # One memory budget and one bounded loader pool for all tabs.
+        self.sheet_cache = xlsx_data.SheetCache(self.cache_mb * 1024 * 1024)
+        self.disk_cache = xlsx_cache.open_disk_cache(self.disk_cache_mb)
+        self.loader_pool = ThreadPoolExecutor(max_workers=LOAD_WORKERS, thread_name_prefix="sheet-loader")
+        self.url_launcher = xlsx_data.UrlLauncher()
+        # The visible tab is queued first.
+        for tab in sorted(self.tabs, key=lambda t: not t.active):
+            tab.start()
+
+    def open_url(self, url: str):
+        # On the launcher's thread: webbrowser.open can block for a while.
+        self.url_launcher.open_one(url)
+
+    def destroy(self):
+        for tab in self.tabs:
+            tab.close()
+        if self.loader_pool is not None:
+            self.loader_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
 
     def _apply_fonts(self, scale: float):
         base = tkfont.nametofont("TkDefaultFont")
@@ -163,131 +1738,136 @@ class App(tk.Tk):
         self.font_header = tkfont.Font(family=self.family, size=scaled(base_size + 5), weight="bold")
         self.font_value = tkfont.Font(family=self.family, size=scaled(base_size + 3), weight="normal")
 
+        # Pixel metrics used to estimate field heights in virtual mode
+        # (label pady 14+6, Text pady 8+8 plus border, button pady 10).
+        self._label_px = self.font_bold.metrics("linespace") + 20
+        self._value_line_px = self.font_value.metrics("linespace")
+        self._value_pad_px = 18
+        self._button_px = tkfont.nametofont("TkDefaultFont").metrics("linespace") + 22
+
     def _build_topbar(self):
-        top = ttk.Frame(self, padding=(16, 14))
+        top = ttk.Frame(self, padding=(16, 14, 16, 6))
         top.pack(fill="x")
 
-        ttk.Label(top, text="File:", font=self.font_bold).pack(side="left")
-        self.file_lbl = ttk.Label(top, text=self.path)
-        self.file_lbl.pack(side="left", padx=(10, 14), fill="x", expand=True)
-
-        ttk.Button(top, text="Change file…", command=self.change_file).pack(side="left", padx=(0, 14))
-
-        ttk.Label(top, text="Sheet:", font=self.font_bold).pack(side="left")
-        self.sheet_var = tk.StringVar(value=self.sheets[0])
-        self.sheet_combo = ttk.Combobox(
-            top, textvariable=self.sheet_var, values=self.sheets, state="readonly", width=34
-        )
-        self.sheet_combo.pack(side="left", padx=(10, 0))
-        self.sheet_combo.bind("<<ComboboxSelected>>", lambda e: self.on_sheet_change())
-
-    def _build_header(self):
-        self.header = ttk.Label(self, text="", font=self.font_header)
-        self.header.pack(fill="x", padx=16, pady=(0, 10), anchor="w")
-
-    def _build_scroll_area(self):
-        self.scroll = ScrollFrame(self)
-        self.scroll.pack(fill="both", expand=True, padx=16, pady=12)
-
-    def _build_controls(self):
-        controls = ttk.Frame(self, padding=(16, 0))
-        controls.pack(fill="x")
+        ttk.Button(top, text="Open workbook…", command=self.open_files).pack(side="left")
+        ttk.Button(top, text="Close tab", command=self.close_tab).pack(side="left", padx=(12, 0))
+        ttk.Checkbutton(
+            top, text="Single-text rows", variable=self.single_text, command=self._on_render_mode
+        ).pack(side="right")
 
-        ttk.Button(controls, text="◀ Prev", command=self.prev_row).pack(side="left")
-        ttk.Button(controls, text="Next ▶", command=self.next_row).pack(side="left", padx=(12, 0))
-        ttk.Button(controls, text="Open all URLs in row", command=self.open_all_urls).pack(side="right")
+    def _build_notebook(self):
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(fill="both", expand=True, padx=8)
+        self.notebook.enable_traversal()  # Ctrl+Tab / Ctrl+Shift+Tab
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self._on_tab_changed())
 
+    def _build_hint(self):
         hint = ttk.Label(
             self,
-            text="Keys: Left/Right changes row. Right-click any value to Copy. Ctrl+C also works after selecting text.",
+            text=(
+                "Keys: Left/Right changes row. Ctrl+F searches; Enter/F3 next match, Shift+Enter/Shift+F3 previous. "
+                "Ctrl+T toggles the table (double-click a row to open it). "
+                "Ctrl+O opens a workbook, Ctrl+W closes its tab, Ctrl+Tab switches tabs. "
+                "Right-click any value to Copy. Ctrl+C also works after selecting text."
+            ),
         )
-        hint.pack(fill="x", padx=16, pady=(10, 16), anchor="w")
+        hint.pack(fill="x", padx=16, pady=(6, 16), anchor="w")
 
     def _bind_keys(self):
-        self.bind("<Left>", lambda e: self.prev_row())
-        self.bind("<Right>", lambda e: self.next_row())
-        self.bind("<Return>", lambda e: self.open_focused_url())
-
-    def set_focus_url(self, url: str):
-        self.focused_url = url
-
-    def open_focused_url(self):
-        if self.focused_url:
-            webbrowser.open(self.focused_url, new=2)
-
-    def change_file(self):
-        root = tk.Tk()
-        root.withdraw()
-        new_path = pick_file()
-        root.destroy()
-        if not new_path:
+        self.bind("<Left>", lambda e: self._nav_key(e, WorkbookTab.prev_row))
+        self.bind("<Right>", lambda e: self._nav_key(e, WorkbookTab.next_row))
+        self.bind("<Return>", lambda e: self._on_tab(WorkbookTab.open_focused_url))
+        self.bind("<Control-f>", lambda e: self._on_tab(WorkbookTab._focus_search))
+        self.bind("<F3>", lambda e: self._on_tab(WorkbookTab.next_hit))
+        self.bind("<Shift-F3>", lambda e: self._on_tab(WorkbookTab.prev_hit))
+        self.bind("<Control-o>", lambda e: self.open_files())
+        self.bind("<Control-w>", lambda e: self.close_tab())
+        self.bind("<Control-t>", lambda e: self._on_tab(WorkbookTab.toggle_table))
+        # Every tab has its own row view; the wheel scrolls the visible one.
+        self.bind_all("<MouseWheel>", lambda e: self._on_tab(lambda t: t.scroll_wheel(e)))
+        self.bind_all("<Button-4>", lambda e: self._on_tab(lambda t: t.scroll_wheel(e)))
+        self.bind_all("<Button-5>", lambda e: self._on_tab(lambda t: t.scroll_wheel(e)))
+
+    def _on_render_mode(self):
+        for tab in self.tabs:
+            tab.pack_row_view()
+            tab.render_row()
+
+    def _on_tab(self, action):
+        if self._active_tab is not None:
+            action(self._active_tab)
+
+    def _nav_key(self, event, action):
+        # Arrow keys move the cursor inside text fields, not the row.
+        if isinstance(event.widget, (tk.Entry, ttk.Entry)):
             return
+        self._on_tab(action)
 
-        self.path = new_path
-        self.file_lbl.config(text=self.path)
+    def _on_tab_changed(self):
+        selected = self.notebook.select()
+        tab = self.nametowidget(selected) if selected else None
+        if tab is self._active_tab:
+            return
+        if self._active_tab is not None:
+            self._active_tab.deactivate()
+        self._active_tab = tab
+        if tab is not None:
+            self.title(f"Xlsx Row Viewer - {os.path.basename(tab.path)}")
+            tab.activate()
+
+    def open_files(self):
+        for path in pick_files():
+            self.open_workbook(path)
+
+    def open_workbook(self, path: str):
+        """Show `path` in a tab: the existing one if the file is already open, else a new one."""
+        for tab in self.tabs:
+            if os.path.normcase(os.path.abspath(tab.path)) == os.path.normcase(os.path.abspath(path)):
+                self.notebook.select(tab)
+                return
 
         try:
-            self.sheets = list_sheets(self.path)
+            sheet_info = read_sheet_info(path)
         except Exception as e:
-            messagebox.showerror("Error", f"Could not read sheets:\n{e}")
+            messagebox.showerror("Error", f"Could not read sheets of {path}:\n{e}")
             return
-
-        if not self.sheets:
-            messagebox.showinfo("No sheets", "No sheets found in that file.")
+        if not sheet_info:
+            messagebox.showinfo("No sheets", f"No sheets found in {path}.")
             return
 
-        self.sheet_combo["values"] = self.sheets
-        self.sheet_var.set(self.sheets[0])
-        self.load_current_sheet()
-
-    def on_sheet_change(self):
-        self.load_current_sheet()
-
-    def load_current_sheet(self):
-        sheet = self.sheet_var.get()
-        try:
-            self.df = load_sheet(self.path, sheet).reset_index(drop=True)
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not load sheet '{sheet}':\n{e}")
-            self.df = pd.DataFrame()
-
-        self.row = 0
-        self.focused_url = None
-        self.render_row()
-
-    def prev_row(self):
-        if len(self.df) == 0:
-            return
-        if self.row > 0:
-            self.row -= 1
-            self.render_row()
+        tab = WorkbookTab(self, path, sheet_info)
+        self.tabs.append(tab)
+        self.notebook.add(tab, text=os.path.basename(path))
+        self.notebook.select(tab)
+        if self.sheet_cache is not None:
+            tab.start()
 
-    def next_row(self):
-        if len(self.df) == 0:
+    def close_tab(self):
+        tab = self._active_tab
+        if tab is None:
             return
-        if self.row < len(self.df) - 1:
-            self.row += 1
-            self.render_row()
+        # Its parsed sheets stay in the SheetCache, so reopening is instant.
+        tab.close()
+        self.tabs.remove(tab)
+        self._active_tab = None
+        self.notebook.forget(tab)
+        tab.destroy()
+        if not self.tabs:
+            self.title("Xlsx Row Viewer")
+
+    def mark_first_paint(self):
+        # Idle callbacks run in order, so this one runs after Tk redraws the
+        # widgets just filled.
+        if self.timer.enabled:
+            self.after_idle(self.timer.mark, "first paint")
+
+    def copy_text(self, text: str):
+        self.clipboard_clear()
+        self.clipboard_append(text)
 
-    def open_all_urls(self):
-        if len(self.df) == 0:
-            return
-        urls = []
-        r = self.df.iloc[self.row]
-        for col in self.df.columns:
-            v = r[col]
-            if pd.isna(v):
-                continue
-            s = str(v).strip()
-            if s.startswith("www."):
-                s = "https://" + s
-            if s.lower().startswith("http://") or s.lower().startswith("https://"):
-                urls.append(s)
-        if not urls:
-            messagebox.showinfo("No URLs", "No URLs found in this row.")
-            return
-        for u in urls:
-            webbrowser.open(u, new=2)
+    def show_copy_menu(self, text: str, event):
+        self._menu_text = text
+        self.text_menu.tk_popup(event.x_root, event.y_root)
 
     def _copy_from_active_value(self):
         w = self._active_value_widget
@@ -297,8 +1877,7 @@ class App(tk.Tk):
             txt = w.selection_get()
         except Exception:
             txt = w.get("1.0", "end-1c")
-        self.clipboard_clear()
-        self.clipboard_append(txt)
+        self.copy_text(txt)
 
     def _show_value_menu(self, widget: tk.Text, event):
         self._active_value_widget = widget
@@ -308,7 +1887,7 @@ class App(tk.Tk):
             pass
         self.value_menu.tk_popup(event.x_root, event.y_root)
 
-    def _add_selectable_value(self, parent, text: str):
+    def _make_value_text(self, parent) -> tk.Text:
         txt = tk.Text(
             parent,
             wrap="word",
@@ -318,15 +1897,8 @@ class App(tk.Tk):
             padx=10,
             pady=8,
             font=self.font_value,
+            height=1,
         )
-        content = text if (text is not None and text != "") else "(empty)"
-        txt.insert("1.0", content)
-
-        lines = max(1, content.count("\n") + 1)
-        if len(content) > 160:
-            lines = max(lines, 3)
-        txt.configure(height=lines)
-
         txt.configure(state="disabled")
 
         def enable(_e=None):
@@ -351,70 +1923,48 @@ class App(tk.Tk):
 
         txt.bind("<Button-3>", lambda e, w=txt: self._show_value_menu(w, e))
         txt.bind("<Button-2>", lambda e, w=txt: self._show_value_menu(w, e))
-
-        txt.pack(anchor="w", fill="x", expand=True)
         return txt
 
-    def render_row(self):
-        for w in self.scroll.inner.winfo_children():
-            w.destroy()
-
-        sheet = self.sheet_var.get()
-        if len(self.df) == 0:
-            self.header.config(text=f"Sheet: {sheet} | Empty or failed to load.")
-            return
-
-        self.header.config(text=f"Sheet: {sheet} | Row {self.row + 1}/{len(self.df)}")
-        self.focused_url = None
-
-        r = self.df.iloc[self.row]
-
-        for col in self.df.columns:
-            ttk.Label(self.scroll.inner, text=f"{col}:", font=self.font_bold).pack(anchor="w", pady=(14, 6))
-
-            v = r[col]
-            if pd.isna(v):
-                self._add_selectable_value(self.scroll.inner, "(empty)")
-                continue
-
-            s = str(v).strip()
-            url = None
-            if s.startswith("www."):
-                url = "https://" + s
-            elif s.lower().startswith("http://") or s.lower().startswith("https://"):
-                url = s
-
-            if url:
-                block = ttk.Frame(self.scroll.inner)
-                block.pack(fill="x", anchor="w")
-
-                self._add_selectable_value(block, url)
-
-                btn = ttk.Button(block, text="Open URL", command=lambda u=url: webbrowser.open(u, new=2))
-                btn.pack(anchor="w", pady=(10, 0))
-
-                btn.bind("<Enter>", lambda e, u=url: self.set_focus_url(u))
-                btn.bind("<FocusIn>", lambda e, u=url: self.set_focus_url(u))
-            else:
-                self._add_selectable_value(self.scroll.inner, s)
-
 
 def main():
     ap = argparse.ArgumentParser()
-    ap.add_argument("xlsx", nargs="?", default=None, help="Path to .xlsx (optional; opens picker if omitted)")
+    ap.add_argument(
+        "xlsx", nargs="*",
+        help="Paths to .xlsx files, each opened in its own tab (optional; opens picker if omitted)",
+    )
+    ap.add_argument(
+        "--cache-mb", type=int, default=DEFAULT_CACHE_MB,
+        help=f"Memory budget for parsed sheets kept for quick sheet and tab switching (default: {DEFAULT_CACHE_MB})",
+    )
+    ap.add_argument(
+        "--disk-cache-mb", type=int, default=None,
+        help="Size cap of the on-disk cache of parsed sheets, 0 disables it (default: 1024)",
+    )
+    ap.add_argument(
+        "--single-text", action="store_true",
+        help="Render each row as one text document instead of a widget per column (also a checkbox in the window)",
+    )
+    ap.add_argument(
+        "--timings", action="store_true",
+        help="Print startup phase times (window, sheet list, imports, first parse, first paint) to stderr, "
+        f"or without a console to {TIMINGS_LOG} in the temp directory",
+    )
     args = ap.parse_args()
+    timer = StartupTimer(enabled=args.timings)
 
-    path = args.xlsx
-    if not path:
+    paths = args.xlsx
+    if not paths:
         root = tk.Tk()
         root.withdraw()
-        path = pick_file()
+        paths = pick_files()
         root.destroy()
-        if not path:
+        if not paths:
             return
 
     try:
-        app = App(path)
+        app = App(
+            paths, cache_mb=args.cache_mb, disk_cache_mb=args.disk_cache_mb, timer=timer, single_text=args.single_text
+        )
         app.mainloop()
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
@@ -422,4 +1972,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()